@@ -0,0 +1,150 @@
+# encoding: utf-8
+"""
+Flattened records benchmark.
+
+Compares raw records (parsed JSON) with records flattened by
+xylose.flat.flatten over the synthetic corpus (benchmarks/synthetic.py):
+
+- memory: bytes per record (tracemalloc) of the raw and the flattened records,
+  and of the flattened records after an export, when the raw reads of the
+  accessors not in the schema have rebuilt their tags;
+- accessors: microseconds per call of schema accessors (read by the flat
+  extractors) and other accessors (read through the raw view), on warm
+  Article and FlatArticle objects;
+- export: microseconds per record of xylose.extraction.Exporter over fresh
+  Article and FlatArticle objects of the corpus.
+
+Usage:
+    python benchmarks/flat.py [--count N] [--seed S] [--output results.json]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from xylose import flat  # noqa
+from xylose.extraction import Exporter  # noqa
+from xylose.scielodocument import Article, FlatArticle  # noqa
+
+import synthetic  # noqa
+
+SCHEMA_ACCESSORS = ['publisher_id', 'start_page', 'publication_date', 'doi', 'volume']
+OTHER_ACCESSORS = ['authors', 'keywords', 'original_title']
+
+
+def allocated(build):
+    """
+    Retrieve a tuple of (bytes held by the result of build, result).
+    """
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+
+    return tracemalloc.get_traced_memory()[0] - before, result
+
+
+def memory(lines):
+    results = {}
+
+    tracemalloc.start()
+    try:
+        size, raws = allocated(lambda: [json.loads(line) for line in lines])
+        results['raw_record'] = size / float(len(raws))
+
+        size, flats = allocated(lambda: [flat.flatten(json.loads(line)) for line in lines])
+        results['flat_record'] = size / float(len(flats))
+
+        exporter = Exporter()
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        for data in flats:
+            exporter.export(FlatArticle(data))
+        gc.collect()
+        results['flat_record_after_export'] = results['flat_record'] + (
+            tracemalloc.get_traced_memory()[0] - before) / float(len(flats))
+    finally:
+        tracemalloc.stop()
+
+    return results
+
+
+def _call(document, name):
+    value = getattr(document, name)
+
+    return value if not callable(value) else value()
+
+
+def accessors(data, number):
+    """
+    Retrieve a dict of accessor: (raw, flat) microseconds per call.
+    """
+    raw = Article(data)
+    flattened = FlatArticle(flat.flatten(json.loads(json.dumps(data))))
+    results = {}
+
+    for name in SCHEMA_ACCESSORS + OTHER_ACCESSORS:
+        timings = []
+        for document in (raw, flattened):
+            _call(document, name)
+            seconds = min(timeit.repeat(lambda: _call(document, name), number=number, repeat=3))
+            timings.append(seconds * 1e6 / number)
+        results[name] = timings
+
+    return results
+
+
+def export(lines):
+    """
+    Retrieve a tuple of (raw, flat) microseconds per exported record.
+    """
+    timings = []
+    for build in (lambda line: Article(json.loads(line)),
+                  lambda line: FlatArticle(flat.flatten(json.loads(line)))):
+        articles = [build(line) for line in lines]
+        exporter = Exporter()
+        started = timeit.default_timer()
+        for article in articles:
+            exporter.export(article)
+        timings.append((timeit.default_timer() - started) * 1e6 / len(articles))
+
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='xylose flattened records benchmark')
+    parser.add_argument('--count', type=int, default=500, help='synthetic documents')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--number', type=int, default=20000, help='calls per accessor timing')
+    parser.add_argument('--output', default=None, help='write the results to this path')
+    args = parser.parse_args(argv)
+
+    lines = [json.dumps(record) for record in synthetic.generate(args.count, args.seed)]
+
+    results = {
+        'python': sys.version.split()[0],
+        'count': args.count,
+        'seed': args.seed,
+        'memory': memory(lines),
+        'memory_unit': 'bytes per record',
+        'accessors': accessors(synthetic.fixture(), args.number),
+        'export': export(lines),
+        'time_unit': 'microseconds per call (raw, flat)'
+    }
+
+    content = json.dumps(results, indent=2, sort_keys=True)
+    print(content)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            output.write(content)
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+# encoding: utf-8
+"""
+Import time benchmark.
+
+Measures the time to import the given module (xylose.scielodocument by default)
+inside fresh interpreters and checks it against an optional budget. It also
+checks that the lazy loaded modules (see LAZY_MODULES) are not imported.
+
+Usage:
+    python benchmarks/import_time.py [--module MODULE] [--runs N] [--budget MS]
+
+Exits with status 1 when the median import time exceeds the budget or some
+lazy module was loaded by the import.
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+MEASURE = (
+    "import time; start = time.time(); import {module}; "
+    "print(time.time() - start)"
+)
+
+LAZY_MODULES = ['html', 'xylose._iso639', 'xylose._iso3166']
+
+CHECK_LAZY = (
+    "import sys, json; import {module}; "
+    "print(json.dumps([m for m in {lazy!r} if m in sys.modules]))"
+)
+
+
+def _run(code):
+    return subprocess.check_output([sys.executable, '-c', code]).decode('utf-8').strip()
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+
+    if len(values) % 2:
+        return values[middle]
+
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def measure(module, runs):
+    """
+    Retrieve the import times (in milliseconds) of the given module, one for
+    each fresh interpreter.
+    """
+    return [float(_run(MEASURE.format(module=module))) * 1000 for i in range(runs)]
+
+
+def eagerly_loaded(module):
+    """
+    Retrieve the lazy modules (see LAZY_MODULES) loaded by importing the given
+    module.
+    """
+    return json.loads(_run(CHECK_LAZY.format(module=module, lazy=LAZY_MODULES)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='xylose import time benchmark')
+    parser.add_argument('--module', default='xylose.scielodocument')
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--budget', type=float, default=None,
+                        help='maximum median import time in milliseconds')
+    args = parser.parse_args(argv)
+
+    timings = measure(args.module, args.runs)
+    loaded = eagerly_loaded(args.module)
+
+    result = {
+        'module': args.module,
+        'python': sys.version.split()[0],
+        'runs': args.runs,
+        'median_ms': round(median(timings), 3),
+        'min_ms': round(min(timings), 3),
+        'max_ms': round(max(timings), 3),
+        'eagerly_loaded': loaded
+    }
+    print(json.dumps(result, indent=2, sort_keys=True))
+
+    if loaded:
+        return 1
+
+    if args.budget is not None and result['median_ms'] > args.budget:
+        return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,135 @@
+# encoding: utf-8
+"""
+Memory footprint benchmark.
+
+Uses tracemalloc to measure the bytes allocated per document for the raw
+record (parsed JSON) and for each xylose representation: Article, Journal,
+Citation (specialized by create_citation) and the extracted record
+(xylose.extraction.Exporter), over the synthetic corpus (benchmarks/synthetic.py)
+and the tests fixture.
+
+Usage:
+    python benchmarks/memory.py [--count N] [--seed S] [--output results.json]
+                                [--compare previous.json]
+
+The results are JSON, --compare prints the relative change of each measure
+against a previous results file, so memory regressions are visible across
+versions.
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from xylose.extraction import Exporter  # noqa
+from xylose.scielodocument import Article, Journal, create_citation  # noqa
+
+import synthetic  # noqa
+
+
+def allocated(build):
+    """
+    Retrieve a tuple of (bytes held by the result of build, result).
+    """
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+
+    return tracemalloc.get_traced_memory()[0] - before, result
+
+
+def measure(lines):
+    """
+    Measure the bytes per document of each representation for the given
+    serialized records.
+    """
+    results = {}
+
+    size, raws = allocated(lambda: [json.loads(line) for line in lines])
+    results['raw_record'] = size / float(len(raws))
+
+    citations = sum(len(raw.get('citations') or []) for raw in raws)
+
+    size, articles = allocated(lambda: [Article(raw) for raw in raws])
+    results['article'] = size / float(len(articles))
+
+    size, journals = allocated(lambda: [Journal(raw['title']) for raw in raws])
+    results['journal'] = size / float(len(journals))
+
+    size, objects = allocated(
+        lambda: [create_citation(c) for raw in raws for c in raw.get('citations') or []])
+    results['citation'] = size / float(citations) if citations else None
+
+    size, materialized = allocated(
+        lambda: [(article.journal, article.citations) for article in articles])
+    results['article_materialized'] = results['article'] + size / float(len(articles))
+
+    exporter = Exporter()
+    size, records = allocated(lambda: [exporter.export(article) for article in articles])
+    results['extracted_record'] = size / float(len(records))
+
+    results['serialized'] = sum(len(line) for line in lines) / float(len(lines))
+    results['documents'] = len(lines)
+    results['citations'] = citations
+
+    return results
+
+
+def compare(current, previous):
+    lines = []
+    for corpus in sorted(current['corpora']):
+        for name, value in sorted(current['corpora'][corpus].items()):
+            old = previous.get('corpora', {}).get(corpus, {}).get(name)
+            if not old or value is None or name in ('documents', 'citations'):
+                continue
+            lines.append('%-10s %-22s %12.1f %12.1f %+7.1f%%' % (
+                corpus, name, old, value, (value - old) * 100.0 / old))
+
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='xylose memory footprint benchmark')
+    parser.add_argument('--count', type=int, default=500, help='synthetic documents')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help='write the results to this path')
+    parser.add_argument('--compare', default=None, help='previous results to compare with')
+    args = parser.parse_args(argv)
+
+    corpora = {
+        'synthetic': [json.dumps(record) for record in synthetic.generate(args.count, args.seed)],
+        'fixture': [json.dumps(synthetic.fixture())]
+    }
+
+    tracemalloc.start()
+    try:
+        results = {
+            'python': sys.version.split()[0],
+            'count': args.count,
+            'seed': args.seed,
+            'unit': 'bytes per document',
+            'corpora': dict((name, measure(lines)) for name, lines in corpora.items())
+        }
+    finally:
+        tracemalloc.stop()
+
+    content = json.dumps(results, indent=2, sort_keys=True)
+    print(content)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            output.write(content)
+
+    if args.compare:
+        with open(args.compare) as source:
+            print(compare(results, json.load(source)))
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
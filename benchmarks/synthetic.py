@@ -0,0 +1,76 @@
+# encoding: utf-8
+"""
+Synthetic corpus of ISIS2JSON article records.
+
+The records are derived from the tests fixture (tests/fixtures/full_document.json)
+with deterministic variations of identifiers, titles, authors, dates and
+citations, so results are comparable across runs and versions.
+"""
+import copy
+import json
+import os
+import random
+
+FIXTURE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.realpath(__file__))),
+    'tests', 'fixtures', 'full_document.json'
+)
+
+COLLECTIONS = ['scl', 'arg', 'col', 'mex', 'spa', 'chl', 'prt', 'ven']
+LANGUAGES = ['pt', 'en', 'es']
+WORDS = (
+    u'analysis study effect water species health patients evaluation brazil '
+    u'growth model clinical quality population soil treatment risk factors '
+    u'children river basin diversity protein cells acute public education'
+).split()
+
+
+def fixture():
+    with open(FIXTURE) as source:
+        return json.load(source)
+
+
+def _words(rng, count):
+    return u' '.join(rng.choice(WORDS) for i in range(count))
+
+
+def generate(count, seed=0, citations=20):
+    """
+    Yield count synthetic article records with the given number of citations
+    each.
+    """
+    rng = random.Random(seed)
+    base = fixture()
+    base_citations = base.pop('citations')
+
+    for number in range(count):
+        record = copy.deepcopy(base)
+        article = record['article']
+        year = 1990 + rng.randint(0, 30)
+        pid = u'S%04d-%04d%d%08d' % (rng.randint(0, 9999), rng.randint(0, 9999), year, number)
+
+        record['collection'] = rng.choice(COLLECTIONS)
+        article['v880'] = [{u'_': pid[:23]}]
+        article['v65'] = [{u'_': u'%d%02d00' % (year, rng.randint(1, 12))}]
+        article['v12'] = [
+            {u'l': language, u'_': _words(rng, rng.randint(6, 16))}
+            for language in rng.sample(LANGUAGES, rng.randint(1, 3))
+        ]
+        article['v40'] = [{u'_': article['v12'][0][u'l']}]
+        article['v10'] = [
+            {u's': _words(rng, 1).title(), u'n': _words(rng, 2).title(), u'r': u'ND'}
+            for i in range(rng.randint(1, 8))
+        ]
+        article['v85'] = [
+            {u'k': _words(rng, 2), u'l': rng.choice(LANGUAGES)}
+            for i in range(rng.randint(0, 10))
+        ]
+
+        record['citations'] = []
+        for index in range(citations):
+            citation = copy.deepcopy(base_citations[index % len(base_citations)])
+            citation['v701'] = [{u'_': u'%d' % (index + 1)}]
+            citation['v880'] = [{u'_': pid[:23] + u'%05d' % (index + 1)}]
+            record['citations'].append(citation)
+
+        yield record
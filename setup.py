@@ -14,6 +14,11 @@ setup(
     license="BSD 2-clause",
     url="http://docs.scielo.org",
     packages=['xylose'],
+    entry_points={
+        'console_scripts': [
+            'xylose = xylose.cli:main',
+        ],
+    },
     classifiers=[
         "Development Status :: 1 - Planning",
         "Intended Audience :: Customer Service",
@@ -0,0 +1,97 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+
+from xylose import arrays
+from xylose.scielodocument import Article
+
+
+class ValuesTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+
+    def test_values(self):
+        article = Article(self.fulldoc)
+
+        year, month, citations, authors, page_span, document_type, collection = arrays.values(article)
+
+        self.assertEqual(year, 2011)
+        self.assertEqual(month, 9)
+        self.assertEqual(citations, 18)
+        self.assertEqual(authors, len(article.authors))
+        self.assertEqual(
+            page_span, int(article.end_page) - int(article.start_page) + 1)
+        self.assertEqual(
+            arrays.CODEBOOKS['document_type'][document_type], article.document_type)
+        self.assertEqual(arrays.CODEBOOKS['collection'][collection], u'scl')
+
+    def test_missing_values(self):
+        del(self.fulldoc['article']['v65'])
+        del(self.fulldoc['article']['v14'])
+        del(self.fulldoc['article']['v10'])
+        del(self.fulldoc['citations'])
+        self.fulldoc['collection'] = u'xxx'
+
+        values = arrays.values(Article(self.fulldoc))
+
+        self.assertEqual(values[0:5], (-1, 0, 0, 0, -1))
+        self.assertEqual(values[6], -1)
+
+
+@unittest.skipIf(arrays.numpy is None, 'numpy not available')
+class ArrayExporterTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+
+    def test_export_arrays_grows_buffers(self):
+        articles = [Article(self.fulldoc) for i in range(5)]
+
+        exported, codebooks = arrays.export_arrays(articles, capacity=2)
+
+        self.assertEqual(sorted(exported.keys()), sorted(name for name, dtype in arrays.DTYPES))
+        self.assertEqual(len(exported['year']), 5)
+        self.assertEqual(list(exported['year']), [2011] * 5)
+        self.assertEqual(codebooks, arrays.CODEBOOKS)
+
+    def test_dtypes(self):
+        exporter = arrays.ArrayExporter()
+        exporter.add(Article(self.fulldoc))
+
+        exported = exporter.arrays()
+
+        for name, dtype in arrays.DTYPES:
+            self.assertEqual(exported[name].dtype.name, dtype)
+
+    def test_export_arrays_trimmed(self):
+        articles = [Article(self.fulldoc) for i in range(3)]
+
+        exported, codebooks = arrays.export_arrays(articles, capacity=2)
+
+        for name, dtype in arrays.DTYPES:
+            self.assertEqual(exported[name].shape, (3,))
+            self.assertTrue(exported[name].base is None)
+
+    def test_arrays_are_not_changed_by_later_articles(self):
+        exporter = arrays.ArrayExporter(capacity=1)
+        exporter.add(Article(self.fulldoc))
+
+        exported = exporter.arrays()
+        self.fulldoc['article']['v65'] = [{u'_': u'19990100'}]
+        exporter.extend([Article(self.fulldoc), Article(self.fulldoc)])
+
+        self.assertEqual(list(exported['year']), [2011])
+        self.assertEqual(list(exporter.arrays()['year']), [2011, 1999, 1999])
+
+    def test_trim(self):
+        exporter = arrays.ArrayExporter(capacity=8)
+        exporter.add(Article(self.fulldoc))
+        exporter.trim()
+        exporter.add(Article(self.fulldoc))
+
+        self.assertEqual(list(exporter.arrays()['year']), [2011, 2011])
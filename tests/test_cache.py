@@ -0,0 +1,161 @@
+# coding: utf-8
+
+import unittest
+import threading
+import json
+import os
+
+from xylose.cache import ArticleCache
+from xylose.scielodocument import Article
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ArticleCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.pid = self.fulldoc['article']['v880'][0]['_']
+        self.loaded = []
+
+    def _record(self, pid):
+        data = json.loads(json.dumps(self.fulldoc))
+        data['article']['v880'] = [{u'_': pid}]
+
+        return data
+
+    def _loader(self, pid):
+        self.loaded.append(pid)
+
+        return self._record(pid)
+
+    def test_get_loads_once(self):
+        cache = ArticleCache(loader=self._loader)
+
+        article = cache.get(self.pid)
+
+        self.assertTrue(isinstance(article, Article))
+        self.assertTrue(cache.get(self.pid) is article)
+        self.assertEqual(self.loaded, [self.pid])
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+        self.assertEqual(cache.stats()['hit_ratio'], 0.5)
+
+    def test_cached_articles_keep_citations(self):
+        cache = ArticleCache(loader=self._loader)
+
+        citations = cache.get(self.pid).citations
+
+        self.assertTrue(cache.get(self.pid).citations is citations)
+
+    def test_get_without_loader(self):
+        cache = ArticleCache()
+
+        self.assertEqual(cache.get(self.pid), None)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_get_loader_not_found(self):
+        cache = ArticleCache(loader=lambda pid: None)
+
+        self.assertEqual(cache.get(self.pid), None)
+        self.assertFalse(self.pid in cache)
+
+    def test_get_with_loader_argument(self):
+        cache = ArticleCache()
+
+        article = cache.get(self.pid, loader=self._loader)
+
+        self.assertEqual(article.publisher_id, self.pid)
+        self.assertTrue(self.pid in cache)
+
+    def test_loader_returning_article(self):
+        article = Article(self._record(self.pid))
+        cache = ArticleCache(loader=lambda pid: article)
+
+        self.assertTrue(cache.get(self.pid) is article)
+
+    def test_iso_format(self):
+        cache = ArticleCache(loader=self._loader, iso_format='iso 639-2')
+
+        self.assertEqual(cache.get(self.pid).original_language(), u'eng')
+
+    def test_put(self):
+        cache = ArticleCache()
+
+        article = cache.put(self._record(self.pid))
+
+        self.assertTrue(cache.get(self.pid) is article)
+
+    def test_lru_eviction(self):
+        cache = ArticleCache(max_size=2, loader=self._loader)
+
+        cache.get(u'A')
+        cache.get(u'B')
+        cache.get(u'A')
+        cache.get(u'C')
+
+        self.assertTrue(u'A' in cache)
+        self.assertFalse(u'B' in cache)
+        self.assertTrue(u'C' in cache)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_ttl(self):
+        clock = Clock()
+        cache = ArticleCache(ttl=10, loader=self._loader, clock=clock)
+
+        cache.get(self.pid)
+        clock.now = 9
+        cache.get(self.pid)
+        clock.now = 10
+        cache.get(self.pid)
+
+        self.assertEqual(self.loaded, [self.pid, self.pid])
+        self.assertEqual(cache.stats()['expirations'], 1)
+
+    def test_invalidate(self):
+        cache = ArticleCache(loader=self._loader)
+        cache.get(self.pid)
+
+        self.assertTrue(cache.invalidate(self.pid))
+        self.assertFalse(cache.invalidate(self.pid))
+        self.assertEqual(len(cache), 0)
+
+    def test_clear_and_reset(self):
+        cache = ArticleCache(loader=self._loader)
+        cache.get(self.pid)
+        cache.clear()
+        cache.reset()
+
+        self.assertEqual(cache.stats()['size'], 0)
+        self.assertEqual(cache.stats()['misses'], 0)
+
+    def test_invalid_max_size(self):
+
+        self.assertRaises(ValueError, ArticleCache, max_size=0)
+
+    def test_threads(self):
+        cache = ArticleCache(max_size=5, loader=self._loader)
+        pids = [u'S%04d' % (i % 10) for i in range(200)]
+
+        def work():
+            for pid in pids:
+                self.assertEqual(cache.get(pid).publisher_id, pid)
+
+        threads = [threading.Thread(target=work) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        self.assertEqual(stats['hits'] + stats['misses'], 800)
+        self.assertTrue(stats['size'] <= 5)
@@ -0,0 +1,38 @@
+# coding: utf-8
+
+import unittest
+import json
+import subprocess
+import sys
+
+from xylose import choices
+
+
+class ChoicesTests(unittest.TestCase):
+
+    def test_lazy_tables(self):
+
+        self.assertEqual(choices.ISO639_1_to_2['pt'], 'por')
+        self.assertTrue('pt' in choices.ISO639_1)
+        self.assertEqual(choices.ISO_3166['BR'], u'Brazil')
+
+    def test_dir_lists_lazy_tables(self):
+
+        self.assertTrue('ISO_3166' in dir(choices))
+
+    def test_unknown_attribute(self):
+
+        with self.assertRaises(AttributeError):
+            choices.xxx
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'lazy tables requires python 3.7+')
+    def test_import_does_not_load_lazy_modules(self):
+        code = (
+            "import sys, json; import xylose.scielodocument; "
+            "print(json.dumps([m for m in ('html', 'xylose._iso639', 'xylose._iso3166') "
+            "if m in sys.modules]))"
+        )
+
+        loaded = subprocess.check_output([sys.executable, '-c', code])
+
+        self.assertEqual(json.loads(loaded.decode('utf-8')), [])
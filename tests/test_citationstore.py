@@ -0,0 +1,90 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+
+from xylose import citationstore
+from xylose.scielodocument import Article, Citation, create_citation
+
+
+class CitationStoreTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.store = citationstore.CitationStore.build([Article(self.fulldoc), self.fulldoc])
+
+    def test_len(self):
+
+        self.assertEqual(len(self.store), 36)
+
+    def test_raw(self):
+
+        self.assertEqual(self.store.raw(0), self.fulldoc['citations'][0])
+        self.assertEqual(self.store.raw(35), self.fulldoc['citations'][17])
+
+    def test_string_interning(self):
+        once = citationstore.CitationStore.build([self.fulldoc])
+
+        self.assertEqual(len(self.store.strings), len(once.strings))
+        self.assertEqual(len(self.store.values), 2 * len(once.values))
+
+    def test_large_string_table(self):
+        store = citationstore.CitationStore()
+        for i in range(70000):
+            store.add({u'v30': [{u'_': u'Journal %d' % i}]})
+        index = store.add({u'v999': [{u'_': u'value', u'x': u'Journal 1'}]})
+
+        self.assertTrue(len(store.strings) > 65535)
+        self.assertEqual(store.raw(index), {u'v999': [{u'_': u'value', u'x': u'Journal 1'}]})
+        self.assertEqual(store.raw(69999), {u'v30': [{u'_': u'Journal 69999'}]})
+        self.assertEqual(store.find('v30', u'Journal 69999'), [69999])
+
+    def test_view(self):
+        view = self.store.view(2)
+        raw = self.fulldoc['citations'][2]
+
+        self.assertEqual(len(view), len(raw))
+        self.assertEqual(sorted(view), sorted(raw))
+        self.assertEqual(dict(view), raw)
+        self.assertTrue('v30' in view)
+        self.assertFalse('v999' in view)
+        self.assertRaises(KeyError, lambda: view['v999'])
+        self.assertEqual(view.get('v999'), None)
+
+    def test_citation_view(self):
+        citation = self.store.citation(2)
+        original = Citation(self.fulldoc['citations'][2])
+
+        self.assertTrue(isinstance(citation.data, citationstore.CitationView))
+        for index in range(len(self.store)):
+            self.assertEqual(type(self.store.citation(index)), type(create_citation(self.store.raw(index))))
+
+        self.assertTrue(isinstance(citation, Citation))
+        self.assertEqual(citation.publication_type, original.publication_type)
+        self.assertEqual(citation.source, original.source)
+        self.assertEqual(citation.authors, original.authors)
+        self.assertEqual(len(list(self.store)), 36)
+
+    def test_article_id_and_type(self):
+
+        self.assertEqual(self.store.article_id(20), u'S2179-975X2011000300002')
+        self.assertEqual(
+            self.store.publication_type(2),
+            Citation(self.fulldoc['citations'][2]).publication_type
+        )
+
+    def test_column(self):
+        column = self.store.column('v35')
+
+        self.assertEqual(column[2], u'0020-7519')
+        self.assertEqual(column[0], None)
+        self.assertEqual(column.count(u'1676-0603'), 4)
+        self.assertEqual(self.store.column('v999'), [None] * 36)
+
+    def test_find(self):
+
+        self.assertEqual(self.store.find('v35', u'1676-0603'), [10, 11, 28, 29])
+        self.assertEqual(self.store.find('v35', u'1676-0603', publication_type=u'book'), [])
+        self.assertEqual(self.store.find('v35', u'xxx'), [])
@@ -0,0 +1,174 @@
+# coding: utf-8
+
+import unittest
+import csv
+import gzip
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+from xylose import cli
+from xylose import diskcache
+from xylose import streams
+from xylose.scielodocument import Article
+
+
+class CLITests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.tmp = tempfile.mkdtemp()
+
+        line = json.dumps(self.fulldoc).encode('utf-8') + b'\n'
+        with open(os.path.join(self.tmp, 'a.jsonl'), 'wb') as output:
+            output.write(line + b'\n' + b'{broken\n')
+        with gzip.open(os.path.join(self.tmp, 'b.jsonl.gz'), 'wb') as output:
+            output.write(line * 2)
+
+        self.stderr = sys.stderr
+        sys.stderr = io.StringIO()
+
+    def tearDown(self):
+        sys.stderr = self.stderr
+        shutil.rmtree(self.tmp)
+
+    def test_expand_inputs(self):
+        paths = cli.expand_inputs([os.path.join(self.tmp, '*.jsonl*'), '-'])
+
+        self.assertEqual(
+            paths,
+            [os.path.join(self.tmp, 'a.jsonl'), os.path.join(self.tmp, 'b.jsonl.gz'), '-']
+        )
+
+    def test_full_records(self):
+        output = os.path.join(self.tmp, 'out.jsonl')
+
+        cli.main([os.path.join(self.tmp, '*.jsonl*'), '--output', output])
+
+        records = list(streams.read_jsonlines(output))
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[0]['publisher_id'], Article(self.fulldoc).publisher_id)
+        self.assertEqual(len(records[0]['citations']), 18)
+        self.assertTrue('3 records, 1 unreadable lines' in sys.stderr.getvalue())
+        self.assertTrue('MB/s' in sys.stderr.getvalue())
+
+    def test_non_object_lines_are_unreadable(self):
+        source = os.path.join(self.tmp, 'c.jsonl')
+        output = os.path.join(self.tmp, 'out.jsonl')
+        with open(source, 'wb') as target:
+            target.write(b'[1]\n"text"\nnull\n' + json.dumps(self.fulldoc).encode('utf-8') + b'\n')
+
+        cli.main([source, '--output', output])
+        cli.main([source, '--output', output, '--cache', os.path.join(self.tmp, 'cache.db')])
+
+        self.assertEqual(len(list(streams.read_jsonlines(output))), 1)
+        self.assertEqual(sys.stderr.getvalue().count('1 records, 3 unreadable lines'), 2)
+
+    def test_malformed_citations(self):
+        source = os.path.join(self.tmp, 'c.jsonl')
+        output = os.path.join(self.tmp, 'out.jsonl')
+        self.fulldoc['citations'] = None
+        with open(source, 'wb') as target:
+            target.write(json.dumps(self.fulldoc).encode('utf-8') + b'\n')
+
+        cli.main([source, '--output', output])
+
+        records = list(streams.read_jsonlines(output))
+        self.assertEqual(records[0]['citations'], None)
+        self.assertTrue('1 records, 0 unreadable lines, 1 field errors' in sys.stderr.getvalue())
+
+    def test_unknown_fields(self):
+        with self.assertRaises(SystemExit):
+            cli.main(['--fields', 'publisher_id,nothing'])
+
+        self.assertTrue('unknown fields: nothing' in sys.stderr.getvalue())
+
+    def test_fields_in_processes(self):
+        output = os.path.join(self.tmp, 'out.jsonl.gz')
+
+        cli.main([
+            os.path.join(self.tmp, 'b.jsonl.gz'), '--output', output,
+            '--fields', 'publisher_id,volume', '--processes', '2', '--chunksize', '1',
+            '--quiet'
+        ])
+
+        records = list(streams.read_jsonlines(output))
+        self.assertEqual(records, [{u'publisher_id': u'S2179-975X2011000300002', u'volume': u'23'}] * 2)
+        self.assertEqual(sys.stderr.getvalue(), u'')
+
+    def test_csv(self):
+        output = os.path.join(self.tmp, 'out.csv')
+
+        cli.main([
+            os.path.join(self.tmp, 'a.jsonl'), '--output', output, '--format', 'csv',
+            '--fields', 'publisher_id,keywords,publication_date', '--quiet'
+        ])
+
+        with open(output) as source:
+            rows = list(csv.reader(source))
+
+        self.assertEqual(rows[0], ['publisher_id', 'keywords', 'publication_date'])
+        self.assertEqual(rows[1][0], u'S2179-975X2011000300002')
+        self.assertEqual(json.loads(rows[1][1]), Article(self.fulldoc).keywords())
+        self.assertEqual(rows[1][2], u'2011-09')
+
+    def test_metrics(self):
+        output = os.path.join(self.tmp, 'out.jsonl')
+        metrics = os.path.join(self.tmp, 'metrics.json')
+
+        cli.main([
+            os.path.join(self.tmp, '*.jsonl*'), '--output', output,
+            '--metrics', metrics, '--metrics-interval', '0', '--quiet'
+        ])
+
+        with open(metrics) as source:
+            snapshot = json.load(source)
+
+        self.assertEqual(snapshot['records'], 3)
+        self.assertEqual(snapshot['errors']['unreadable'], 1)
+        self.assertEqual(
+            sorted(snapshot['stages'].keys()),
+            ['construct', 'extract', 'parse', 'read', 'write']
+        )
+        pushed = [json.loads(line) for line in sys.stderr.getvalue().splitlines()]
+        self.assertEqual(pushed[-1]['records'], 3)
+
+    def test_metrics_in_processes(self):
+        output = os.path.join(self.tmp, 'out.jsonl')
+        metrics = os.path.join(self.tmp, 'metrics.json')
+
+        cli.main([
+            os.path.join(self.tmp, '*.jsonl*'), '--output', output, '--processes', '2',
+            '--chunksize', '1', '--metrics', metrics, '--quiet'
+        ])
+
+        with open(metrics) as source:
+            snapshot = json.load(source)
+
+        self.assertEqual(snapshot['records'], 3)
+        self.assertEqual(snapshot['stages']['parse']['count'], 4)
+        self.assertEqual(snapshot['stages']['construct']['count'], 3)
+        self.assertEqual(snapshot['stages']['extract']['count'], 3)
+
+
+    def test_cache(self):
+        first = os.path.join(self.tmp, 'first.jsonl')
+        second = os.path.join(self.tmp, 'second.jsonl')
+        cache = os.path.join(self.tmp, 'cache.db')
+        inputs = [os.path.join(self.tmp, 'a.jsonl'), os.path.join(self.tmp, 'b.jsonl.gz')]
+
+        cli.main(inputs + ['--output', first, '--cache', cache])
+        cli.main(inputs + [
+            '--output', second, '--cache', cache,
+            '--processes', '2', '--chunksize', '1'
+        ])
+
+        self.assertEqual(list(streams.read_jsonlines(first)), list(streams.read_jsonlines(second)))
+        self.assertEqual(sys.stderr.getvalue().count('3 records, 1 unreadable lines'), 2)
+
+        with diskcache.ExtractionCache(cache) as stored:
+            self.assertEqual(len(stored), 1)
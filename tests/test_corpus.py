@@ -0,0 +1,126 @@
+# coding: utf-8
+
+import unittest
+import json
+import gc
+import os
+import pickle
+import subprocess
+import sys
+from multiprocessing import Pool
+
+from xylose import corpus
+from xylose.scielodocument import Article, create_citation
+
+
+def _publisher_id(args):
+    shared, index = args
+    try:
+        return shared.article(index).publisher_id
+    finally:
+        shared.close()
+
+
+@unittest.skipIf(corpus.shared_memory is None, 'multiprocessing.shared_memory not available')
+class SharedCorpusTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        other = json.loads(json.dumps(self.fulldoc))
+        other['article']['v880'] = [{u'_': u'S0000-00002000000100001'}]
+        self.records = [self.fulldoc, other]
+
+    def test_create(self):
+        with corpus.SharedCorpus.create(self.records) as shared:
+            self.assertEqual(len(shared), 2)
+            self.assertEqual(shared[0], self.fulldoc)
+            self.assertEqual(shared[-1], self.records[1])
+            self.assertEqual(list(shared), self.records)
+
+    def test_index_out_of_range(self):
+        with corpus.SharedCorpus.create(self.records) as shared:
+            with self.assertRaises(IndexError):
+                shared.raw(2)
+
+    def test_empty(self):
+        with corpus.SharedCorpus.create([]) as shared:
+            self.assertEqual(len(shared), 0)
+            self.assertEqual(list(shared), [])
+
+    def test_views(self):
+        records = self.records + [self.fulldoc['citations'][0], self.fulldoc['title']]
+
+        with corpus.SharedCorpus.create(records) as shared:
+            article = shared.article(1)
+
+            self.assertTrue(isinstance(article, Article))
+            self.assertEqual(article.publisher_id, u'S0000-00002000000100001')
+            self.assertTrue(
+                type(shared.citation(2)) is type(create_citation(self.fulldoc['citations'][0])))
+            self.assertEqual(shared.journal(3).title, article.journal.title)
+
+    def test_attach(self):
+        with corpus.SharedCorpus.create(self.records) as shared:
+            attached = corpus.SharedCorpus.attach(shared.name)
+
+            self.assertEqual(attached.raw_bytes(1), shared.raw_bytes(1))
+
+            attached.close()
+
+    def test_independent_attachers(self):
+        root = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+        script = (
+            'import sys; from xylose import corpus; '
+            'shared = corpus.SharedCorpus.attach(sys.argv[1]); '
+            'print(len(shared)); shared.close()'
+        )
+
+        shared = corpus.SharedCorpus.create(self.records)
+        try:
+            for attempt in range(2):
+                output = subprocess.check_output(
+                    [sys.executable, '-c', script, shared.name], cwd=root)
+                self.assertEqual(output.strip(), b'2')
+        finally:
+            shared.close()
+            shared.unlink()
+
+    def test_dropped_without_close(self):
+        shared = corpus.SharedCorpus.create(self.records)
+        name = shared.name
+        attached = corpus.SharedCorpus.attach(name)
+        attached.raw(0)
+        unraisable = []
+        hook = sys.unraisablehook
+        sys.unraisablehook = unraisable.append
+        try:
+            del attached
+            gc.collect()
+        finally:
+            sys.unraisablehook = hook
+
+        self.assertEqual(unraisable, [])
+        shared.close()
+        shared.unlink()
+
+    def test_pickle_sends_name(self):
+        with corpus.SharedCorpus.create(self.records) as shared:
+            dumped = pickle.dumps(shared)
+
+            self.assertTrue(len(dumped) < 200)
+
+            loaded = pickle.loads(dumped)
+            self.assertEqual(loaded.article(0).publisher_id, u'S2179-975X2011000300002')
+            loaded.close()
+
+    def test_workers(self):
+        with corpus.SharedCorpus.create(self.records) as shared:
+            pool = Pool(2)
+            try:
+                pids = pool.map(_publisher_id, [(shared, 0), (shared, 1)])
+            finally:
+                pool.close()
+                pool.join()
+
+        self.assertEqual(pids, [u'S2179-975X2011000300002', u'S0000-00002000000100001'])
@@ -0,0 +1,168 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+
+from xylose import database
+from xylose.scielodocument import Article
+
+
+class SQLiteExporterTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'scielo.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _article(self, pid, year=u'2011'):
+        data = json.loads(json.dumps(self.fulldoc))
+        data['article']['v880'] = [{u'_': pid}]
+        data['article']['v65'] = [{u'_': year + u'0900'}]
+
+        return Article(data)
+
+    def _query(self, sql, *args):
+        connection = sqlite3.connect(self.path)
+        try:
+            return connection.execute(sql, args).fetchall()
+        finally:
+            connection.close()
+
+    def test_export(self):
+        count = database.export_sqlite([self._article(u'S1'), self._article(u'S2', u'2009')], self.path)
+
+        self.assertEqual(count, 2)
+        self.assertEqual(
+            self._query('SELECT pid, issn, year, document_type, original_language FROM articles ORDER BY pid'),
+            [(u'S1', u'2179-975X', 2011, u'research-article', u'en'),
+             (u'S2', u'2179-975X', 2009, u'research-article', u'en')]
+        )
+        self.assertEqual(
+            self._query('SELECT issn, title FROM journals'),
+            [(u'2179-975X', u'Acta Limnologica Brasiliensia')]
+        )
+
+    def test_dependent_tables(self):
+        database.export_sqlite([self._article(u'S1')], self.path)
+
+        self.assertEqual(self._query('SELECT COUNT(*) FROM citations WHERE pid = ?', u'S1'), [(18,)])
+        self.assertEqual(
+            self._query('SELECT position, surname FROM authors WHERE pid = ? AND position = 0', u'S1'),
+            [(0, u'Gomes')]
+        )
+        self.assertEqual(self._query('SELECT language FROM article_languages'), [(u'en',)])
+        self.assertEqual(self._query("SELECT COUNT(*) FROM keywords WHERE language = 'pt'"), [(5,)])
+
+    def test_citation_columns(self):
+        database.export_sqlite([self._article(u'S1')], self.path)
+
+        self.assertEqual(
+            self._query('SELECT index_number, publication_type, year FROM citations WHERE index_number = 1'),
+            [(1, u'book', 2002)]
+        )
+
+    def test_indexes(self):
+        database.export_sqlite([self._article(u'S1')], self.path)
+
+        names = [row[0] for row in self._query("SELECT name FROM sqlite_master WHERE type = 'index'")]
+        for name, table, columns in database.INDEXES:
+            self.assertTrue(name in names)
+
+    def test_batches(self):
+        articles = [self._article(u'S%d' % i) for i in range(5)]
+
+        count = database.export_sqlite(articles, self.path, batch_size=2)
+
+        self.assertEqual(count, 5)
+        self.assertEqual(self._query('SELECT COUNT(*) FROM articles'), [(5,)])
+        self.assertEqual(self._query('SELECT COUNT(*) FROM citations'), [(90,)])
+        self.assertEqual(self._query('SELECT COUNT(*) FROM journals'), [(1,)])
+
+    def test_repeated_articles_are_replaced(self):
+        articles = [self._article(u'S1'), self._article(u'S1', u'2012'), self._article(u'S1', u'2013')]
+
+        database.export_sqlite(articles, self.path, batch_size=2)
+
+        self.assertEqual(self._query('SELECT year FROM articles'), [(2013,)])
+        self.assertEqual(self._query('SELECT COUNT(*) FROM citations'), [(18,)])
+
+    def test_count_repeated_articles_once(self):
+        articles = [self._article(u'S1'), self._article(u'S1', u'2012'), self._article(u'S2')]
+
+        self.assertEqual(database.export_sqlite(articles, self.path), 2)
+
+    def test_article_indexes_on_first_replace(self):
+        query = "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+        exporter = database.SQLiteExporter(self.path, batch_size=1)
+
+        exporter.add_many([self._article(u'S1'), self._article(u'S2')])
+        self.assertEqual(self._query(query), [])
+
+        exporter.add(self._article(u'S1', u'2012'))
+        names = [row[0] for row in self._query(query)]
+        self.assertTrue('citations_article' in names)
+        self.assertTrue('authors_article' in names)
+        self.assertFalse('articles_year' in names)
+
+        exporter.close()
+        self.assertEqual(self._query('SELECT COUNT(*) FROM citations'), [(36,)])
+
+    def test_journal_columns(self):
+        article = self._article(u'S1')
+        database.export_sqlite([article], self.path)
+
+        self.assertEqual(
+            self._query('SELECT issn, print_issn, electronic_issn, collection FROM journals'),
+            [(article.journal.scielo_issn, article.journal.print_issn,
+              article.journal.electronic_issn, article.journal.collection_acronym)]
+        )
+
+    def test_append(self):
+        database.export_sqlite([self._article(u'S1'), self._article(u'S2')], self.path)
+
+        exporter = database.SQLiteExporter(self.path)
+        exporter.add(self._article(u'S2', u'2012'))
+        exporter.add(self._article(u'S3'))
+        exporter.close()
+
+        self.assertEqual(
+            self._query('SELECT pid, year FROM articles ORDER BY pid'),
+            [(u'S1', 2011), (u'S2', 2012), (u'S3', 2011)]
+        )
+        self.assertEqual(self._query('SELECT COUNT(*) FROM citations'), [(54,)])
+        self.assertEqual(self._query('SELECT COUNT(*) FROM authors WHERE pid = ?', u'S2'), [(4,)])
+
+    def test_append_rebuilding_indexes(self):
+        database.export_sqlite([self._article(u'S1')], self.path)
+        database.export_sqlite([self._article(u'S1', u'2012')], self.path, rebuild_indexes=True)
+
+        names = [row[0] for row in self._query("SELECT name FROM sqlite_master WHERE type = 'index'")]
+        self.assertTrue('articles_year' in names)
+        self.assertEqual(self._query('SELECT COUNT(*) FROM citations'), [(18,)])
+
+    def test_skip_without_pid(self):
+        article = self._article(u'S1')
+        del article.data['article']['v880']
+
+        with database.SQLiteExporter(self.path) as exporter:
+            exporter.add_many([article, self._article(u'S2')])
+
+        self.assertEqual(exporter.count, 1)
+        self.assertEqual(exporter.skipped, 1)
+        self.assertEqual(self._query('SELECT pid FROM articles'), [(u'S2',)])
+
+    def test_null_values(self):
+        article = self._article(u'S1')
+        del article.data['article']['v65']
+
+        database.export_sqlite([article], self.path)
+
+        self.assertEqual(self._query('SELECT publication_date, year FROM articles'), [(None, None)])
@@ -0,0 +1,111 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+
+from xylose import dedup
+from xylose.scielodocument import Article
+
+
+class DeduplicatorTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+
+    def _copy(self, collection, doi=None, title=None):
+        data = json.loads(json.dumps(self.fulldoc))
+        data['collection'] = collection
+        if doi is not None:
+            data['doi'] = doi
+        if title is not None:
+            data['article']['v12'] = [{u'l': u'en', u'_': title}]
+
+        return Article(data)
+
+    def test_doi_key(self):
+
+        self.assertEqual(dedup.doi_key(self._copy(u'scl', doi=u'https://doi.org/10.1590/ABC')), u'10.1590/abc')
+        self.assertEqual(dedup.doi_key(self._copy(u'scl', doi=u'doi:10.1590/abc')), u'10.1590/abc')
+        self.assertEqual(dedup.doi_key(Article(self.fulldoc)), None)
+
+    def test_fingerprint(self):
+        first = self._copy(u'scl', title=u'First Adult  record!')
+        second = self._copy(u'spa', title=u'first adult record')
+
+        self.assertEqual(dedup.fingerprint(first), dedup.fingerprint(second))
+        self.assertTrue(dedup.fingerprint(first).startswith(u'firstadultrecord|gomes|2011|'))
+
+    def test_fingerprint_without_title(self):
+        del(self.fulldoc['article']['v12'])
+
+        self.assertEqual(dedup.fingerprint(Article(self.fulldoc)), None)
+
+    def test_duplicates_by_doi(self):
+        articles = [
+            self._copy(u'scl', doi=u'10.1590/abc', title=u'one'),
+            self._copy(u'spa', doi=u'10.1590/ABC', title=u'two'),
+            self._copy(u'arg', doi=u'10.1590/xyz', title=u'three')
+        ]
+
+        duplicates = list(dedup.Deduplicator().duplicates(articles))
+
+        self.assertEqual(len(duplicates), 1)
+        self.assertEqual(duplicates[0][0], articles[1])
+        self.assertEqual(duplicates[0][1], (u'scl', u'S2179-975X2011000300002'))
+
+    def test_duplicates_by_fingerprint(self):
+        articles = [
+            self._copy(u'scl', doi=u'10.1590/abc'),
+            self._copy(u'spa'),
+            self._copy(u'arg', title=u'Other title')
+        ]
+        deduplicator = dedup.Deduplicator()
+
+        unique = list(deduplicator.unique(articles))
+
+        self.assertEqual(unique, [articles[0], articles[2]])
+        self.assertEqual(deduplicator.duplicates_count, 1)
+
+    def test_different_dois_are_distinct(self):
+        articles = [
+            self._copy(u'scl', doi=u'10.1590/abc'),
+            self._copy(u'spa', doi=u'10.1590/xyz'),
+            self._copy(u'arg')
+        ]
+        deduplicator = dedup.Deduplicator()
+
+        unique = list(deduplicator.unique(articles))
+
+        self.assertEqual(dedup.fingerprint(articles[0]), dedup.fingerprint(articles[1]))
+        self.assertEqual(unique, articles[0:2])
+        self.assertEqual(deduplicator.duplicates_count, 1)
+
+    def test_duplicates_by_fingerprint_reversed(self):
+        articles = [
+            self._copy(u'spa'),
+            self._copy(u'scl', doi=u'10.1590/abc'),
+            self._copy(u'arg', doi=u'10.1590/xyz'),
+            self._copy(u'mex')
+        ]
+        deduplicator = dedup.Deduplicator()
+
+        duplicates = list(deduplicator.duplicates(articles))
+
+        self.assertEqual([article for article, original in duplicates], [articles[1], articles[3]])
+        self.assertEqual(duplicates[0][1][0], u'spa')
+
+    def test_bounded_entries(self):
+        deduplicator = dedup.Deduplicator(max_entries=2)
+
+        deduplicator.check(self._copy(u'scl', title=u'one'))
+        deduplicator.check(self._copy(u'scl', title=u'two'))
+        deduplicator.check(self._copy(u'scl', title=u'three'))
+
+        self.assertEqual(len(deduplicator), 2)
+        self.assertEqual(deduplicator.check(self._copy(u'spa', title=u'one')), None)
+        self.assertEqual(
+            deduplicator.check(self._copy(u'spa', title=u'three')),
+            (u'scl', u'S2179-975X2011000300002')
+        )
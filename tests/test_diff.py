@@ -0,0 +1,71 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+
+from xylose import diff
+from xylose.extraction import FieldError
+from xylose.scielodocument import Article
+
+
+class DiffTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.old = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.new = json.loads(json.dumps(self.old))
+
+    def test_changed_tags_without_changes(self):
+
+        self.assertEqual(diff.changed_tags(self.old, self.new), set())
+        self.assertEqual(diff.diff(self.old, self.new), {})
+
+    def test_changed_tags(self):
+        self.new['article']['v31'] = [{u'_': u'99'}]
+        del(self.new['article']['v32'])
+        self.new['title']['v100'] = [{u'_': u'Other'}]
+        self.new['citations'] = []
+        self.new['collection'] = u'spa'
+
+        self.assertEqual(
+            diff.changed_tags(Article(self.old), self.new),
+            set(['article.v31', 'article.v32', 'title.v100', 'citations', 'collection'])
+        )
+
+    def test_changed_tags_missing_section(self):
+        del(self.new['title'])
+
+        self.assertEqual(
+            diff.changed_tags(self.old, self.new),
+            set('title.%s' % tag for tag in self.old['title'])
+        )
+
+    def test_affected_fields(self):
+
+        self.assertEqual(diff.affected_fields(['article.v31']), ['volume'])
+        self.assertEqual(
+            diff.affected_fields(['article.v880']),
+            ['publisher_id', 'languages', 'html_url', 'pdf_url', 'issue_url']
+        )
+        self.assertEqual(diff.affected_fields(['article.v31'], ['volume', 'xxx']), ['volume', 'xxx'])
+
+    def test_diff(self):
+        self.new['article']['v31'] = [{u'_': u'99'}]
+        self.new['collection'] = u'spa'
+
+        changes = diff.diff(self.old, self.new)
+
+        self.assertEqual(changes['volume'], (u'23', u'99'))
+        self.assertEqual(changes['collection_acronym'], (u'scl', u'spa'))
+        self.assertEqual(changes['scielo_domain'], (u'www.scielo.br', u'www.scielosp.org'))
+        self.assertFalse('issue' in changes)
+
+    def test_diff_with_errors(self):
+        del(self.new['article']['v65'])
+
+        changes = diff.diff(self.old, self.new)
+
+        self.assertEqual(list(changes.keys()), ['publication_date'])
+        self.assertEqual(changes['publication_date'][0], u'2011-09')
+        self.assertTrue(isinstance(changes['publication_date'][1], FieldError))
@@ -0,0 +1,230 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+
+from xylose import diskcache
+from xylose.extraction import Exporter, FieldError
+from xylose.scielodocument import Article
+
+
+class DiskCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'cache.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _record(self, pid):
+        data = json.loads(json.dumps(self.fulldoc))
+        data['article']['v880'] = [{u'_': pid}]
+
+        return data
+
+    def test_record_hash(self):
+        digest = diskcache.record_hash(self.fulldoc)
+        reordered = json.loads(json.dumps(self.fulldoc, sort_keys=True))
+
+        self.assertEqual(diskcache.record_hash(reordered), digest)
+        self.assertNotEqual(diskcache.record_hash(self._record(u'S1')), digest)
+
+    def test_record_hash_bytes(self):
+        line = json.dumps(self.fulldoc).encode('utf-8')
+
+        self.assertEqual(diskcache.record_hash(line), diskcache.record_hash(line))
+        self.assertNotEqual(diskcache.record_hash(line), diskcache.record_hash(line + b' '))
+
+    def test_record_pid(self):
+
+        self.assertEqual(diskcache.record_pid(self.fulldoc), u'S2179-975X2011000300002')
+        self.assertEqual(diskcache.record_pid({}), u'')
+
+    def test_namespace(self):
+        default = diskcache.namespace(Exporter())
+
+        self.assertEqual(default, diskcache.namespace(Exporter()))
+        self.assertNotEqual(default, diskcache.namespace(Exporter(), 'iso 639-2'))
+        self.assertNotEqual(default, diskcache.namespace(Exporter(article_fields=['doi'])))
+        self.assertNotEqual(default, diskcache.namespace(Exporter(), keys=diskcache.LINE_KEYS))
+        self.assertRaises(ValueError, diskcache.namespace, Exporter(), keys='other')
+
+    def test_put_and_get_many(self):
+        with diskcache.ExtractionCache(self.path) as cache:
+            cache.put_many([
+                (u'S1', u'a', {u'doi': u'10.1/1'}, 0),
+                (u'S2', u'b', {u'doi': None}, 1)
+            ])
+
+            found = cache.get_many([u'a', u'b', u'c'])
+
+            self.assertEqual(found, {
+                u'a': ({u'doi': u'10.1/1'}, 0),
+                u'b': ({u'doi': None}, 1)
+            })
+            self.assertEqual(cache.stats()['hits'], 2)
+            self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_get_many_above_variables_limit(self):
+        with diskcache.ExtractionCache(self.path) as cache:
+            cache.put_many([(u'S%d' % i, u'h%d' % i, {u'n': i}, 0) for i in range(1200)])
+
+            found = cache.get_many([u'h%d' % i for i in range(1300)])
+
+            self.assertEqual(len(found), 1200)
+            self.assertEqual(found[u'h1100'], ({u'n': 1100}, 0))
+            self.assertEqual(cache.stats()['misses'], 100)
+
+    def test_field_errors(self):
+        record = {u'doi': FieldError('doi', KeyError('v237')), u'citations': [
+            {u'source': u'A'}, {u'source': FieldError('source', ValueError('x'))}
+        ]}
+
+        with diskcache.ExtractionCache(self.path) as cache:
+            cache.put(u'S1', u'a', record, 2)
+
+            self.assertEqual(cache.get(u'a'), (record, 2))
+            encoded, errors = cache.get(u'a', decode=False)
+            self.assertEqual(json.loads(encoded.decode('utf-8')), {
+                u'doi': None, u'citations': [{u'source': u'A'}, {u'source': None}]
+            })
+
+    def test_errors_without_markers_are_misses(self):
+        connection = sqlite3.connect(self.path)
+        connection.executescript(
+            'CREATE TABLE entries (digest TEXT NOT NULL, namespace TEXT NOT NULL, '
+            'pid TEXT NOT NULL, value BLOB NOT NULL, errors INTEGER NOT NULL, '
+            'size INTEGER NOT NULL, used REAL NOT NULL, PRIMARY KEY (digest, namespace))'
+        )
+        connection.executemany('INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)', [
+            (u'a', u'', u'S1', sqlite3.Binary(b'{"doi":null}'), 1, 12, 0),
+            (u'b', u'', u'S2', sqlite3.Binary(b'{"doi":"1"}'), 0, 11, 0)
+        ])
+        connection.commit()
+        connection.close()
+
+        with diskcache.ExtractionCache(self.path) as cache:
+            self.assertEqual(cache.get(u'a'), None)
+            self.assertEqual(cache.get(u'a', decode=False), (b'{"doi":null}', 1))
+            self.assertEqual(cache.get(u'b'), ({u'doi': u'1'}, 0))
+
+    def test_get_encoded(self):
+        with diskcache.ExtractionCache(self.path) as cache:
+            cache.put(u'S1', u'a', {u'doi': u'10.1/1'}, 2)
+
+            self.assertEqual(cache.get(u'a', decode=False), (b'{"doi":"10.1/1"}', 2))
+
+    def test_invalidate(self):
+        with diskcache.ExtractionCache(self.path) as cache:
+            cache.put(u'S1', u'a', {})
+            cache.put(u'S1', u'b', {})
+            cache.put(u'S2', u'c', {})
+
+            self.assertEqual(cache.invalidate(u'S1'), 2)
+            self.assertEqual(len(cache), 1)
+            self.assertEqual(cache.stats()['bytes'], 2)
+
+    def test_namespaces_are_separated(self):
+        with diskcache.ExtractionCache(self.path) as cache:
+            cache.put(u'S1', u'a', {u'doi': None}, namespace=u'x')
+
+            self.assertEqual(cache.get(u'a', namespace=u'y'), None)
+            self.assertEqual(cache.get(u'a', namespace=u'x'), ({u'doi': None}, 0))
+
+    def test_persistence(self):
+        with diskcache.ExtractionCache(self.path) as cache:
+            cache.put(u'S1', u'h1', {u'doi': u'10.1/1'})
+
+        with diskcache.ExtractionCache(self.path) as cache:
+            self.assertEqual(cache.get(u'h1'), ({u'doi': u'10.1/1'}, 0))
+            self.assertEqual(len(cache), 1)
+
+    def test_replace_keeps_totals(self):
+        with diskcache.ExtractionCache(self.path) as cache:
+            cache.put(u'S1', u'a', {u'doi': u'10.1/1'})
+            cache.put(u'S1', u'a', {u'doi': u'10.1/22'})
+
+            self.assertEqual(cache.stats()['entries'], 1)
+            self.assertEqual(cache.stats()['bytes'], len(b'{"doi":"10.1/22"}'))
+
+    def test_evict_max_entries(self):
+        with diskcache.ExtractionCache(self.path, max_entries=10) as cache:
+            for i in range(11):
+                cache.put(u'S%d' % i, u'h%d' % i, {u'i': i})
+
+            self.assertEqual(len(cache), 9)
+            self.assertEqual(cache.get(u'h0'), None)
+            self.assertEqual(cache.get(u'h10'), ({u'i': 10}, 0))
+            self.assertEqual(cache.stats()['evictions'], 2)
+
+    def test_evict_max_bytes_least_recently_used(self):
+        value = {u'v': u'x' * 90}
+        size = len(json.dumps(value, separators=(',', ':')))
+
+        with diskcache.ExtractionCache(self.path, max_bytes=size * 3) as cache:
+            cache.put(u'S1', u'h1', value)
+            cache.put(u'S2', u'h2', value)
+            cache.put(u'S3', u'h3', value)
+            cache.get(u'h1')
+            cache.put(u'S4', u'h4', value)
+
+            self.assertTrue(cache.stats()['bytes'] <= size * 3)
+            self.assertNotEqual(cache.get(u'h1'), None)
+            self.assertEqual(cache.get(u'h2'), None)
+
+    def test_clear(self):
+        with diskcache.ExtractionCache(self.path) as cache:
+            cache.put(u'S1', u'h1', {})
+            cache.clear()
+
+            self.assertEqual(cache.stats()['entries'], 0)
+            self.assertEqual(cache.stats()['bytes'], 0)
+
+    def test_cached_exporter(self):
+        exporter = Exporter(journal_fields=[], citation_fields=[])
+        articles = [Article(self._record(u'S%d' % i)) for i in range(5)]
+
+        with diskcache.ExtractionCache(self.path) as cache:
+            cached = diskcache.CachedExporter(cache, exporter, batch_size=2)
+            first = list(cached.export_many(articles))
+            second = list(cached.export_many(articles))
+
+            self.assertEqual([record['publisher_id'] for record in first], [u'S%d' % i for i in range(5)])
+            self.assertEqual(second, json.loads(json.dumps(first)))
+            self.assertEqual(cache.stats()['hits'], 5)
+            self.assertEqual(cache.stats()['misses'], 5)
+
+    def test_cached_exporter_field_errors(self):
+        exporter = Exporter(citation_fields=[])
+        data = self._record(u'S1')
+        del data['article']['v65']
+
+        with diskcache.ExtractionCache(self.path) as cache:
+            cached = diskcache.CachedExporter(cache, exporter)
+            first = cached.export(Article(data))
+            counters = cached.counters
+            second = cached.export(Article(data))
+
+            self.assertTrue(isinstance(first['publication_date'], FieldError))
+            self.assertEqual(second, first)
+            self.assertEqual(cache.stats()['hits'], 1)
+            self.assertEqual(
+                cached.counters,
+                dict((field, count * 2) for field, count in counters.items())
+            )
+
+    def test_cached_exporter_export(self):
+        with diskcache.ExtractionCache(self.path) as cache:
+            cached = diskcache.CachedExporter(cache)
+            article = Article(self.fulldoc)
+
+            self.assertEqual(cached.export(article)['publisher_id'], article.publisher_id)
+            self.assertEqual(len(cached.export(article)['citations']), 18)
+            self.assertEqual(cache.stats()['hits'], 1)
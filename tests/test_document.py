@@ -3,7 +3,8 @@
 import unittest
 import json
 import os
-from xylose.scielodocument import Article, Citation, Journal, html_decode
+from xylose.scielodocument import Article, Citation, Journal, html_decode, articles_urls
+from xylose import scielodocument
 from xylose import tools
 
 
@@ -1398,6 +1399,69 @@ class ArticleTests(unittest.TestCase):
 
         self.assertEqual(article.issue_url(), expected)
 
+    def test_scielo_domain_is_cached(self):
+        article = self.article
+
+        self.assertEqual(article.scielo_domain, u'www.scielo.br')
+
+        article.data['collection'] = u'arg'
+
+        self.assertEqual(article.scielo_domain, u'www.scielo.br')
+
+    def test_without_urls(self):
+        article = self.article
+
+        del(article.data['title']['v690'])
+        del(article.data['collection'])
+
+        self.assertEqual(article.urls(), None)
+
+    def test_urls(self):
+        article = self.article
+
+        article.data['article']['v880'] = [{u'_': u'S2179-975X2011000300002'}]
+        article.data['title']['v400'] = [{u'_': u'2179-975X'}]
+
+        urls = article.urls(languages=[u'en', u'pt'])
+
+        self.assertEqual(sorted(urls.keys()), ['html', 'issue', 'journal', 'pdf'])
+        self.assertEqual(urls['pdf'][u'en'], article.pdf_url())
+        self.assertEqual(urls['html'][u'pt'], article.html_url(language=u'pt'))
+        self.assertEqual(urls['issue'][u'pt'], article.issue_url(language=u'pt'))
+        self.assertEqual(
+            urls['journal'][u'en'],
+            u'http://www.scielo.br/scielo.php?script=sci_serial&pid=2179-975X&lng=en'
+        )
+
+    def test_urls_without_journal(self):
+        article = self.article
+
+        del(article.data['title'])
+        article.data['collection'] = u'scl'
+
+        urls = article.urls(languages=[u'en'])
+
+        self.assertEqual(sorted(urls.keys()), ['html', 'issue', 'pdf'])
+
+    def test_urls_default_languages(self):
+        article = self.article
+
+        article.data['article']['v601'] = [{'_': 'pt'}, {'_': 'es'}]
+        article.data['article']['v740'] = [{'_': 'en'}]
+
+        urls = article.urls()
+
+        self.assertEqual(sorted(urls['html'].keys()), ['en', 'es', 'pt'])
+
+    def test_articles_urls(self):
+        article = self.article
+
+        result = list(articles_urls([article, article], languages=[u'en']))
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0][0], article.publisher_id)
+        self.assertEqual(result[0][1]['pdf'][u'en'], article.pdf_url())
+
     def test_without_keywords(self):
         article = self.article
 
@@ -1491,6 +1555,12 @@ class ArticleTests(unittest.TestCase):
 
         self.assertEqual(article.citations, None)
 
+    def test_citations_are_memoized(self):
+        article = Article(self.fulldoc)
+
+        self.assertTrue(article.citations is article.citations)
+        self.assertTrue(article.citations[0] is article.citations[0])
+
     def test_translated_titles_without_v12(self):
         article = self.article
 
@@ -2591,3 +2661,71 @@ class CitationTest(unittest.TestCase):
         citation = Citation(json_citation)
 
         self.assertIsNone(citation.title())
+
+
+class CitationFactoryTest(unittest.TestCase):
+
+    accessors = [
+        'publication_type', 'start_page', 'end_page', 'pages', 'index_number',
+        'source', 'chapter_title', 'article_title', 'thesis_title',
+        'conference_title', 'link_title', 'conference_sponsor', 'link', 'date',
+        'edition', 'institutions', 'analytic_institution',
+        'monographic_institution', 'sponsor', 'editor', 'thesis_institution',
+        'issn', 'isbn', 'volume', 'issue', 'issue_title', 'issue_part', 'doi',
+        'authors', 'monographic_authors', 'serie', 'publisher',
+        'publisher_address'
+    ]
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+
+        every_tag = {}
+        for tag in ['v10', 'v11', 'v12', 'v16', 'v17', 'v18', 'v25', 'v29',
+                    'v30', 'v31', 'v32', 'v33', 'v34', 'v35', 'v37', 'v45',
+                    'v50', 'v52', 'v53', 'v58', 'v63', 'v65', 'v69', 'v110']:
+            every_tag[tag] = [{u'_': u'%s &amp; value' % tag, u's': u'Surname', u'n': u'N'}]
+        every_tag['v45'] = [{u'_': u'20100100'}]
+        every_tag['v65'] = [{u'_': u'20090000'}]
+        every_tag['v110'] = [{u'_': u'20110203'}]
+
+        self.samples = list(self.fulldoc['citations'])
+        for remove in [[], ['v45'], ['v18'], ['v18', 'v30'], ['v18', 'v30', 'v53'],
+                       ['v18', 'v30', 'v53', 'v37']]:
+            sample = dict(every_tag)
+            for tag in remove:
+                del(sample[tag])
+            self.samples.append(sample)
+
+    def test_create_citation_types(self):
+        types = set()
+        for sample in self.samples:
+            citation = scielodocument.create_citation(sample)
+            types.add(type(citation))
+
+            self.assertTrue(isinstance(citation, Citation))
+            self.assertEqual(citation.publication_type, Citation(sample).publication_type)
+
+        self.assertEqual(types, set(scielodocument.CITATION_CLASSES.values()))
+
+    def test_specialized_accessors_match_citation(self):
+        for sample in self.samples:
+            specialized = scielodocument.create_citation(sample)
+            generic = Citation(sample)
+
+            for accessor in self.accessors:
+                self.assertEqual(
+                    getattr(specialized, accessor),
+                    getattr(generic, accessor),
+                    '%s: %s' % (specialized.publication_type, accessor)
+                )
+
+            self.assertEqual(specialized.title(), generic.title())
+
+    def test_article_citations_are_specialized(self):
+        article = Article(self.fulldoc)
+
+        for citation in article.citations:
+            self.assertTrue(
+                type(citation) is scielodocument.CITATION_CLASSES[citation.publication_type])
+
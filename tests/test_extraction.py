@@ -0,0 +1,131 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+
+from xylose import extraction
+from xylose.scielodocument import Article
+
+
+class ExtractionTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.article = Article(self.fulldoc)
+
+    def test_invalid_errors_mode(self):
+
+        with self.assertRaises(ValueError):
+            extraction.Extractor(['doi'], errors='xxx')
+
+    def test_extract(self):
+        extractor = extraction.Extractor(['publisher_id', 'original_title', 'volume'])
+
+        record = extractor.extract(self.article)
+
+        self.assertEqual(record['publisher_id'], self.article.publisher_id)
+        self.assertEqual(record['original_title'], self.article.original_title())
+        self.assertEqual(record['volume'], self.article.volume)
+        self.assertEqual(extractor.error_count, 0)
+
+    def test_extract_error_as_value(self):
+        del(self.fulldoc['article']['v65'])
+        extractor = extraction.Extractor(['publication_date', 'volume'])
+
+        record = extractor.extract(self.article)
+
+        self.assertTrue(extraction.is_error(record['publication_date']))
+        self.assertFalse(record['publication_date'])
+        self.assertTrue(isinstance(record['publication_date'].error, KeyError))
+        self.assertEqual(record['volume'], self.article.volume)
+        self.assertEqual(extractor.counters, {'publication_date': 1, 'volume': 0})
+
+    def test_extract_raise(self):
+        del(self.fulldoc['article']['v65'])
+        extractor = extraction.Extractor(['publication_date'], errors=extraction.RAISE)
+
+        with self.assertRaises(KeyError):
+            extractor.extract(self.article)
+
+    def test_extract_columns(self):
+        broken = Article(json.loads(json.dumps(self.fulldoc)))
+        del(broken.data['article']['v880'])
+        extractor = extraction.Extractor(['publisher_id', 'volume'])
+
+        columns = extractor.extract_columns([self.article, broken])
+
+        self.assertEqual(columns['volume'], [self.article.volume, self.article.volume])
+        self.assertEqual(columns['publisher_id'][0], self.article.publisher_id)
+        self.assertTrue(extraction.is_error(columns['publisher_id'][1]))
+        self.assertEqual(extractor.counters['publisher_id'], 1)
+
+        extractor.reset()
+
+        self.assertEqual(extractor.error_count, 0)
+
+    def test_extract_citations(self):
+        extractor = extraction.Extractor(extraction.CITATION_FIELDS)
+
+        records = list(extractor.extract_many(self.article.citations))
+
+        self.assertEqual(len(records), len(self.fulldoc['citations']))
+        self.assertEqual(records[0]['source'], self.article.citations[0].source)
+
+    def test_default_fields(self):
+        extractor = extraction.Extractor(extraction.ARTICLE_FIELDS)
+
+        extractor.extract(self.article)
+
+        self.assertEqual(extractor.error_count, 0)
+
+    def test_export(self):
+        exporter = extraction.Exporter()
+
+        record = exporter.export(self.article)
+
+        self.assertEqual(record['publisher_id'], self.article.publisher_id)
+        self.assertEqual(record['journal']['title'], self.article.journal.title)
+        self.assertEqual(len(record['citations']), len(self.article.citations))
+        self.assertEqual(sum(exporter.counters.values()), 0)
+
+    def test_export_without_citations(self):
+        exporter = extraction.Exporter(article_fields=['doi'], citation_fields=[])
+
+        record = exporter.export(self.article)
+
+        self.assertFalse('citations' in record)
+
+    def test_export_counters(self):
+        del(self.fulldoc['article']['v40'])
+        exporter = extraction.Exporter(journal_fields=['title'], citation_fields=['source'])
+
+        list(exporter.export_many([self.article]))
+
+        self.assertEqual(exporter.counters['original_language'], 1)
+        self.assertEqual(exporter.counters['journal.title'], 0)
+        self.assertEqual(exporter.counters['citations.source'], 0)
+
+    def test_export_malformed_sections(self):
+        self.fulldoc['citations'] = None
+        self.fulldoc['title'] = 1
+        exporter = extraction.Exporter()
+
+        record = exporter.export(Article(self.fulldoc))
+
+        self.assertTrue(extraction.is_error(record['citations']))
+        self.assertTrue(extraction.is_error(record['journal']))
+        self.assertEqual(record['publisher_id'], u'S2179-975X2011000300002')
+        self.assertEqual(exporter.counters['citations'], 1)
+        self.assertEqual(exporter.counters['journal'], 1)
+
+        exporter.reset()
+        self.assertEqual(exporter.counters['citations'], 0)
+
+    def test_export_malformed_sections_raise(self):
+        self.fulldoc['citations'] = None
+        exporter = extraction.Exporter(errors=extraction.RAISE)
+
+        with self.assertRaises(TypeError):
+            exporter.export(Article(self.fulldoc))
@@ -0,0 +1,171 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+
+from xylose import choices
+from xylose import filters
+from xylose import flat
+from xylose.filters import Field, compile_filter
+from xylose.scielodocument import Article
+
+
+class FiltersTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+
+    def _record(self, pid=u'S1', code=u'oa', date=u'20110900', collection=u'scl'):
+        data = json.loads(json.dumps(self.fulldoc))
+        data['article']['v880'] = [{u'_': pid}]
+        data['article']['v71'] = [{u'_': code}]
+        data['article']['v65'] = [{u'_': date}]
+        data['collection'] = collection
+
+        return data
+
+    def _line(self, data):
+        return json.dumps(data).encode('utf-8')
+
+    def test_fields_agree_with_article(self):
+        article = Article(self.fulldoc)
+
+        for name in ['publisher_id', 'document_type', 'collection_acronym', 'doi', 'volume', 'publication_date']:
+            self.assertEqual(filters.FIELDS[name][0](self.fulldoc), getattr(article, name))
+        self.assertEqual(filters.FIELDS['issn'][0](self.fulldoc), article.journal.scielo_issn)
+        self.assertEqual(filters.FIELDS['publication_year'][0](self.fulldoc), 2011)
+
+    def test_doi(self):
+        data = self._record()
+        data['doi'] = u'10.1590/S2179-975X2011000300002'
+
+        self.assertTrue(compile_filter(Field('doi') == u'10.1590/S2179-975X2011000300002')(data))
+
+    def test_unknown_field(self):
+
+        self.assertRaises(ValueError, Field, 'nothing')
+
+    def test_comparisons(self):
+        data = self._record()
+
+        self.assertTrue(compile_filter(Field('document_type') == u'research-article')(data))
+        self.assertFalse(compile_filter(Field('document_type') != u'research-article')(data))
+        self.assertTrue(compile_filter(Field('publication_year') >= 2011)(data))
+        self.assertFalse(compile_filter(Field('publication_year') > 2011)(data))
+        self.assertTrue(compile_filter(Field('publication_year') <= 2011)(data))
+        self.assertFalse(compile_filter(Field('publication_year') < 2011)(data))
+        self.assertTrue(compile_filter(Field('collection_acronym').isin([u'arg', u'scl']))(data))
+        self.assertTrue(compile_filter(Field('volume').exists())(data))
+        self.assertFalse(compile_filter(Field('doi').exists())(data))
+
+    def test_combinations(self):
+        research = Field('document_type') == u'research-article'
+        recent = Field('publication_year') >= 2010
+        scl = Field('collection_acronym') == u'scl'
+
+        selective = compile_filter(research & recent & scl)
+        self.assertTrue(selective(self._record()))
+        self.assertFalse(selective(self._record(code=u'ed')))
+        self.assertFalse(selective(self._record(date=u'20090900')))
+        self.assertFalse(selective(self._record(collection=u'arg')))
+
+        either = compile_filter(recent | scl)
+        self.assertTrue(either(self._record(date=u'20090900')))
+        self.assertFalse(either(self._record(date=u'20090900', collection=u'arg')))
+
+        self.assertTrue(compile_filter(~scl)(self._record(collection=u'arg')))
+
+    def test_missing_and_malformed_fields(self):
+        data = self._record()
+        del data['article']['v65']
+
+        self.assertFalse(compile_filter(Field('publication_year') >= 2010)(data))
+        self.assertTrue(compile_filter(~(Field('publication_year') >= 2010))(data))
+        self.assertFalse(compile_filter(Field('supplement_issue').exists())(data))
+        self.assertFalse(compile_filter(Field('publication_year') >= u'2010')(self._record()))
+
+    def test_default_document_type(self):
+        data = self._record()
+        del data['article']['v71']
+
+        expression = Field('document_type') == u'undefined'
+
+        self.assertTrue(compile_filter(expression)(data))
+        self.assertEqual(compile_filter(expression).required, [])
+
+    def test_flat_records(self):
+        expression = (Field('document_type') == u'research-article') & (Field('publication_year') >= 2010)
+
+        self.assertTrue(compile_filter(expression)(flat.flatten(self._record())))
+
+    def test_required(self):
+        expression = (
+            (Field('document_type').isin([u'case-report', u'editorial'])) &
+            (Field('publication_year') >= 2010) &
+            ((Field('collection_acronym') == u'scl') | (Field('collection_acronym') == u'arg'))
+        )
+
+        codes = sorted(
+            json.dumps(code).encode('ascii') for code, name in choices.article_types.items()
+            if name in (u'case-report', u'editorial')
+        )
+
+        self.assertTrue(b'"cr"' in codes and b'"ed"' in codes)
+        self.assertEqual(compile_filter(expression).required, [tuple(codes), (b'"arg"', b'"scl"')])
+
+    def test_required_not_possible(self):
+
+        self.assertEqual(compile_filter(~(Field('collection_acronym') == u'scl')).required, [])
+        self.assertEqual(compile_filter(Field('collection_acronym') == u'são').required, [])
+        self.assertEqual(
+            compile_filter((Field('collection_acronym') == u'scl') | (Field('publication_year') > 1)).required,
+            []
+        )
+
+    def test_doi_required(self):
+        selective = compile_filter(Field('doi') == u'10.1590/S1')
+
+        self.assertEqual(selective.required, [(b'"10.1590/S1"', b'"10.1590\\/S1"')])
+
+        lines = []
+        for doi in (u'10.1590/S1', u'10.1590/S2'):
+            data = self._record()
+            data['doi'] = doi
+            lines.append(self._line(data))
+        lines.append(lines[0].replace(b'10.1590/S1', b'10.1590\\/S1'))
+
+        records = list(selective.lines(lines))
+
+        self.assertEqual([record['doi'] for record in records], [u'10.1590/S1', u'10.1590/S1'])
+        self.assertEqual(selective.skipped, 1)
+        self.assertEqual(selective.parsed, 2)
+
+    def test_may_match(self):
+        selective = compile_filter((Field('collection_acronym') == u'scl') & (Field('document_type_code') == u'oa'))
+
+        self.assertTrue(selective.may_match(self._line(self._record())))
+        self.assertFalse(selective.may_match(self._line(self._record(collection=u'arg'))))
+        self.assertFalse(selective.may_match(self._line(self._record(code=u'ed'))))
+
+    def test_lines(self):
+        lines = [
+            self._line(self._record(u'S1')),
+            self._line(self._record(u'S2', collection=u'arg')),
+            self._line(self._record(u'S3', date=u'20050900')),
+            self._line(self._record(u'S4'))
+        ]
+        selective = compile_filter((Field('collection_acronym') == u'scl') & (Field('publication_year') >= 2010))
+
+        records = list(selective.lines(lines))
+
+        self.assertEqual([record['article']['v880'][0]['_'] for record in records], [u'S1', u'S4'])
+        self.assertEqual(selective.skipped, 1)
+        self.assertEqual(selective.parsed, 3)
+
+    def test_records(self):
+        selective = compile_filter(Field('publisher_id').isin([u'S2', u'S3']))
+        records = [self._record(u'S%d' % i) for i in range(5)]
+
+        self.assertEqual(len(list(selective.records(records))), 2)
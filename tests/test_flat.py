@@ -0,0 +1,144 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+import pickle
+
+from xylose import flat
+from xylose import schema
+from xylose.extraction import Exporter
+from xylose.scielodocument import (
+    Article, FlatArticle, FlatJournal, FLAT_CITATION_CLASSES, create_citation,
+    create_flat_citation)
+
+
+class FlatTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.flat = flat.flatten(json.loads(json.dumps(self.fulldoc)))
+
+    def test_flatten(self):
+
+        self.assertTrue(isinstance(self.flat, flat.FlatRecord))
+        self.assertTrue(flat.is_flat(self.flat['article']))
+        self.assertTrue(flat.is_flat(self.flat['title']))
+        self.assertTrue(isinstance(self.flat['citations'], tuple))
+        self.assertTrue(all(flat.is_flat(c) for c in self.flat['citations']))
+        self.assertTrue(flat.flatten(self.flat) is self.flat)
+        self.assertTrue(flat.flatten_section(self.flat['article']) is self.flat['article'])
+
+    def test_compact_values(self):
+        section = flat.flatten_section({
+            'v880': [{u'_': u'S1'}],
+            'v14': [{u'f': u'1', u'l': u'9'}],
+            'v10': [{u's': u'A', u'n': u'B'}, {u's': u'C'}],
+            'v40': [],
+            'v992': u'scl',
+            'v999': [u'a', u'b']
+        })
+
+        self.assertEqual(section.tags['v880'], u'S1')
+        self.assertTrue(isinstance(section.tags['v14'], flat.Subfields))
+        self.assertEqual(section.tags['v14'].get(u'l'), u'9')
+        self.assertEqual(section.tags['v14'].get(u'x', 0), 0)
+        self.assertTrue(isinstance(section.tags['v10'], flat.Occurrences))
+        self.assertEqual(len(section.tags['v10']), 2)
+        self.assertTrue(section.tags['v10'][0][0] is section.tags['v10'][0][0])
+        self.assertEqual(section.tags['v40'], flat.Occurrences())
+        self.assertEqual(section.tags['v992'], flat.Verbatim((u'scl',)))
+        self.assertEqual(section.tags['v999'], flat.Verbatim(([u'a', u'b'],)))
+
+    def test_subfield_positions_are_shared(self):
+        first = flat.flatten_section({'v14': [{u'f': u'1', u'l': u'9'}]})
+        second = flat.flatten_section({'v14': [{u'f': u'3', u'l': u'5'}]})
+
+        self.assertTrue(first.tags['v14'][0] is second.tags['v14'][0])
+        self.assertEqual(first.tags['v14'].raw(), {u'f': u'1', u'l': u'9'})
+
+    def test_raw_reads_are_cached(self):
+        section = self.flat['article']
+
+        self.assertTrue(section['v880'] is section['v880'])
+        self.assertTrue(section.get('v880') is section['v880'])
+        self.assertEqual(section.get('v9999', u'x'), u'x')
+        self.assertTrue(section.get('v9999') is None)
+        self.assertFalse('v9999' in section)
+
+    def test_raw_shape_is_kept(self):
+
+        self.assertEqual(self.flat.raw, self.fulldoc)
+        self.assertEqual(dict(self.flat['article']), self.fulldoc['article'])
+        self.assertEqual(self.flat['article']['v880'], self.fulldoc['article']['v880'])
+        self.assertEqual(self.flat['article'].raw, self.fulldoc['article'])
+        self.assertTrue('v880' in self.flat['article'])
+        self.assertEqual(len(self.flat['title']), len(self.fulldoc['title']))
+
+    def test_flat_extractors_agree_with_raw(self):
+        sections = [
+            (schema.ARTICLE, schema.article, schema.flat_article, [self.fulldoc['article']]),
+            (schema.JOURNAL, schema.journal, schema.flat_journal, [self.fulldoc['title']]),
+            (schema.CITATION, schema.citation, schema.flat_citation, self.fulldoc['citations'])
+        ]
+        edge_cases = [
+            {},
+            {'v14': [{u'f': u'1'}, {u'f': u'2', u'l': u'3'}], 'v40': [{u'_': u'en'}, {u'_': u'pt'}]},
+            {'v14': [], 'v880': [{u'x': u'S1'}], 'v441': [{u'x': u'A'}, {u'_': u'B'}]},
+            {'v992': u'scl', 'v880': [], 'v65': [{u'_': None}]}
+        ]
+
+        for descriptions, raw, flattened, records in sections:
+            for record in records + edge_cases:
+                section = flat.flatten_section(record)
+                for name in descriptions:
+                    try:
+                        expected = raw[name](record)
+                    except Exception as exc:
+                        self.assertRaises(type(exc), flattened[name], section)
+                    else:
+                        self.assertEqual(flattened[name](section), expected, name)
+
+    def test_article_accessors(self):
+        raw = Exporter().export(Article(self.fulldoc))
+        flattened = Exporter().export(FlatArticle(self.flat))
+
+        self.assertEqual(flattened, raw)
+
+    def test_article_iso_format(self):
+
+        self.assertEqual(
+            FlatArticle(self.flat, iso_format=u'iso 639-2').original_language(),
+            Article(self.fulldoc, iso_format=u'iso 639-2').original_language()
+        )
+
+    def test_classes(self):
+        article = FlatArticle(self.flat)
+
+        self.assertTrue(Article._extractors is schema.article)
+        self.assertTrue(FlatArticle._extractors is schema.flat_article)
+        self.assertTrue(isinstance(article.journal, FlatJournal))
+        self.assertTrue(article.journal._extractors is schema.flat_journal)
+        self.assertTrue(
+            all(type(c) in FLAT_CITATION_CLASSES.values() for c in article.citations))
+        self.assertTrue(article.citations[0]._extractors is schema.flat_citation)
+
+    def test_citations(self):
+        for raw, flattened in zip(self.fulldoc['citations'], self.flat['citations']):
+            raw = create_citation(raw)
+            flattened = create_flat_citation(flattened)
+
+            self.assertEqual(flattened.publication_type, raw.publication_type)
+            self.assertEqual(flattened.source, raw.source)
+            self.assertEqual(flattened.index_number, raw.index_number)
+            self.assertEqual(flattened.authors, raw.authors)
+
+    def test_pickle(self):
+        loaded = pickle.loads(pickle.dumps(self.flat))
+
+        self.assertTrue(isinstance(loaded, flat.FlatRecord))
+        self.assertTrue(flat.is_flat(loaded['article']))
+        self.assertEqual(loaded['article'].tags, self.flat['article'].tags)
+        self.assertEqual(loaded['article']._raw, {})
+        self.assertEqual(loaded.raw, self.fulldoc)
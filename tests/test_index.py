@@ -0,0 +1,109 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+import shutil
+import tempfile
+
+from xylose import index
+from xylose.scielodocument import Article
+
+
+class InvertedIndexTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        other = json.loads(json.dumps(self.fulldoc))
+        other['article']['v880'] = [{u'_': u'S0000-00002000000100001'}]
+        other['article']['v85'] = [{u'k': u'Exotic  Species', u'l': u'en'}]
+        other['article']['v12'] = [{u'l': u'es', u'_': u'Especies ex&oacute;ticas'}]
+        self.articles = [Article(self.fulldoc), Article(other)]
+        self.index = index.InvertedIndex.build(self.articles)
+
+    def test_normalize(self):
+
+        self.assertEqual(index.normalize(u' São  Paulo\tState '), u'sao paulo state')
+
+    def test_len(self):
+
+        self.assertEqual(len(self.index), 2)
+
+    def test_lookup_keyword(self):
+
+        self.assertEqual(
+            self.index.lookup(u'exotic species', language=u'en'),
+            [u'S2179-975X2011000300002', u'S0000-00002000000100001']
+        )
+
+    def test_lookup_keyword_normalized(self):
+
+        self.assertEqual(
+            self.index.lookup(u'Espécies Exóticas', language=u'pt'),
+            [u'S2179-975X2011000300002']
+        )
+
+    def test_lookup_keyword_other_language(self):
+
+        self.assertEqual(self.index.lookup(u'exotic species', language=u'pt'), [])
+
+    def test_lookup_keyword_any_language(self):
+
+        self.assertEqual(self.index.lookup(u'estado de sao paulo'), [u'S2179-975X2011000300002'])
+
+    def test_lookup_title(self):
+
+        self.assertEqual(
+            self.index.lookup(u'exoticas', language=u'es', field=index.TITLES),
+            [u'S0000-00002000000100001']
+        )
+        self.assertEqual(
+            self.index.lookup(u'misgurnus', field=index.TITLES),
+            [u'S2179-975X2011000300002']
+        )
+
+    def test_lookup_all(self):
+
+        self.assertEqual(
+            self.index.lookup_all([u'misgurnus', u'brasil'], field=index.TITLES),
+            [u'S2179-975X2011000300002']
+        )
+        self.assertEqual(
+            self.index.lookup_all([u'misgurnus', u'especies'], field=index.TITLES),
+            []
+        )
+
+    def test_lookup_invalid_field(self):
+
+        with self.assertRaises(ValueError):
+            self.index.lookup(u'x', field='xxx')
+
+    def test_languages(self):
+
+        self.assertEqual(self.index.languages(), [u'en', u'pt'])
+        self.assertEqual(self.index.languages(index.TITLES), [u'en', u'es', u'pt'])
+
+    def test_iso_format(self):
+        iso_index = index.InvertedIndex.build(self.articles, iso_format=u'iso 639-2')
+
+        self.assertEqual(len(iso_index.lookup(u'exotic species', language=u'eng')), 2)
+
+    def test_save_load(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, 'index.json.gz')
+            self.index.save(path)
+            loaded = index.InvertedIndex.load(path)
+        finally:
+            shutil.rmtree(tmp)
+
+        self.assertEqual(loaded.ids, self.index.ids)
+        self.assertEqual(
+            loaded.lookup(u'exotic species', language=u'en'),
+            self.index.lookup(u'exotic species', language=u'en')
+        )
+        self.assertEqual(
+            loaded.lookup(u'misgurnus', field=index.TITLES),
+            [u'S2179-975X2011000300002']
+        )
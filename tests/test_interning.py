@@ -0,0 +1,92 @@
+# coding: utf-8
+
+import unittest
+import io
+import json
+import os
+
+from xylose import interning
+from xylose import streams
+
+
+class InternTableTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+
+    def test_intern(self):
+        table = interning.InternTable(seed_choices=False)
+        first = u''.join([u'p', u't'])
+        second = u''.join([u'p', u't'])
+
+        self.assertTrue(table.intern(first) is first)
+        self.assertTrue(table.intern(second) is first)
+
+    def test_seed_choices(self):
+        table = interning.InternTable()
+
+        self.assertTrue(len(table) > 400)
+        self.assertTrue(table.intern(u''.join([u'research-', u'article'])) is table.table[u'research-article'])
+
+    def test_bounds(self):
+        table = interning.InternTable(max_size=1, max_length=3, seed_choices=False)
+
+        table.intern(u'abcd')
+        table.intern(u'abc')
+        table.intern(u'xyz')
+
+        self.assertEqual(list(table.table.keys()), [u'abc'])
+
+    def test_record(self):
+        table = interning.InternTable()
+        first = json.loads(json.dumps(self.fulldoc))
+        second = json.loads(json.dumps(self.fulldoc))
+
+        first = table.record(first)
+        second = table.record(second)
+
+        self.assertEqual(second, self.fulldoc)
+        self.assertTrue(first['article']['v40'][0]['_'] is second['article']['v40'][0]['_'])
+        self.assertTrue(first['title']['v100'][0]['_'] is second['title']['v100'][0]['_'])
+        self.assertTrue(list(first['article'].keys())[0] is list(second['article'].keys())[0])
+
+    def test_read_jsonlines_interning(self):
+        content = (json.dumps(self.fulldoc) + '\n') * 2
+        table = interning.InternTable()
+
+        records = list(streams.read_jsonlines(io.BytesIO(content.encode('utf-8')), intern=table))
+
+        self.assertEqual(records[0], self.fulldoc)
+        self.assertTrue(records[0]['collection'] is records[1]['collection'])
+
+    def test_read_jsonlines_default_table(self):
+        content = (json.dumps(self.fulldoc) + '\n') * 2
+
+        records = list(streams.read_jsonlines(io.BytesIO(content.encode('utf-8')), intern=True))
+
+        self.assertTrue(records[0]['article']['v40'][0]['_'] is records[1]['article']['v40'][0]['_'])
+
+    def test_unique_strings_are_not_interned(self):
+        table = interning.InternTable(seed_choices=False)
+
+        first = table.record(json.loads(json.dumps(self.fulldoc)))
+        second = table.record(json.loads(json.dumps(self.fulldoc)))
+
+        self.assertEqual(first, self.fulldoc)
+        self.assertFalse(first['article']['v12'][0]['_'] is second['article']['v12'][0]['_'])
+        self.assertFalse(first['article']['v10'][0]['s'] is second['article']['v10'][0]['s'])
+        self.assertTrue(first['article']['v12'][0]['l'] is second['article']['v12'][0]['l'])
+        self.assertTrue(first['article']['v71'][0]['_'] is second['article']['v71'][0]['_'])
+        self.assertTrue(first['collection'] is second['collection'])
+        self.assertTrue(list(first['citations'][0].keys())[0] is list(second['citations'][0].keys())[0])
+        self.assertFalse(first['article']['v12'][0]['_'] in table.table)
+
+    def test_read_jsonlines_empty_table(self):
+        content = (json.dumps(self.fulldoc) + '\n') * 2
+        table = interning.InternTable(seed_choices=False)
+
+        records = list(streams.read_jsonlines(io.BytesIO(content.encode('utf-8')), intern=table))
+
+        self.assertTrue(len(table) > 0)
+        self.assertTrue(records[0]['collection'] is records[1]['collection'])
@@ -0,0 +1,71 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+import shutil
+import tempfile
+
+from xylose import issn
+from xylose.scielodocument import Journal, Citation
+
+
+class ISSNResolverTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+
+        title = self.fulldoc['title']
+        title['v35'] = [{u'_': u'PRINT'}]
+        title['v935'] = [{u'_': u'0000-0001'}]
+        title['v400'] = [{u'_': u'2179-975X'}]
+
+        other = {
+            'v35': [{u'_': u'ONLIN'}],
+            'v400': [{u'_': u'1676-0603'}]
+        }
+
+        self.resolver = issn.ISSNResolver.build([Journal(title), Journal(other)])
+
+    def test_normalize(self):
+
+        self.assertEqual(issn.normalize(u' 2179975x'), u'2179-975X')
+        self.assertEqual(issn.normalize(u'2179-975X'), u'2179-975X')
+        self.assertEqual(issn.normalize(u'xxx'), None)
+        self.assertEqual(issn.normalize(None), None)
+
+    def test_resolve(self):
+
+        self.assertEqual(self.resolver.resolve(u'0000-0001'), u'2179-975X')
+        self.assertEqual(self.resolver.resolve(u'2179975x'), u'2179-975X')
+        self.assertEqual(self.resolver.resolve(u'1676-0603'), u'1676-0603')
+        self.assertEqual(self.resolver.resolve(u'9999-9999'), None)
+        self.assertEqual(len(self.resolver), 3)
+        self.assertTrue(u'00000001' in self.resolver)
+
+    def test_resolve_citation(self):
+        citations = [Citation(c) for c in self.fulldoc['citations']]
+
+        resolved = [self.resolver.resolve_citation(c) for c in citations]
+
+        self.assertEqual(resolved.count(u'1676-0603'), 2)
+
+    def test_conflicts(self):
+        self.resolver.add(Journal({'v35': [{u'_': u'PRINT'}], 'v400': [{u'_': u'0000-0001'}]}))
+
+        self.assertEqual(self.resolver.resolve(u'0000-0001'), u'2179-975X')
+        self.assertEqual(self.resolver.conflicts, [(u'0000-0001', u'2179-975X', u'0000-0001')])
+
+    def test_save_load(self):
+        self.resolver.add(Journal({'v35': [{u'_': u'PRINT'}], 'v400': [{u'_': u'0000-0001'}]}))
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, 'issn.json')
+            self.resolver.save(path)
+            loaded = issn.ISSNResolver.load(path)
+        finally:
+            shutil.rmtree(tmp)
+
+        self.assertEqual(loaded.table, self.resolver.table)
+        self.assertEqual(loaded.conflicts, self.resolver.conflicts)
@@ -0,0 +1,136 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+
+from xylose import issues
+from xylose.scielodocument import Article
+
+
+class IssuesTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+
+    def _article(self, pid, start_page=None, collection=u'scl'):
+        data = json.loads(json.dumps(self.fulldoc))
+        data['article']['v880'] = [{u'_': pid}]
+        data['collection'] = collection
+        if start_page is None:
+            del data['article']['v14']
+        else:
+            data['article']['v14'] = [{u'f': start_page, u'l': u'999'}]
+
+        return Article(data)
+
+    def test_issue_pid(self):
+
+        self.assertEqual(issues.issue_pid(Article(self.fulldoc)), u'S2179-975X20110003')
+
+    def test_page_key(self):
+        keys = [
+            issues.page_key(self._article(u'S2179-975X2011000300001', u'e123')),
+            issues.page_key(self._article(u'S2179-975X2011000300002', u'21')),
+            issues.page_key(self._article(u'S2179-975X2011000300003'))
+        ]
+
+        self.assertEqual(keys[0][:2], (0, 123))
+        self.assertEqual(keys[1][:2], (0, 21))
+        self.assertEqual(keys[2][:2], (1, 0))
+
+    def test_articles_ordered_by_numeric_start_page(self):
+        issue = issues.Issue(u'S2179-975X20110003')
+        issue.add(self._article(u'S2179-975X2011000300001', u'100'))
+        issue.add(self._article(u'S2179-975X2011000300002', u'9'))
+        issue.add(self._article(u'S2179-975X2011000300003'))
+        issue.add(self._article(u'S2179-975X2011000300004', u'21'))
+
+        self.assertEqual(
+            [article.start_page for article in issue.articles],
+            [u'9', u'21', u'100', None]
+        )
+
+    def test_duplicates_replaced(self):
+        issue = issues.Issue(u'S2179-975X20110003')
+        issue.add(self._article(u'S2179-975X2011000300001', u'100'))
+        issue.add(self._article(u'S2179-975X2011000300001', u'5'))
+
+        self.assertEqual(len(issue), 1)
+        self.assertEqual(issue.articles[0].start_page, u'5')
+        self.assertTrue(u'S2179-975X2011000300001' in issue)
+
+    def test_issue_metadata(self):
+        issue = issues.Issue(u'S2179-975X20110003', u'scl')
+        issue.add(Article(self.fulldoc))
+
+        self.assertEqual(issue.volume, u'23')
+        self.assertEqual(issue.issue, u'3')
+        self.assertEqual(issue.publication_date, u'2011-09')
+        self.assertEqual(issue.journal.scielo_issn, u'2179-975X')
+        self.assertEqual(issue.url(), Article(self.fulldoc).issue_url())
+
+    def test_table_of_contents(self):
+        issue = issues.Issue(u'S2179-975X20110003')
+        issue.add(Article(self.fulldoc))
+
+        toc = issue.table_of_contents()
+
+        self.assertEqual(toc[0]['publisher_id'], u'S2179-975X2011000300002')
+        self.assertEqual(toc[0]['start_page'], Article(self.fulldoc).start_page)
+        self.assertEqual(toc[0]['title'], Article(self.fulldoc).original_title())
+
+    def test_grouper(self):
+        grouper = issues.IssueGrouper()
+        grouper.add_many([
+            self._article(u'S2179-975X2011000300002', u'20'),
+            self._article(u'S2179-975X2011000400001', u'1'),
+            self._article(u'S2179-975X2011000300001', u'10'),
+            self._article(u'S2179-975X2011000300001', u'10', collection=u'arg')
+        ])
+
+        self.assertEqual(len(grouper), 3)
+        issue = grouper.get(u'S2179-975X20110003', u'scl')
+        self.assertEqual(
+            [article.publisher_id for article in issue],
+            [u'S2179-975X2011000300001', u'S2179-975X2011000300002']
+        )
+        self.assertEqual(len(grouper.get(u'S2179-975X20110003', u'arg')), 1)
+
+    def test_group_issues(self):
+        articles = [
+            self._article(u'S2179-975X2011000300002', u'20'),
+            self._article(u'S2179-975X2011000400001', u'1'),
+            self._article(u'S2179-975X2011000300001', u'10')
+        ]
+
+        grouped = list(issues.group_issues(articles))
+
+        self.assertEqual([issue.pid for issue in grouped], [u'S2179-975X20110003', u'S2179-975X20110004'])
+        self.assertEqual([len(issue) for issue in grouped], [2, 1])
+
+    def test_group_issues_ordered(self):
+        articles = [
+            self._article(u'S2179-975X2011000300002', u'20'),
+            self._article(u'S2179-975X2011000300001', u'10'),
+            self._article(u'S2179-975X2011000400001', u'1')
+        ]
+        consumed = []
+
+        def stream():
+            for article in articles:
+                consumed.append(article)
+                yield article
+
+        grouped = issues.group_issues(stream(), ordered=True)
+        first = next(grouped)
+
+        self.assertEqual(first.pid, u'S2179-975X20110003')
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(consumed), 3)
+        self.assertEqual([issue.pid for issue in grouped], [u'S2179-975X20110004'])
+
+    def test_group_issues_empty(self):
+
+        self.assertEqual(list(issues.group_issues([], ordered=True)), [])
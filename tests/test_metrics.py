@@ -0,0 +1,124 @@
+# coding: utf-8
+
+import unittest
+import json
+import threading
+
+from xylose import metrics
+
+
+class HistogramTests(unittest.TestCase):
+
+    def test_observe(self):
+        histogram = metrics.Histogram()
+
+        for seconds in [0.0000005, 0.000003, 0.000003, 0.5]:
+            histogram.observe(seconds)
+
+        result = histogram.to_dict()
+
+        self.assertEqual(result['count'], 4)
+        self.assertEqual(result['min'], 0.0000005)
+        self.assertEqual(result['max'], 0.5)
+        self.assertEqual(result['p50'], 4e-6)
+        self.assertEqual(sum(result['buckets'].values()), 4)
+
+    def test_empty(self):
+
+        self.assertEqual(metrics.Histogram().quantile(0.5), None)
+
+    def test_overflow_bucket(self):
+        histogram = metrics.Histogram()
+        histogram.observe(100.0)
+
+        self.assertEqual(histogram.quantile(0.99), 100.0)
+        self.assertEqual(histogram.to_dict()['buckets'], {'inf': 1})
+
+
+class MetricsTests(unittest.TestCase):
+
+    def test_snapshot(self):
+        pipeline = metrics.Metrics()
+
+        with pipeline.stage('parse'):
+            pass
+        pipeline.observe('extract', 0.001)
+        pipeline.record(size=100)
+        pipeline.record(size=50)
+        pipeline.error('unreadable')
+        pipeline.error('field', 3)
+
+        snapshot = pipeline.snapshot()
+
+        self.assertEqual(snapshot['records'], 2)
+        self.assertEqual(snapshot['bytes'], 150)
+        self.assertEqual(snapshot['errors'], {'unreadable': 1, 'field': 3})
+        self.assertEqual(sorted(snapshot['stages'].keys()), ['extract', 'parse'])
+        self.assertTrue(snapshot['records_per_second'] > 0)
+        self.assertEqual(json.loads(pipeline.to_json())['records'], 2)
+
+    def test_callback(self):
+        snapshots = []
+        pipeline = metrics.Metrics(callback=snapshots.append, interval=0)
+
+        pipeline.record()
+        pipeline.record()
+        pipeline.close()
+
+        self.assertEqual([s['records'] for s in snapshots], [1, 2, 2])
+
+    def test_callback_interval(self):
+        snapshots = []
+        pipeline = metrics.Metrics(callback=snapshots.append, interval=3600)
+
+        pipeline.record()
+
+        self.assertEqual(snapshots, [])
+
+    def test_threads(self):
+        pipeline = metrics.Metrics()
+
+        def update():
+            for i in range(10000):
+                with pipeline.stage('read'):
+                    pipeline.record(size=1, count=0)
+                pipeline.record()
+                pipeline.error('field')
+
+        threads = [threading.Thread(target=update) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = pipeline.snapshot()
+        self.assertEqual(snapshot['records'], 40000)
+        self.assertEqual(snapshot['bytes'], 40000)
+        self.assertEqual(snapshot['errors'], {'field': 40000})
+        self.assertEqual(snapshot['stages']['read']['count'], 40000)
+
+    def test_null_metrics(self):
+        pipeline = metrics.NULL_METRICS
+
+        with pipeline.stage('parse'):
+            pipeline.record(size=10)
+            pipeline.error('field')
+
+        pipeline.dump('unused.json')
+
+        self.assertFalse(pipeline.enabled)
+        self.assertEqual(pipeline.snapshot(), {})
+
+    def test_stage_recorder(self):
+        recorder = metrics.StageRecorder()
+
+        with recorder.stage('parse'):
+            recorder.record()
+        recorder.observe('extract', 0.5)
+
+        timings = recorder.drain()
+
+        self.assertEqual([name for name, seconds in timings], ['parse', 'extract'])
+        self.assertEqual(timings[1][1], 0.5)
+        self.assertEqual(recorder.drain(), [])
+        self.assertEqual(recorder.snapshot(), {})
@@ -0,0 +1,88 @@
+# coding: utf-8
+
+import unittest
+
+from xylose import schema
+
+
+class SchemaTests(unittest.TestCase):
+
+    def test_field_invalid_cardinality(self):
+
+        with self.assertRaises(ValueError):
+            schema.field('v10', cardinality='xxx')
+
+    def test_field_invalid_transform(self):
+
+        with self.assertRaises(ValueError):
+            schema.field('v10', transform='xxx')
+
+    def test_single_field(self):
+        extractor = schema.compile_field(schema.field('v31'))
+
+        self.assertEqual(extractor({'v31': [{'_': u'10'}, {'_': u'11'}]}), u'10')
+
+    def test_single_field_without_tag(self):
+        extractor = schema.compile_field(schema.field('v31'))
+
+        self.assertEqual(extractor({}), None)
+
+    def test_single_field_without_subfield(self):
+        extractor = schema.compile_field(schema.field('v14', subfield='f'))
+
+        self.assertEqual(extractor({'v14': [{'l': u'10'}]}), None)
+
+    def test_required_field_without_tag(self):
+        extractor = schema.compile_field(schema.field('v880', required=True))
+
+        with self.assertRaises(KeyError):
+            extractor({})
+
+    def test_multiple_field(self):
+        extractor = schema.compile_field(
+            schema.field('v441', cardinality=schema.MULTIPLE))
+
+        self.assertEqual(extractor({'v441': [{'_': u'A'}, {'_': u'B'}]}), [u'A', u'B'])
+
+    def test_multiple_field_without_tag(self):
+        extractor = schema.compile_field(
+            schema.field('v441', cardinality=schema.MULTIPLE))
+
+        self.assertEqual(extractor({}), None)
+
+    def test_date_transform(self):
+        extractor = schema.compile_field(schema.field('v65', transform='date'))
+
+        self.assertEqual(extractor({'v65': [{'_': u'20120102'}]}), u'2012-01-02')
+
+    def test_html_transform(self):
+        extractor = schema.compile_field(schema.field('v12', transform='html'))
+
+        self.assertEqual(extractor({'v12': [{'_': u'a &amp; b'}]}), u'a & b')
+
+    def test_language_transform(self):
+        extractor = schema.compile_field(schema.field('v40', transform='language'))
+
+        self.assertEqual(extractor({'v40': [{'_': u'pt'}]}), u'pt')
+        self.assertEqual(extractor({'v40': [{'_': u'pt'}]}, u'iso 639-2'), u'por')
+
+    def test_callable_transform(self):
+        extractor = schema.compile_field(
+            schema.field('v68', transform=lambda value: value.upper()))
+
+        self.assertEqual(extractor({'v68': [{'_': u'rbo'}]}), u'RBO')
+
+    def test_compile_schema(self):
+        extractors = schema.compile_schema({
+            'volume': schema.field('v31'),
+            'issue': schema.field('v32')
+        })
+
+        self.assertEqual(sorted(extractors.keys()), ['issue', 'volume'])
+        self.assertEqual(extractors['issue']({'v32': [{'_': u'3'}]}), u'3')
+
+    def test_compiled_schemas(self):
+
+        self.assertEqual(sorted(schema.article.keys()), sorted(schema.ARTICLE.keys()))
+        self.assertEqual(sorted(schema.journal.keys()), sorted(schema.JOURNAL.keys()))
+        self.assertEqual(sorted(schema.citation.keys()), sorted(schema.CITATION.keys()))
@@ -0,0 +1,100 @@
+# coding: utf-8
+
+import unittest
+import io
+import json
+import os
+import shutil
+import tempfile
+
+from xylose import streams
+from xylose.extraction import Exporter, FieldError
+from xylose.filters import Field, compile_filter
+from xylose.scielodocument import Article
+
+
+class StreamsTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_get_backend(self):
+        backend = streams.get_backend()
+
+        self.assertTrue(backend.name in streams.BACKENDS)
+        self.assertEqual(backend.loads(backend.dumps({u'a': [1]})), {u'a': [1]})
+
+    def test_get_backend_json(self):
+        backend = streams.get_backend('json')
+
+        self.assertEqual(backend.dumps({u'a': u'São'}), u'{"a":"São"}'.encode('utf-8'))
+
+    def test_get_backend_invalid(self):
+
+        with self.assertRaises(ValueError):
+            streams.get_backend('xxx')
+
+    def test_field_error_as_null(self):
+        backend = streams.get_backend()
+
+        dumped = backend.dumps({u'a': FieldError('a', KeyError('v65'))})
+
+        self.assertEqual(backend.loads(dumped), {u'a': None})
+
+    def test_write_read_file_object(self):
+        output = io.BytesIO()
+
+        with streams.JSONLinesWriter(output, buffer_size=10) as writer:
+            writer.write_many([{u'a': 1}, {u'b': 2}])
+
+        self.assertEqual(writer.count, 2)
+        self.assertEqual(writer.bytes_written, len(output.getvalue()))
+        self.assertEqual(
+            list(streams.read_jsonlines(io.BytesIO(output.getvalue() + b'\n'))),
+            [{u'a': 1}, {u'b': 2}]
+        )
+
+    def test_write_read_gzip(self):
+        path = os.path.join(self.tmp, 'records.jsonl.gz')
+
+        for backend in ('json', None):
+            with streams.JSONLinesWriter(path, backend=backend) as writer:
+                writer.write(self.fulldoc)
+
+            self.assertEqual(list(streams.read_jsonlines(path, backend=backend)), [self.fulldoc])
+
+    def test_write_articles(self):
+        path = os.path.join(self.tmp, 'articles.jsonl')
+        article = Article(self.fulldoc)
+
+        count = streams.write_articles([article, article], path)
+
+        records = list(streams.read_jsonlines(path))
+        self.assertEqual(count, 2)
+        self.assertEqual(records[0], json.loads(json.dumps(Exporter().export(article))))
+
+    def test_write_articles_with_errors(self):
+        path = os.path.join(self.tmp, 'articles.jsonl')
+        del(self.fulldoc['article']['v65'])
+        exporter = Exporter(article_fields=['publication_date'], citation_fields=[], journal_fields=[])
+
+        streams.write_articles([Article(self.fulldoc)], path, exporter=exporter)
+
+        self.assertEqual(list(streams.read_jsonlines(path)), [{u'publication_date': None}])
+        self.assertEqual(exporter.counters['publication_date'], 1)
+
+    def test_read_jsonlines_where(self):
+        path = os.path.join(self.tmp, 'records.jsonl')
+        other = json.loads(json.dumps(self.fulldoc))
+        other['collection'] = u'arg'
+        with streams.JSONLinesWriter(path) as writer:
+            writer.write_many([self.fulldoc, other, self.fulldoc])
+
+        where = compile_filter(Field('collection_acronym') == u'arg')
+
+        self.assertEqual(list(streams.read_jsonlines(path, where=where)), [other])
@@ -0,0 +1,108 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+
+from xylose import extraction
+from xylose import tables
+from xylose.scielodocument import Article
+
+
+class ColumnChunksTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.article = Article(self.fulldoc)
+
+    def test_article_chunks(self):
+        chunks = list(tables.column_chunks([self.article] * 3, chunk_size=2))
+
+        self.assertEqual(len(chunks), 2)
+        names, values = chunks[0]
+        self.assertEqual(names, [c[0] for c in tables.ARTICLE_COLUMNS])
+        self.assertEqual(values[0], [self.article.publisher_id] * 2)
+        self.assertEqual(values[names.index('citations')], [18, 18])
+        self.assertEqual(len(chunks[1][1][0]), 1)
+
+    def test_errors_are_nulls(self):
+        del(self.fulldoc['article']['v65'])
+
+        names, values = next(tables.column_chunks([self.article]))
+
+        self.assertEqual(values[names.index('publication_date')], [None])
+
+    def test_columns_use_extraction_fields(self):
+        for name, field, type_name in tables.ARTICLE_COLUMNS:
+            if field.startswith('journal.'):
+                self.assertTrue(field[8:] in extraction.JOURNAL_FIELDS)
+            elif field != 'data':
+                self.assertTrue(field in extraction.ARTICLE_FIELDS)
+
+        for name, field, type_name in tables.CITATION_COLUMNS:
+            self.assertTrue(field in extraction.CITATION_FIELDS)
+
+    def test_citation_chunks(self):
+        chunks = list(tables.column_chunks([self.article, self.article], chunk_size=10, citations=True))
+
+        self.assertEqual(len(chunks), 4)
+        names, values = chunks[0]
+        self.assertEqual(names[0], 'article_publisher_id')
+        self.assertEqual(values[0], [self.article.publisher_id] * 10)
+        self.assertEqual(values[names.index('index_number')][0:2], [1, 2])
+
+
+@unittest.skipIf(tables.pyarrow is None, 'pyarrow not available')
+class RecordBatchesTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.article = Article(self.fulldoc)
+
+    def test_record_batches_schema(self):
+        batches = list(tables.record_batches([self.article] * 3, chunk_size=2))
+
+        self.assertEqual([b.num_rows for b in batches], [2, 1])
+        self.assertTrue(batches[0].schema.equals(batches[1].schema))
+        self.assertTrue(batches[0].schema.equals(tables.schema(tables.ARTICLE_COLUMNS)))
+
+    def test_null_chunks_keep_schema(self):
+        del(self.fulldoc['article']['v65'])
+
+        batch = next(tables.record_batches([self.article]))
+
+        self.assertTrue(batch.schema.equals(tables.schema(tables.ARTICLE_COLUMNS)))
+        self.assertEqual(batch.column(batch.schema.get_field_index('publication_date')).null_count, 1)
+
+    def test_table_citations(self):
+        result = tables.table([self.article], chunk_size=5, citations=True)
+
+        self.assertEqual(result.num_rows, 18)
+        self.assertEqual(str(result.schema.field('index_number').type), 'int32')
+
+
+@unittest.skipIf(tables.pandas is None, 'pandas not available')
+class DataFramesTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.article = Article(self.fulldoc)
+
+    def test_data_frames(self):
+        frames = list(tables.data_frames([self.article] * 3, chunk_size=2))
+
+        self.assertEqual([len(f) for f in frames], [2, 1])
+        self.assertEqual(list(frames[0].columns), [c[0] for c in tables.ARTICLE_COLUMNS])
+        self.assertEqual(frames[0]['publisher_id'][0], self.article.publisher_id)
+
+    def test_data_frames_without_pyarrow(self):
+        pyarrow, tables.pyarrow = tables.pyarrow, None
+        try:
+            frames = list(tables.data_frames([self.article], citations=True))
+        finally:
+            tables.pyarrow = pyarrow
+
+        self.assertEqual(len(frames[0]), 18)
@@ -0,0 +1,105 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+
+from xylose import validator
+from xylose.scielodocument import Article
+
+
+class ValidatorTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+
+    def test_valid_record(self):
+        self.assertEqual(validator.validate(self.fulldoc), [])
+
+        article = Article(self.fulldoc)
+
+        article.publication_date
+        article.processing_date
+        article.publisher_id
+        article.original_language()
+        for citation in article.citations:
+            citation.source
+            citation.date
+            citation.title()
+
+    def test_invalid_citations(self):
+        self.fulldoc['citations'][0]['v30'] = {u'_': u'Journal'}
+        self.fulldoc['citations'][2]['v12'] = []
+        self.fulldoc['citations'].append(u'citation')
+
+        errors = validator.validate(self.fulldoc)
+
+        self.assertEqual(
+            errors,
+            ['citations.0.v30:not-list', 'citations.2.v12:empty', 'citations.18:not-dict']
+        )
+
+    def test_missing_required_tags(self):
+        del(self.fulldoc['article']['v65'])
+        del(self.fulldoc['article']['v880'])
+
+        errors = validator.validate(self.fulldoc)
+
+        self.assertEqual(errors, ['article.v65:missing', 'article.v880:missing'])
+
+    def test_missing_required_subfield(self):
+        self.fulldoc['article']['v40'] = [{u'l': u'pt'}]
+
+        errors = validator.validate(self.fulldoc)
+
+        self.assertEqual(errors, ['article.v40:missing-subfield'])
+
+    def test_wrong_shapes(self):
+        self.fulldoc['article']['v31'] = u'10'
+        self.fulldoc['article']['v32'] = []
+        self.fulldoc['title']['v100'] = [u'Title']
+
+        errors = validator.validate(self.fulldoc)
+
+        self.assertEqual(
+            errors,
+            ['article.v31:not-list', 'article.v32:empty', 'title.v100:not-dict']
+        )
+
+    def test_missing_sections(self):
+
+        errors = validator.validate({'citations': {}})
+
+        self.assertEqual(errors, ['article:missing', 'title:missing', 'citations:not-list'])
+
+    def test_not_dict(self):
+
+        self.assertEqual(validator.validate([]), [':not-dict'])
+
+    def test_validate_records(self):
+        invalid = json.loads(json.dumps(self.fulldoc))
+        del(invalid['article']['v91'])
+
+        reports = list(validator.validate_records([self.fulldoc, invalid]))
+
+        self.assertEqual(
+            reports,
+            [(1, u'S2179-975X2011000300002', ['article.v91:missing'])]
+        )
+
+    def test_validate_records_all(self):
+
+        reports = list(validator.validate_records([self.fulldoc], only_invalid=False))
+
+        self.assertEqual(reports, [(0, u'S2179-975X2011000300002', [])])
+
+    def test_validate_records_in_parallel(self):
+        invalid = json.loads(json.dumps(self.fulldoc))
+        del(invalid['article']['v40'])
+
+        records = [self.fulldoc, invalid, self.fulldoc, invalid]
+        reports = list(validator.validate_records(records, processes=2, chunksize=1))
+
+        self.assertEqual([i[0] for i in reports], [1, 3])
+        self.assertEqual(reports[0][2], ['article.v40:missing'])
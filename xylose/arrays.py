@@ -0,0 +1,155 @@
+# encoding: utf-8
+"""
+NumPy export of numeric and categorical article fields.
+
+The articles are streamed into preallocated NumPy buffers that grow by doubling,
+so no intermediate list of Python objects is kept. Categorical fields are
+dictionary encoded into small integers, the codebooks (CODEBOOKS) are drawn
+from choices.article_types and choices.collections. Missing or unknown values
+are encoded as -1 (0 for the month).
+
+NumPy is an optional dependency, it is required only when an ArrayExporter is
+created.
+"""
+from . import choices
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+DTYPES = [
+    ('year', 'int16'),
+    ('month', 'int8'),
+    ('citations', 'int32'),
+    ('authors', 'int32'),
+    ('page_span', 'int32'),
+    ('document_type', 'int8'),
+    ('collection', 'int8')
+]
+
+CODEBOOKS = {
+    'document_type': sorted(set(choices.article_types.values())),
+    'collection': sorted(choices.collections.keys())
+}
+
+_CODES = dict(
+    (field, dict((value, code) for code, value in enumerate(values)))
+    for field, values in CODEBOOKS.items()
+)
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _page_span(article):
+    start = _int(article.start_page)
+    end = _int(article.end_page)
+
+    if start is None or end is None or end < start:
+        return -1
+
+    return end - start + 1
+
+
+def _date(article):
+    try:
+        date = article.publication_date
+    except KeyError:
+        return -1, 0
+
+    year = _int(date[0:4])
+    month = _int(date[5:7])
+
+    return (-1 if year is None else year), (month or 0)
+
+
+def values(article):
+    """
+    Retrieve the exported values of the given article, in the DTYPES order.
+    The citations and authors are counted on the raw record.
+    """
+    year, month = _date(article)
+
+    return (
+        year,
+        month,
+        len(article.data.get('citations') or []),
+        len(article.data['article'].get('v10') or []),
+        _page_span(article),
+        _CODES['document_type'].get(article.document_type, -1),
+        _CODES['collection'].get(article.collection_acronym, -1)
+    )
+
+
+class ArrayExporter(object):
+
+    def __init__(self, capacity=1024):
+        """
+        Create an exporter with buffers for the given number of articles, the
+        buffers grow as needed.
+        """
+        if numpy is None:
+            raise ImportError('ArrayExporter requires numpy')
+
+        self._size = 0
+        self._buffers = [numpy.empty(max(capacity, 1), dtype=dtype) for name, dtype in DTYPES]
+
+    def __len__(self):
+        return self._size
+
+    def _grow(self):
+        for position, buffer in enumerate(self._buffers):
+            grown = numpy.empty(max(len(buffer) * 2, 1), dtype=buffer.dtype)
+            grown[:self._size] = buffer[:self._size]
+            self._buffers[position] = grown
+
+    def trim(self):
+        """
+        This method shrinks the buffers to the number of exported articles,
+        in place. The buffers grow again when more articles are added.
+        """
+        for buffer in self._buffers:
+            buffer.resize(self._size, refcheck=False)
+
+    def add(self, article):
+        if self._size == len(self._buffers[0]):
+            self._grow()
+
+        for buffer, value in zip(self._buffers, values(article)):
+            buffer[self._size] = value
+
+        self._size += 1
+
+    def extend(self, articles):
+        for article in articles:
+            self.add(article)
+
+    def arrays(self):
+        """
+        Retrieve a dict of field name to NumPy array with the exported
+        articles. The arrays are copies, trimmed to the number of articles,
+        so they are not changed by articles added later.
+        """
+        return dict(
+            (name, buffer[:self._size].copy())
+            for (name, dtype), buffer in zip(DTYPES, self._buffers)
+        )
+
+
+def export_arrays(articles, capacity=1024):
+    """
+    Export a stream of articles, retrieving a tuple of (arrays, codebooks).
+    The buffers are trimmed in place and handed over, without copies.
+    """
+    exporter = ArrayExporter(capacity=capacity)
+    exporter.extend(articles)
+    exporter.trim()
+
+    return dict(
+        (name, buffer) for (name, dtype), buffer in zip(DTYPES, exporter._buffers)
+    ), CODEBOOKS
@@ -0,0 +1,180 @@
+# encoding: utf-8
+"""
+In memory cache of Article objects keyed by publisher_id.
+
+ArticleCache keeps up to max_size articles, evicting the least recently used
+first, and optionally expires articles ttl seconds after they were stored.
+Cached articles keep their memoized journal, citations and scielo domain, so
+hot documents are built once and reused across requests. The cache is safe to
+share between threads.
+"""
+from collections import OrderedDict
+import threading
+import time
+
+from .scielodocument import Article
+
+
+class ArticleCache(object):
+
+    def __init__(self, max_size=1024, ttl=None, loader=None, iso_format=None,
+                 clock=time.time):
+        """
+        Create an article cache.
+
+        Keyword arguments:
+        max_size -- maximum number of articles kept.
+        ttl -- seconds an article stays valid after being stored, None to
+        never expire.
+        loader -- callable receiving a publisher_id and returning the raw
+        record, an Article or None when the article does not exist. Used by get
+        on cache misses.
+        iso_format -- the language iso format of the Articles built from the
+        records returned by the loader.
+        clock -- callable returning the current time in seconds.
+        """
+        if max_size < 1:
+            raise ValueError('max_size must be a positive number ({0})'.format(max_size))
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.loader = loader
+        self.iso_format = iso_format
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, pid):
+        with self._lock:
+            return self._lookup(pid) is not None
+
+    def _lookup(self, pid):
+        # Must be called holding the lock.
+        entry = self._entries.get(pid)
+
+        if entry is None:
+            return None
+
+        article, expires = entry
+        if expires is not None and expires <= self.clock():
+            del self._entries[pid]
+            self.expirations += 1
+            return None
+
+        return article
+
+    def _touch(self, pid):
+        # Must be called holding the lock. OrderedDict.move_to_end does not
+        # exist in python 2.7.
+        self._entries[pid] = self._entries.pop(pid)
+
+    def _store(self, pid, article):
+        # Must be called holding the lock.
+        expires = self.clock() + self.ttl if self.ttl is not None else None
+
+        self._entries.pop(pid, None)
+        self._entries[pid] = (article, expires)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _article(self, loaded):
+        if loaded is None or isinstance(loaded, Article):
+            return loaded
+
+        return Article(loaded, iso_format=self.iso_format)
+
+    def get(self, pid, loader=None):
+        """
+        This method retrieves the cached article of the given publisher_id.
+        On a miss the article is loaded with the given loader, or the cache
+        loader, and stored. None is returned when there is no loader or the
+        loader does not find the article.
+
+        The loader runs outside the lock, concurrent misses of the same
+        publisher_id may load it more than once, the last one is kept.
+        """
+        with self._lock:
+            article = self._lookup(pid)
+
+            if article is not None:
+                self._touch(pid)
+                self.hits += 1
+                return article
+
+            self.misses += 1
+
+        loader = loader or self.loader
+        if loader is None:
+            return None
+
+        article = self._article(loader(pid))
+        if article is None:
+            return None
+
+        with self._lock:
+            self._store(pid, article)
+
+        return article
+
+    def put(self, article):
+        """
+        This method stores the given Article, or raw record, keyed by its
+        publisher_id and returns the Article.
+        """
+        article = self._article(article)
+        pid = article.publisher_id
+
+        with self._lock:
+            self._store(pid, article)
+
+        return article
+
+    def invalidate(self, pid):
+        """
+        This method removes the article of the given publisher_id, returning
+        True when it was cached.
+        """
+        with self._lock:
+            return self._entries.pop(pid, None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def reset(self):
+        """
+        This method resets the statistics.
+        """
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    def stats(self):
+        """
+        This method retrieves a dict with the size and the hit, miss, eviction
+        and expiration counters of the cache.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': float(self.hits) / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
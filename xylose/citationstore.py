@@ -0,0 +1,275 @@
+# encoding: utf-8
+"""
+Compact columnar storage of citations.
+
+Instead of keeping the raw citations (dicts of lists of dicts) of a corpus,
+every (tag, occurrence, subfield, value) entry of every citation is stored in
+parallel arrays of small integers. Tag and subfield names are interned in a
+small table of their own, values and article ids in a string table addressed
+by 32 bits ids, and the entries of each citation are addressed by an offsets
+array.
+
+Citations are queried by column (see column and find) without building dicts,
+or through Citation objects (see citation) reading a read-only view of the
+stored entries.
+"""
+from array import array
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # python 2.7
+    from collections import Mapping
+
+from .scielodocument import Article, CITATION_CLASSES, citation_publication_type
+
+PUBLICATION_TYPES = (u'article', u'book', u'thesis', u'conference', u'link', u'undefined')
+_TYPE_CODES = dict((name, code) for code, name in enumerate(PUBLICATION_TYPES))
+
+
+class StringTable(object):
+    """
+    Interned strings addressed by integer ids.
+    """
+
+    def __init__(self):
+        self.strings = []
+        self.ids = {}
+
+    def __len__(self):
+        return len(self.strings)
+
+    def intern(self, string):
+        string_id = self.ids.get(string)
+
+        if string_id is None:
+            string_id = self.ids[string] = len(self.strings)
+            self.strings.append(string)
+
+        return string_id
+
+    def get(self, string):
+        return self.ids.get(string)
+
+
+class CitationView(Mapping):
+    """
+    Read-only raw citation (tag: list of occurrences) backed by the entries
+    of a CitationStore. The occurrences of each tag are built when the tag is
+    read.
+    """
+
+    __slots__ = ('store', 'index', '_tags')
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+        self._tags = None
+
+    def _entries(self):
+        return range(self.store.offsets[self.index], self.store.offsets[self.index + 1])
+
+    def _tag_ids(self):
+        if self._tags is None:
+            tags = self.store.tags
+            self._tags = set(tags[entry] for entry in self._entries())
+
+        return self._tags
+
+    def __contains__(self, tag):
+        tag_id = self.store.names.get(tag)
+
+        return tag_id is not None and tag_id in self._tag_ids()
+
+    def __getitem__(self, tag):
+        store = self.store
+        tag_id = store.names.get(tag)
+
+        occurrences = []
+        if tag_id is not None:
+            names = store.names.strings
+            strings = store.strings.strings
+            for entry in self._entries():
+                if store.tags[entry] != tag_id:
+                    continue
+
+                occurrence = store.occurrences[entry]
+                while len(occurrences) <= occurrence:
+                    occurrences.append({})
+
+                occurrences[occurrence][names[store.subfields[entry]]] = strings[store.values[entry]]
+
+        if not occurrences:
+            raise KeyError(tag)
+
+        return occurrences
+
+    def __iter__(self):
+        names = self.store.names.strings
+        for tag_id in sorted(self._tag_ids()):
+            yield names[tag_id]
+
+    def __len__(self):
+        return len(self._tag_ids())
+
+
+class CitationStore(object):
+
+    def __init__(self):
+        self.names = StringTable()
+        self.strings = StringTable()
+        self.offsets = array('I', [0])
+        self.articles = array('I')
+        self.types = array('B')
+        self.tags = array('H')
+        self.occurrences = array('H')
+        self.subfields = array('H')
+        self.values = array('I')
+
+    @classmethod
+    def build(cls, articles):
+        """
+        Create a store with the citations of the given Articles or raw article
+        records.
+        """
+        store = cls()
+
+        for article in articles:
+            store.add_article(article)
+
+        return store
+
+    def __len__(self):
+        return len(self.types)
+
+    def add_article(self, article):
+        data = article.data if isinstance(article, Article) else article
+
+        try:
+            article_id = data['article']['v880'][0]['_']
+        except (KeyError, IndexError):
+            article_id = None
+
+        for citation in data.get('citations') or []:
+            self.add(citation, article_id)
+
+    def add(self, citation, article_id=None):
+        """
+        Store the given raw citation, retrieving its position in the store.
+        """
+        name = self.names.intern
+        intern = self.strings.intern
+
+        for tag, occurrences in citation.items():
+            tag_id = name(tag)
+            for occurrence, subfields in enumerate(occurrences):
+                for subfield, value in subfields.items():
+                    self.tags.append(tag_id)
+                    self.occurrences.append(occurrence)
+                    self.subfields.append(name(subfield))
+                    self.values.append(intern(value))
+
+        self.offsets.append(len(self.tags))
+        self.articles.append(intern(article_id))
+        self.types.append(_TYPE_CODES[citation_publication_type(citation)])
+
+        return len(self.types) - 1
+
+    def article_id(self, index):
+        """
+        Retrieve the publisher id of the article citing the citation at the
+        given position.
+        """
+        return self.strings.strings[self.articles[index]]
+
+    def publication_type(self, index):
+        return PUBLICATION_TYPES[self.types[index]]
+
+    def raw(self, index):
+        """
+        Rebuild the raw citation at the given position.
+        """
+        names = self.names.strings
+        strings = self.strings.strings
+        data = {}
+
+        for entry in range(self.offsets[index], self.offsets[index + 1]):
+            occurrences = data.setdefault(names[self.tags[entry]], [])
+            occurrence = self.occurrences[entry]
+
+            while len(occurrences) <= occurrence:
+                occurrences.append({})
+
+            occurrences[occurrence][names[self.subfields[entry]]] = strings[self.values[entry]]
+
+        return data
+
+    def view(self, index):
+        """
+        Retrieve a read-only view (see CitationView) of the raw citation at
+        the given position.
+        """
+        return CitationView(self, index)
+
+    def citation(self, index):
+        """
+        Retrieve a Citation object (specialized by publication type) reading a
+        view of the citation at the given position.
+        """
+        return CITATION_CLASSES[PUBLICATION_TYPES[self.types[index]]](self.view(index))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.citation(index)
+
+    def _entry(self, index, tag_id, subfield_id):
+        for entry in range(self.offsets[index], self.offsets[index + 1]):
+            if (self.tags[entry] == tag_id and self.subfields[entry] == subfield_id and
+                    self.occurrences[entry] == 0):
+                return entry
+
+    def column(self, tag, subfield='_'):
+        """
+        Retrieve a list with the value of the first occurrence of the given
+        tag and subfield of each citation, None when it does not exist.
+        """
+        tag_id = self.names.get(tag)
+        subfield_id = self.names.get(subfield)
+
+        if tag_id is None or subfield_id is None:
+            return [None] * len(self)
+
+        strings = self.strings.strings
+        column = []
+        for index in range(len(self)):
+            entry = self._entry(index, tag_id, subfield_id)
+            column.append(None if entry is None else strings[self.values[entry]])
+
+        return column
+
+    def find(self, tag, value, subfield='_', publication_type=None):
+        """
+        Retrieve the positions of the citations having the given value in any
+        occurrence of the given tag and subfield, optionally restricted to a
+        publication type.
+        """
+        tag_id = self.names.get(tag)
+        subfield_id = self.names.get(subfield)
+        value_id = self.strings.get(value)
+
+        if tag_id is None or subfield_id is None or value_id is None:
+            return []
+
+        type_code = None if publication_type is None else _TYPE_CODES[publication_type]
+        found = []
+        index = 0
+        for entry in range(len(self.values)):
+            while entry >= self.offsets[index + 1]:
+                index += 1
+
+            if (self.values[entry] == value_id and self.tags[entry] == tag_id and
+                    self.subfields[entry] == subfield_id and
+                    (type_code is None or self.types[index] == type_code) and
+                    (not found or found[-1] != index)):
+                found.append(index)
+
+        return found
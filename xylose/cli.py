@@ -0,0 +1,420 @@
+# encoding: utf-8
+"""
+Command line bulk extractor.
+
+Reads ISIS2JSON article dumps (JSON lines, one article per line) from files,
+glob patterns or the standard input, optionally compressed with gzip or bzip2,
+and writes the extracted fields or the full normalized record (see
+xylose.extraction.Exporter) as JSON lines or CSV.
+
+With --cache the extracted records are kept in a SQLite database (see
+xylose.diskcache) and reused in the next runs for the unchanged articles. The
+entries are keyed by the raw lines, so they are not shared with
+xylose.diskcache.CachedExporter, even in the same database.
+
+Usage examples:
+    xylose 'dumps/*.jsonl.gz' --processes 4 --output articles.jsonl.gz
+    cat dump.jsonl | xylose --fields publisher_id,doi,publication_date --format csv
+    xylose 'dumps/*.jsonl.gz' --cache extraction.db --output articles.jsonl.gz
+"""
+import argparse
+import csv
+import glob
+import io
+import json
+from multiprocessing import Pool
+import sys
+import time
+
+from . import diskcache
+from . import extraction
+from . import metrics as pipeline_metrics
+from . import streams
+from .scielodocument import Article, allowed_formats
+
+_state = {}
+
+
+def _exporter(fields):
+    if fields:
+        return extraction.Exporter(article_fields=fields, journal_fields=[], citation_fields=[])
+
+    return extraction.Exporter()
+
+
+def _setup(fields, iso_format, backend, cache=None, decode=True,
+           metrics=pipeline_metrics.NULL_METRICS):
+    """
+    Prepare the extraction state of the current process.
+    """
+    _state['exporter'] = _exporter(fields)
+    _state['iso_format'] = iso_format
+    _state['loads'] = streams.get_backend(backend).loads
+    _state['metrics'] = metrics
+
+    if cache is not None:
+        _state['cache'] = diskcache.ExtractionCache(cache, backend=backend)
+        _state['namespace'] = diskcache.namespace(
+            _state['exporter'], iso_format, diskcache.LINE_KEYS)
+        _state['decode'] = decode
+
+
+def _load(line):
+    """
+    Parse a raw JSON line, retrieving the record or None for unreadable lines
+    (invalid JSON or values other than objects).
+    """
+    try:
+        with _state['metrics'].stage('parse'):
+            data = _state['loads'](line)
+    except ValueError:
+        return None
+
+    if not isinstance(data, dict):
+        return None
+
+    return data
+
+
+def _extract(line):
+    """
+    Extract a record from a raw JSON line, retrieving a tuple of
+    (record or None for unreadable lines, number of field errors).
+    """
+    exporter = _state['exporter']
+    metrics = _state['metrics']
+    before = sum(exporter.counters.values())
+
+    data = _load(line)
+    if data is None:
+        return None, 0
+
+    with metrics.stage('construct'):
+        article = Article(data, iso_format=_state['iso_format'])
+
+    with metrics.stage('extract'):
+        record = exporter.export(article)
+
+    return record, sum(exporter.counters.values()) - before
+
+
+def _extract_batch(lines):
+    """
+    Extract the records of the given raw JSON lines, reusing the cached ones,
+    retrieving a list of tuples of (record or None for unreadable lines,
+    number of field errors, cache item to store or None). Cached records are
+    retrieved as encoded JSON when they are written as JSON lines.
+    """
+    exporter = _state['exporter']
+    metrics = _state['metrics']
+
+    with metrics.stage('cache'):
+        digests = [diskcache.record_hash(line.strip()) for line in lines]
+        cached = _state['cache'].get_many(digests, _state['namespace'], decode=_state['decode'])
+
+    results = []
+    for line, digest in zip(lines, digests):
+        if digest in cached:
+            record, errors = cached[digest]
+            results.append((record, errors, None))
+            continue
+
+        data = _load(line)
+        if data is None:
+            results.append((None, 0, None))
+            continue
+
+        before = sum(exporter.counters.values())
+
+        with metrics.stage('construct'):
+            article = Article(data, iso_format=_state['iso_format'])
+
+        with metrics.stage('extract'):
+            record = exporter.export(article)
+
+        errors = sum(exporter.counters.values()) - before
+        results.append((record, errors, (diskcache.record_pid(data), digest, record, errors)))
+
+    return results
+
+
+def _extract_timed(line):
+    # Extraction in worker processes, with the recorded stage latencies.
+    return _extract(line), _state['metrics'].drain()
+
+
+def _extract_batch_timed(lines):
+    return _extract_batch(lines), _state['metrics'].drain()
+
+
+def _observed(results, metrics):
+    """
+    Register the stage latencies of the results of worker processes in the
+    given metrics, yielding the results.
+    """
+    for result, timings in results:
+        for name, seconds in timings:
+            metrics.observe(name, seconds)
+
+        yield result
+
+
+def _batches(lines, size):
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def expand_inputs(inputs):
+    """
+    Expand the glob patterns of the given inputs, keeping '-' and the paths
+    without matches (reported as errors when opened).
+    """
+    paths = []
+    for item in inputs:
+        if item == '-':
+            paths.append(item)
+            continue
+
+        matches = sorted(glob.glob(item))
+        paths.extend(matches or [item])
+
+    return paths
+
+
+class _Reader(object):
+    """
+    Iterates over the non blank lines of the given inputs, counting the read
+    bytes.
+    """
+
+    def __init__(self, paths, metrics=pipeline_metrics.NULL_METRICS):
+        self.paths = paths
+        self.metrics = metrics
+        self.bytes_read = 0
+
+    def __iter__(self):
+        for path in self.paths:
+            stream, owned = streams.open_stream(path, 'rb')
+            try:
+                if self.metrics.enabled:
+                    lines = self._timed(stream)
+                else:
+                    lines = stream
+
+                for line in lines:
+                    self.bytes_read += len(line)
+                    if line.strip():
+                        yield line
+            finally:
+                if owned:
+                    stream.close()
+
+    def _timed(self, stream):
+        # Line iteration can not be timed, each line is read by readline.
+        metrics = self.metrics
+        while True:
+            with metrics.stage('read'):
+                line = stream.readline()
+
+            if not line:
+                return
+
+            metrics.record(size=len(line), count=0)
+            yield line
+
+
+def _csv_value(value, dumps):
+    if value is None or isinstance(value, extraction.FieldError):
+        return u''
+
+    if isinstance(value, (list, dict)):
+        return dumps(value).decode('utf-8')
+
+    return value
+
+
+class _CSVWriter(object):
+
+    def __init__(self, target, fields, backend):
+        binary, self._owned = streams.open_stream(target, 'wb')
+        self._binary = binary
+        self._text = io.TextIOWrapper(binary, encoding='utf-8', newline='')
+        self._writer = csv.writer(self._text)
+        self._fields = fields
+        self._dumps = streams.get_backend(backend).dumps
+        self._writer.writerow(fields)
+
+    def write(self, record):
+        self._writer.writerow([_csv_value(record.get(field), self._dumps) for field in self._fields])
+
+    def close(self):
+        self._text.flush()
+        if self._owned:
+            self._text.close()
+        else:
+            self._text.detach()
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog='xylose', description='Bulk extraction of SciELO ISIS2JSON article dumps.')
+    parser.add_argument(
+        'inputs', nargs='*', default=['-'],
+        help="JSON lines dumps, glob patterns or '-' for the standard input (default)")
+    parser.add_argument(
+        '--fields', default=None,
+        help='comma separated article fields, the full normalized record when omitted')
+    parser.add_argument('--format', choices=['jsonl', 'csv'], default='jsonl')
+    parser.add_argument('--output', default='-', help="output path or '-' for the standard output")
+    parser.add_argument('--processes', type=int, default=1, help='number of worker processes')
+    parser.add_argument('--chunksize', type=int, default=200, help='records sent to each worker at once')
+    parser.add_argument('--iso-format', default=None, choices=[f for f in allowed_formats if f])
+    parser.add_argument('--json-backend', default=None, choices=streams.BACKENDS)
+    parser.add_argument('--quiet', action='store_true', help='do not report the throughput')
+    parser.add_argument(
+        '--metrics', default=None,
+        help='write the pipeline metrics (throughput, stage latencies, errors) as JSON to this path')
+    parser.add_argument(
+        '--metrics-interval', type=float, default=None,
+        help='write the pipeline metrics as JSON lines to the standard error every N seconds')
+    parser.add_argument(
+        '--cache', default=None,
+        help='SQLite database path to reuse the records extracted in previous runs')
+    parser.add_argument(
+        '--cache-size', type=float, default=None,
+        help='maximum size in MB of the records kept in the cache')
+
+    return parser
+
+
+def _stored(batches, cache, namespace):
+    """
+    Store the new records of the given extracted batches in the cache,
+    yielding (record, number of field errors) tuples.
+    """
+    for batch in batches:
+        cache.put_many([item for record, errors, item in batch if item is not None], namespace)
+
+        for record, errors, item in batch:
+            yield record, errors
+
+
+def main(argv=None):
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    fields = [f.strip() for f in args.fields.split(',') if f.strip()] if args.fields else None
+
+    unknown = [f for f in fields or [] if not f in extraction.ARTICLE_FIELDS]
+    if unknown:
+        parser.error('unknown fields: %s' % ', '.join(unknown))
+
+    if args.format == 'csv':
+        writer = _CSVWriter(args.output, fields or extraction.ARTICLE_FIELDS, args.json_backend)
+    else:
+        writer = streams.JSONLinesWriter(args.output, backend=args.json_backend)
+
+    metrics = pipeline_metrics.NULL_METRICS
+    if args.metrics or args.metrics_interval is not None:
+        push = None
+        if args.metrics_interval is not None:
+            push = lambda snapshot: sys.stderr.write(json.dumps(snapshot, sort_keys=True) + '\n')
+        metrics = pipeline_metrics.Metrics(callback=push, interval=args.metrics_interval or 0)
+
+    reader = _Reader(expand_inputs(args.inputs), metrics)
+    # Cached records are written as they are stored when the output is JSON
+    # lines.
+    decode = args.format != 'jsonl'
+    setup = (fields, args.iso_format, args.json_backend, args.cache, decode)
+
+    cache = None
+    if args.cache:
+        max_bytes = int(args.cache_size * 1e6) if args.cache_size is not None else None
+        cache = diskcache.ExtractionCache(args.cache, max_bytes=max_bytes, backend=args.json_backend)
+        namespace = diskcache.namespace(
+            _exporter(fields), args.iso_format, diskcache.LINE_KEYS)
+
+    started = time.time()
+    records = unreadable = field_errors = 0
+
+    pool = None
+    if args.processes > 1 and metrics.enabled:
+        # The workers record the stage latencies (parse, construct, extract
+        # and cache) and send them with the results.
+        pool = Pool(args.processes, initializer=_setup,
+                    initargs=setup + (pipeline_metrics.StageRecorder(),))
+        if cache is None:
+            results = pool.imap(_extract_timed, reader, args.chunksize)
+        else:
+            results = pool.imap(_extract_batch_timed, _batches(reader, args.chunksize))
+        results = _observed(results, metrics)
+    elif args.processes > 1:
+        pool = Pool(args.processes, initializer=_setup, initargs=setup)
+        if cache is None:
+            results = pool.imap(_extract, reader, args.chunksize)
+        else:
+            results = pool.imap(_extract_batch, _batches(reader, args.chunksize))
+    else:
+        _setup(fields, args.iso_format, args.json_backend, metrics=metrics)
+        if cache is None:
+            results = (_extract(line) for line in reader)
+        else:
+            _state['cache'] = cache
+            _state['namespace'] = namespace
+            _state['decode'] = decode
+            results = (_extract_batch(batch) for batch in _batches(reader, args.chunksize))
+
+    if cache is not None:
+        results = _stored(results, cache, namespace)
+
+    try:
+        for record, errors in results:
+            if record is None:
+                unreadable += 1
+                metrics.error('unreadable')
+                continue
+
+            with metrics.stage('write'):
+                if isinstance(record, bytes):
+                    writer.write_encoded(record)
+                else:
+                    writer.write(record)
+            records += 1
+            field_errors += errors
+            metrics.record()
+            if errors:
+                metrics.error('field', errors)
+    finally:
+        writer.close()
+        if pool is not None:
+            pool.close()
+            pool.join()
+        if cache is not None:
+            cache.close()
+
+    if args.metrics:
+        metrics.dump(args.metrics)
+    metrics.close()
+
+    elapsed = max(time.time() - started, 1e-9)
+
+    if not args.quiet:
+        sys.stderr.write(
+            '%d records, %d unreadable lines, %d field errors in %.2fs '
+            '(%.1f records/s, %.2f MB/s)\n' % (
+                records, unreadable, field_errors, elapsed,
+                records / elapsed, reader.bytes_read / elapsed / 1e6
+            )
+        )
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+# encoding: utf-8
+"""
+Corpus of raw ISIS2JSON records stored in shared memory.
+
+The records are serialized as JSON into a single multiprocessing.shared_memory
+block with an offset table, so worker processes attach to the block by name
+and build Article, Journal or Citation objects on demand, instead of receiving
+pickled raw dicts.
+
+Block layout (unsigned 64 bits integers, native byte order):
+    count | offsets[0] ... offsets[count] | serialized records
+"""
+import json
+import struct
+import sys
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # python < 3.8
+    shared_memory = None
+
+try:
+    from multiprocessing import resource_tracker
+except ImportError:  # python < 3.8 or platforms without it
+    resource_tracker = None
+
+from .scielodocument import Article, Journal, create_citation
+
+_WORD = struct.calcsize('Q')
+
+
+def _serialize(record):
+    return json.dumps(record, separators=(',', ':')).encode('utf-8')
+
+
+class SharedCorpus(object):
+
+    def __init__(self, memory, owner=False):
+        """
+        Create a corpus over an existing shared memory block, see the create and
+        attach methods.
+        """
+        self._memory = memory
+        self._owner = owner
+        self._count = struct.unpack_from('Q', memory.buf, 0)[0]
+        self._data_start = _WORD * (self._count + 2)
+
+    @classmethod
+    def create(cls, records, name=None):
+        """
+        Serialize the given raw records into a new shared memory block. The
+        created corpus owns the block, see unlink.
+        """
+        if shared_memory is None:
+            raise RuntimeError('SharedCorpus requires multiprocessing.shared_memory (python 3.8+)')
+
+        chunks = [_serialize(record) for record in records]
+
+        offsets = [0]
+        for chunk in chunks:
+            offsets.append(offsets[-1] + len(chunk))
+
+        header = struct.pack('%dQ' % (len(offsets) + 1), len(chunks), *offsets)
+        memory = shared_memory.SharedMemory(
+            name=name, create=True, size=max(len(header) + offsets[-1], 1))
+
+        memory.buf[0:len(header)] = header
+        position = len(header)
+        for chunk in chunks:
+            memory.buf[position:position + len(chunk)] = chunk
+            position += len(chunk)
+
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Attach to the shared memory block created by another process. The
+        block is not registered in the resource tracker of the current
+        process, which would destroy it when the process exits.
+        """
+        if shared_memory is None:
+            raise RuntimeError('SharedCorpus requires multiprocessing.shared_memory (python 3.8+)')
+
+        if sys.version_info >= (3, 13):
+            return cls(shared_memory.SharedMemory(name=name, track=False))
+
+        memory = shared_memory.SharedMemory(name=name)
+        if resource_tracker is not None and not sys.platform.startswith('win'):
+            resource_tracker.unregister(memory._name, 'shared_memory')
+
+        return cls(memory)
+
+    @property
+    def name(self):
+        return self._memory.name
+
+    def __len__(self):
+        return self._count
+
+    def __reduce__(self):
+        # Pickling sends only the block name, the receiver attaches to it.
+        return (SharedCorpus.attach, (self.name,))
+
+    def raw_bytes(self, index):
+        """
+        Retrieve the serialized record at the given position.
+        """
+        if index < 0:
+            index += self._count
+
+        if not 0 <= index < self._count:
+            raise IndexError('corpus index out of range')
+
+        start, end = struct.unpack_from('QQ', self._memory.buf, _WORD * (index + 1))
+
+        return bytes(self._memory.buf[self._data_start + start:self._data_start + end])
+
+    def raw(self, index):
+        """
+        Retrieve the raw record (dict) at the given position.
+        """
+        return json.loads(self.raw_bytes(index).decode('utf-8'))
+
+    def __getitem__(self, index):
+        return self.raw(index)
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self.raw(index)
+
+    def article(self, index, iso_format=None):
+        return Article(self.raw(index), iso_format=iso_format)
+
+    def journal(self, index, iso_format=None):
+        return Journal(self.raw(index), iso_format=iso_format)
+
+    def citation(self, index):
+        return create_citation(self.raw(index))
+
+    def close(self):
+        """
+        Release the block in the current process.
+        """
+        self._memory.close()
+
+    def unlink(self):
+        """
+        Destroy the block, only the corpus that created it should call this
+        method, after all the processes closed it.
+        """
+        self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        if self._owner:
+            self.unlink()
@@ -0,0 +1,384 @@
+# encoding: utf-8
+"""
+SQLite export of articles, journals and citations for local querying.
+
+SQLiteExporter streams articles into a normalized schema: journals (one row
+per ISSN), articles, and the article languages, keywords, authors and
+citations in separate tables referencing the article by (collection, pid).
+Rows are inserted in batches with executemany, one transaction per batch,
+and the indexes (ISSN, year, document type, language, DOI) are built after
+the load. Exporting into an existing database appends to it: articles
+already exported are replaced with their rows in the dependent tables. The
+article indexes of the dependent tables are built the first time rows are
+replaced, so the replaced rows are found without scanning the tables.
+
+The values are read with xylose.extraction, missing values and accessors
+raising exceptions are stored as NULLs.
+"""
+from collections import OrderedDict
+import sqlite3
+
+from .extraction import Extractor, null_values
+
+
+def _year(date):
+    try:
+        return int(date[0:4])
+    except (TypeError, ValueError):
+        return None
+
+
+def _joined(values):
+    return u'|'.join(values) if values else None
+
+
+# (column, field, SQL type). The fields are names of the extraction field
+# lists, journal fields of articles are prefixed with 'journal.'.
+JOURNAL_COLUMNS = [
+    ('issn', 'scielo_issn', 'TEXT PRIMARY KEY'),
+    ('print_issn', 'print_issn', 'TEXT'),
+    ('electronic_issn', 'electronic_issn', 'TEXT'),
+    ('collection', 'collection_acronym', 'TEXT'),
+    ('title', 'title', 'TEXT'),
+    ('abbreviated_title', 'abbreviated_title', 'TEXT'),
+    ('publisher_name', 'publisher_name', 'TEXT'),
+    ('subject_areas', 'subject_areas', 'TEXT')
+]
+
+ARTICLE_COLUMNS = [
+    ('collection', 'collection_acronym', 'TEXT NOT NULL'),
+    ('pid', 'publisher_id', 'TEXT NOT NULL'),
+    ('issn', 'journal.scielo_issn', 'TEXT'),
+    ('document_type', 'document_type', 'TEXT'),
+    ('doi', 'doi', 'TEXT'),
+    ('original_language', 'original_language', 'TEXT'),
+    ('original_title', 'original_title', 'TEXT'),
+    ('publication_date', 'publication_date', 'TEXT'),
+    ('year', 'publication_date', 'INTEGER'),
+    ('volume', 'volume', 'TEXT'),
+    ('issue', 'issue', 'TEXT'),
+    ('start_page', 'start_page', 'TEXT'),
+    ('end_page', 'end_page', 'TEXT')
+]
+
+CITATION_COLUMNS = [
+    ('index_number', 'index_number', 'INTEGER'),
+    ('publication_type', 'publication_type', 'TEXT'),
+    ('source', 'source', 'TEXT'),
+    ('title', 'title', 'TEXT'),
+    ('date', 'date', 'TEXT'),
+    ('year', 'date', 'INTEGER'),
+    ('volume', 'volume', 'TEXT'),
+    ('issue', 'issue', 'TEXT'),
+    ('start_page', 'start_page', 'TEXT'),
+    ('issn', 'issn', 'TEXT'),
+    ('isbn', 'isbn', 'TEXT'),
+    ('doi', 'doi', 'TEXT')
+]
+
+# column: function converting the extracted field value
+_CONVERTERS = {
+    'year': _year,
+    'subject_areas': _joined
+}
+
+# Article fields read for the dependent tables and the journals.
+_ARTICLE_FIELDS = ['languages', 'keywords', 'authors', 'citations', 'journal']
+
+_DEPENDENT_TABLES = {
+    'article_languages': ['language'],
+    'keywords': ['language', 'keyword'],
+    'authors': ['position', 'surname', 'given_names'],
+    'citations': [name for name, field, sql_type in CITATION_COLUMNS]
+}
+
+_ARTICLE_KEY = ['collection', 'pid']
+
+INDEXES = [
+    ('articles_issn', 'articles', ['issn']),
+    ('articles_year', 'articles', ['year']),
+    ('articles_document_type', 'articles', ['document_type']),
+    ('articles_doi', 'articles', ['doi']),
+    ('article_languages_language', 'article_languages', ['language']),
+    ('article_languages_article', 'article_languages', ['collection', 'pid']),
+    ('keywords_keyword', 'keywords', ['keyword']),
+    ('keywords_article', 'keywords', ['collection', 'pid']),
+    ('authors_surname', 'authors', ['surname']),
+    ('authors_article', 'authors', ['collection', 'pid']),
+    ('citations_article', 'citations', ['collection', 'pid']),
+    ('citations_doi', 'citations', ['doi']),
+    ('citations_issn', 'citations', ['issn'])
+]
+
+
+def _extract(documents, columns, fields=()):
+    """
+    Retrieve a dict of field: list of values of the given documents for the
+    fields of the given columns and the given fields, None in place of the
+    values of accessors raising exceptions.
+    """
+    names = []
+    for field in [field for name, field, sql_type in columns] + list(fields):
+        if not field in names:
+            names.append(field)
+
+    extractor = Extractor(names)
+    extracted = extractor.extract_columns(documents)
+
+    for field in names:
+        if extractor.counters[field]:
+            extracted[field] = null_values(extracted[field])
+
+    return extracted
+
+
+def _rows(columns, extracted):
+    """
+    Retrieve the rows of the given columns from the extracted values.
+    """
+    values = []
+    for name, field, sql_type in columns:
+        column = extracted[field]
+        if name in _CONVERTERS:
+            column = [_CONVERTERS[name](value) for value in column]
+        values.append(column)
+
+    return list(zip(*values))
+
+
+def _create_table(name, columns, constraint=None):
+    definitions = [' '.join(column) for column in columns]
+    if constraint:
+        definitions.append(constraint)
+
+    return 'CREATE TABLE IF NOT EXISTS %s (%s)' % (name, ', '.join(definitions))
+
+
+def schema():
+    """
+    Retrieve the SQL statements creating the tables.
+    """
+    article_key = [('collection', 'TEXT NOT NULL'), ('pid', 'TEXT NOT NULL')]
+
+    statements = [
+        _create_table('journals', [(name, sql_type) for name, field, sql_type in JOURNAL_COLUMNS]),
+        _create_table(
+            'articles', [(name, sql_type) for name, field, sql_type in ARTICLE_COLUMNS],
+            'PRIMARY KEY (collection, pid)'),
+        _create_table('article_languages', article_key + [('language', 'TEXT')]),
+        _create_table('keywords', article_key + [('language', 'TEXT'), ('keyword', 'TEXT')]),
+        _create_table(
+            'authors', article_key + [
+                ('position', 'INTEGER'), ('surname', 'TEXT'), ('given_names', 'TEXT')]),
+        _create_table(
+            'citations', article_key + [
+                (name, sql_type) for name, field, sql_type in CITATION_COLUMNS])
+    ]
+
+    return statements
+
+
+def _insert(table, size, verb='INSERT'):
+    return '%s INTO %s VALUES (%s)' % (verb, table, ', '.join(['?'] * size))
+
+
+class SQLiteExporter(object):
+
+    def __init__(self, path, batch_size=1000, rebuild_indexes=False):
+        """
+        Open, or create, the database at the given path.
+
+        Keyword arguments:
+        batch_size -- articles inserted in each transaction.
+        rebuild_indexes -- drop the indexes of an existing database and build
+        them again on close, faster for large appends. The indexes of new
+        databases are built on close.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.count = 0
+        self.skipped = 0
+        self._connection = sqlite3.connect(path, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode = WAL')
+        self._connection.execute('PRAGMA synchronous = OFF')
+
+        for statement in schema():
+            self._connection.execute(statement)
+
+        self._appending = self._connection.execute(
+            'SELECT 1 FROM articles LIMIT 1').fetchone() is not None
+        self._build_indexes = rebuild_indexes or not self._appending
+
+        if self._appending and rebuild_indexes:
+            # The article indexes of the dependent tables are kept, they are
+            # used to replace the rows of articles exported again.
+            for name, table, columns in INDEXES:
+                if columns != _ARTICLE_KEY:
+                    self._connection.execute('DROP INDEX IF EXISTS %s' % name)
+
+        self._key_indexes = False
+        self._journals = set()
+        self._seen = set()
+        self._batch = []
+
+    def _tables(self, documents):
+        """
+        Retrieve the keys of the given articles, the last occurrence of
+        repeated articles only, a dict of table: rows of these articles and
+        the number of articles skipped.
+        """
+        extracted = _extract(documents, ARTICLE_COLUMNS, _ARTICLE_FIELDS)
+
+        # The last occurrence of articles repeated in the batch is kept.
+        positions = OrderedDict()
+        skipped = 0
+        for position, key in enumerate(zip(extracted['collection_acronym'], extracted['publisher_id'])):
+            if None in key:
+                skipped += 1
+                continue
+            positions.pop(key, None)
+            positions[key] = position
+
+        article_rows = _rows(ARTICLE_COLUMNS, extracted)
+        tables = dict((table, []) for table in _DEPENDENT_TABLES)
+        tables['articles'] = []
+        cited = []
+        journals = []
+
+        for key, position in positions.items():
+            tables['articles'].append(article_rows[position])
+
+            languages = set(extracted['languages'][position] or [])
+            original = extracted['original_language'][position]
+            if original:
+                languages.add(original)
+            tables['article_languages'].extend(key + (language,) for language in sorted(languages))
+
+            keywords = extracted['keywords'][position] or {}
+            tables['keywords'].extend(
+                key + (language, keyword)
+                for language, items in sorted(keywords.items()) for keyword in items
+            )
+
+            tables['authors'].extend(
+                key + (author_position, author.get('surname'), author.get('given_names'))
+                for author_position, author in enumerate(extracted['authors'][position] or [])
+            )
+
+            cited.extend((key, citation) for citation in extracted['citations'][position] or [])
+
+            issn = extracted['journal.scielo_issn'][position]
+            if issn and not issn in self._journals:
+                self._journals.add(issn)
+                journals.append(extracted['journal'][position])
+
+        citation_rows = _rows(
+            CITATION_COLUMNS, _extract([citation for key, citation in cited], CITATION_COLUMNS))
+        tables['citations'] = [key + row for (key, citation), row in zip(cited, citation_rows)]
+        tables['journals'] = _rows(JOURNAL_COLUMNS, _extract(journals, JOURNAL_COLUMNS))
+
+        return list(positions.keys()), tables, skipped
+
+    def add(self, article):
+        """
+        This method adds the given article, inserted with the next batch.
+        Articles without collection or publisher_id are skipped.
+        """
+        self._batch.append(article)
+
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def add_many(self, articles):
+        for article in articles:
+            self.add(article)
+
+    def flush(self):
+        """
+        This method inserts the pending articles in a single transaction.
+        """
+        if not self._batch:
+            return
+
+        keys, tables, skipped = self._tables(self._batch)
+
+        # Dependent rows of articles exported before are replaced. The keys
+        # of the session are checked on new databases instead of deleting
+        # blindly.
+        replacing = self._appending
+        if not replacing:
+            replacing = not self._seen.isdisjoint(keys)
+            self._seen.update(keys)
+
+        if replacing and not self._key_indexes:
+            self._create_indexes(article_key=True)
+            self._key_indexes = True
+
+        connection = self._connection
+        connection.execute('BEGIN')
+        try:
+            if replacing:
+                for table in _DEPENDENT_TABLES:
+                    connection.executemany(
+                        'DELETE FROM %s WHERE collection = ? AND pid = ?' % table, keys)
+
+            connection.executemany(
+                _insert('journals', len(JOURNAL_COLUMNS), 'INSERT OR REPLACE'),
+                tables['journals'])
+            connection.executemany(
+                _insert('articles', len(ARTICLE_COLUMNS), 'INSERT OR REPLACE'),
+                tables['articles'])
+            for table, columns in _DEPENDENT_TABLES.items():
+                connection.executemany(_insert(table, len(columns) + 2), tables[table])
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+
+        connection.execute('COMMIT')
+
+        self.count += len(keys)
+        self.skipped += skipped
+        self._batch = []
+
+    def _create_indexes(self, article_key=False):
+        for name, table, columns in INDEXES:
+            if article_key and columns != _ARTICLE_KEY:
+                continue
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS %s ON %s (%s)' % (name, table, ', '.join(columns)))
+
+    def create_indexes(self):
+        """
+        This method creates the missing indexes.
+        """
+        self._create_indexes()
+
+    def close(self):
+        """
+        This method inserts the pending articles, builds the indexes and
+        closes the database.
+        """
+        self.flush()
+        self.create_indexes()
+
+        if self._build_indexes:
+            self._connection.execute('ANALYZE')
+
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def export_sqlite(articles, path, batch_size=1000, rebuild_indexes=False):
+    """
+    Export the given articles to the SQLite database at the given path,
+    retrieving the number of exported articles.
+    """
+    with SQLiteExporter(path, batch_size, rebuild_indexes) as exporter:
+        exporter.add_many(articles)
+
+    return exporter.count
@@ -0,0 +1,173 @@
+# encoding: utf-8
+"""
+Duplicate article detection across collections.
+
+Articles are keyed by DOI and by a fingerprint made of the normalized original
+title, first author surname, publication year and ISSN. Articles with DOI
+are compared only by DOI, the fingerprint is used for articles without DOI.
+Only 8 bytes digests of the keys are kept, in a table bounded by max_entries
+where the least recently seen keys are evicted first.
+"""
+from collections import OrderedDict
+import hashlib
+import re
+
+from .index import normalize
+
+_DOI_PREFIX = re.compile(r'^(https?://(dx\.)?doi\.org/|doi:)', re.IGNORECASE)
+_NON_WORDS = re.compile(r'\W+', re.UNICODE)
+
+
+def doi_key(article):
+    """
+    Retrieve the normalized DOI of the given article, if it exists.
+    """
+    doi = article.doi
+
+    if doi:
+        doi = _DOI_PREFIX.sub(u'', doi.strip()).lower()
+
+    return doi or None
+
+
+def fingerprint(article):
+    """
+    Retrieve the fingerprint of the given article, if it has an original
+    title.
+    """
+    try:
+        title = article.original_title()
+    except KeyError:
+        title = None
+
+    if not title:
+        return None
+
+    authors = article.authors or [{}]
+
+    try:
+        year = article.publication_date[0:4]
+    except KeyError:
+        year = u''
+
+    journal = article.journal
+
+    return u'|'.join([
+        _NON_WORDS.sub(u'', normalize(title)),
+        normalize(authors[0].get('surname', u'')),
+        year,
+        (journal.any_issn() if journal else None) or u''
+    ])
+
+
+def _digest(kind, key):
+    return hashlib.md5((u'%s:%s' % (kind, key)).encode('utf-8')).digest()[:8]
+
+
+def _publisher_id(article):
+    return (article.collection_acronym, article.publisher_id)
+
+
+class Deduplicator(object):
+
+    def __init__(self, max_entries=None, key=_publisher_id):
+        """
+        Create an empty deduplicator.
+
+        Keyword arguments:
+        max_entries -- maximum number of kept digests, unbounded when None.
+        key -- function retrieving the id of an article, by default a tuple of
+        (collection acronym, publisher id).
+        """
+        self.max_entries = max_entries
+        self.key = key
+        self.seen = OrderedDict()
+        self.duplicates_count = 0
+
+    def __len__(self):
+        return len(self.seen)
+
+    def _digests(self, article):
+        """
+        Retrieve a tuple of (digests looked up, digests remembered, digests
+        claimed) for the given article. Articles with DOI are matched by DOI
+        or to articles without DOI by fingerprint, so articles with different
+        DOIs are never duplicates. Articles without DOI are matched by
+        fingerprint, to articles with or without DOI.
+        """
+        doi = doi_key(article)
+        footprint = fingerprint(article)
+
+        if doi:
+            digests = [_digest('doi', doi)]
+            if not footprint:
+                return digests, digests, []
+
+            claimed = [_digest('fingerprint', footprint)]
+
+            return digests + claimed, digests + [_digest('doi-fingerprint', footprint)], claimed
+
+        if not footprint:
+            return [], [], []
+
+        digest = _digest('fingerprint', footprint)
+
+        return [digest, _digest('doi-fingerprint', footprint)], [digest], []
+
+    def _remember(self, digest, article_id):
+        if digest in self.seen:
+            self.seen.pop(digest)
+        elif self.max_entries is not None and len(self.seen) >= self.max_entries:
+            self.seen.popitem(last=False)
+
+        self.seen[digest] = article_id
+
+    def check(self, article):
+        """
+        Register the given article, retrieving the id of the first article seen
+        with the same DOI or fingerprint, or None for new articles.
+        """
+        lookups, digests, claimed = self._digests(article)
+
+        original = None
+        for digest in lookups:
+            if digest in self.seen:
+                original = self.seen[digest]
+                if digest in claimed:
+                    # Matched by an article with DOI to an article without
+                    # DOI, the fingerprint is kept as the fingerprint of the
+                    # DOI, so other DOIs are not matched through it.
+                    del self.seen[digest]
+                elif not digest in digests:
+                    # Matched to an article with DOI, only its entry is
+                    # refreshed.
+                    self._remember(digest, original)
+                    digests = []
+                break
+
+        article_id = original if original is not None else self.key(article)
+        for digest in digests:
+            self._remember(digest, article_id)
+
+        if original is not None:
+            self.duplicates_count += 1
+
+        return original
+
+    def unique(self, articles):
+        """
+        Yield the given articles that are not duplicates of a previous one.
+        """
+        for article in articles:
+            if self.check(article) is None:
+                yield article
+
+    def duplicates(self, articles):
+        """
+        Yield tuples of (article, original id) for the given articles that are
+        duplicates of a previous one.
+        """
+        for article in articles:
+            original = self.check(article)
+            if original is not None:
+                yield article, original
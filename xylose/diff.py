@@ -0,0 +1,116 @@
+# encoding: utf-8
+"""
+Changed field detection between two versions of an article record.
+
+Records are compared at the tag level first ('article.v12', 'title.v100',
+'citations', 'collection', ...) and only the normalized fields depending on
+the changed tags (FIELD_TAGS) are extracted and compared.
+"""
+from . import schema
+from .extraction import ARTICLE_FIELDS, Extractor
+from .scielodocument import Article
+
+SECTIONS = ('article', 'title')
+
+_DOMAIN = ('collection', 'article.v992', 'title.v992', 'title.v690', 'article.v69')
+
+FIELD_TAGS = dict(
+    (name, ('article.%s' % description.tag,))
+    for name, description in schema.ARTICLE.items()
+)
+
+FIELD_TAGS.update({
+    'collection_acronym': ('collection', 'article.v992', 'title.v992'),
+    'doi': ('doi', 'article.v237'),
+    'languages': ('article.v740', 'article.v601', 'article.v720', 'article.v880') + _DOMAIN,
+    'original_title': ('article.v12', 'article.v40'),
+    'translated_titles': ('article.v12', 'article.v40'),
+    'original_abstract': ('article.v83', 'article.v40'),
+    'translated_abstracts': ('article.v83', 'article.v40'),
+    'keywords': ('article.v85',),
+    'authors': ('article.v10',),
+    'corporative_authors': ('article.v11',),
+    'affiliations': ('article.v70',),
+    'normalized_affiliations': ('article.v240',),
+    'document_type': ('article.v71',),
+    'file_code': ('article.v702',),
+    'project_sponsor': ('article.v58',),
+    'thesis_organization': ('article.v52',),
+    'scielo_domain': _DOMAIN,
+    'html_url': ('article.v880',) + _DOMAIN,
+    'pdf_url': ('article.v880',) + _DOMAIN,
+    'issue_url': ('article.v880',) + _DOMAIN
+})
+
+
+def _raw(record):
+    return record.data if isinstance(record, Article) else record
+
+
+def _changed_keys(old, new, prefix, changed):
+    for key in set(old) | set(new):
+        if old.get(key) != new.get(key):
+            changed.add(prefix + key)
+
+
+def changed_tags(old, new):
+    """
+    Retrieve the set of tags changed between the given raw records (or
+    Articles). Section tags are prefixed with the section name, ex:
+    'article.v12'; other top level keys are kept as they are, ex: 'citations'.
+    """
+    old = _raw(old)
+    new = _raw(new)
+    changed = set()
+
+    for key in set(old) | set(new):
+        old_value = old.get(key)
+        new_value = new.get(key)
+
+        if old_value == new_value:
+            continue
+
+        if key in SECTIONS:
+            _changed_keys(old_value or {}, new_value or {}, key + '.', changed)
+        else:
+            changed.add(key)
+
+    return changed
+
+
+def affected_fields(tags, fields=None):
+    """
+    Retrieve the fields (ARTICLE_FIELDS by default) depending on the given
+    tags. Fields without known dependencies are always affected.
+    """
+    fields = ARTICLE_FIELDS if fields is None else fields
+    tags = set(tags)
+
+    return [
+        field for field in fields
+        if not field in FIELD_TAGS or tags.intersection(FIELD_TAGS[field])
+    ]
+
+
+def diff(old, new, fields=None, iso_format=None):
+    """
+    Retrieve a dict of field to (old value, new value) for the normalized
+    fields (ARTICLE_FIELDS by default) changed between the given raw records
+    (or Articles). Accessors raising exceptions are compared as FieldError
+    values (see xylose.extraction).
+    """
+    tags = changed_tags(old, new)
+
+    if not tags:
+        return {}
+
+    extractor = Extractor(affected_fields(tags, fields))
+
+    old_values = extractor.extract(Article(_raw(old), iso_format=iso_format))
+    new_values = extractor.extract(Article(_raw(new), iso_format=iso_format))
+
+    return dict(
+        (field, (old_values[field], new_values[field]))
+        for field in extractor.fields
+        if old_values[field] != new_values[field]
+    )
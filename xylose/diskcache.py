@@ -0,0 +1,503 @@
+# encoding: utf-8
+"""
+Persistent cache of extraction results backed by SQLite.
+
+Normalized records (see xylose.extraction.Exporter) are stored keyed by a
+hash of the raw record and a namespace identifying the exported fields,
+language format and kind of keys, so unchanged articles are not extracted
+again between runs.
+
+There are two kinds of keys, kept in separate namespaces, so the entries of
+one kind are never found with the other:
+
+- RECORD_KEYS, hashes of the parsed records serialized with sorted keys, used
+  by CachedExporter (with orjson when it is installed, the hashes are not the
+  same without it and are kept in another namespace);
+- LINE_KEYS, hashes of the raw JSON lines as they are, used by the command
+  line extractor (see xylose.cli) to find the cached records without parsing
+  the lines. Sorting the keys of each record would cost about as much as
+  extracting it.
+The publisher_id of each entry is kept too, to invalidate the entries of an
+article. Reads and writes are done in bulk, each batch in a single
+transaction. When the stored values exceed max_bytes (or max_entries) the
+least recently used entries are evicted.
+
+Cached records are stored as JSON, with the FieldError values (see
+xylose.extraction) pickled apart, so decoded records are the records exported
+by the fresh path. They can be retrieved encoded, to be written as they are,
+without decoding and encoding them again (FieldError values are nulls, as
+written by the JSON backends).
+"""
+import hashlib
+import json
+import pickle
+import sqlite3
+import time
+
+from .extraction import Exporter, FieldError
+from .streams import get_backend
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    digest TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    pid TEXT NOT NULL,
+    value BLOB NOT NULL,
+    errors INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    used REAL NOT NULL,
+    markers BLOB,
+    PRIMARY KEY (digest, namespace)
+);
+CREATE INDEX IF NOT EXISTS entries_pid ON entries (pid);
+CREATE INDEX IF NOT EXISTS entries_used ON entries (used);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals VALUES (0, 0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE totals SET entries = entries + 1, bytes = bytes + new.size;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE totals SET entries = entries - 1, bytes = bytes - old.size;
+END;
+"""
+
+
+# Digests per query, below the SQLite limit of variables of a statement.
+_CHUNK_SIZE = 500
+
+
+def _chunks(values):
+    for start in range(0, len(values), _CHUNK_SIZE):
+        yield values[start:start + _CHUNK_SIZE]
+
+
+def _placeholders(values):
+    return ', '.join('?' * len(values))
+
+
+def _markers(value, path=()):
+    """
+    Retrieve a list of (path, FieldError) of the FieldError values in the given
+    exported record.
+    """
+    if isinstance(value, FieldError):
+        return [(path, value)]
+
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = enumerate(value)
+    else:
+        return []
+
+    markers = []
+    for key, item in items:
+        markers.extend(_markers(item, path + (key,)))
+
+    return markers
+
+
+def _dump_markers(markers):
+    """
+    Retrieve the pickled markers, or None when the errors can not be pickled
+    back as they are.
+    """
+    try:
+        value = pickle.dumps(markers, 2)
+        if pickle.loads(value) != markers:
+            return None
+    except Exception:
+        return None
+
+    return value
+
+
+def _restore(record, markers):
+    for path, error in markers:
+        container = record
+        for key in path[:-1]:
+            container = container[key]
+        container[path[-1]] = error
+
+    return record
+
+
+def _canonical(data):
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+
+    return json.dumps(
+        data, sort_keys=True, ensure_ascii=False, separators=(',', ':')
+    ).encode('utf-8')
+
+
+def record_hash(data):
+    """
+    Retrieve the hash of the given raw record, a dict or the encoded JSON
+    bytes. Dicts are serialized with sorted keys, so equal records have the
+    same hash whatever the order of their keys (with orjson when it is
+    installed, the hashes are not the same with and without it). Bytes are
+    hashed as they are, which is much faster but depends on the
+    serialization of the dump.
+    """
+    if not isinstance(data, bytes):
+        data = _canonical(data)
+
+    return hashlib.sha1(data).hexdigest()
+
+
+RECORD_KEYS = 'record'
+LINE_KEYS = 'line'
+
+
+def namespace(exporter, iso_format=None, keys=RECORD_KEYS):
+    """
+    Retrieve the namespace of the records exported with the given exporter and
+    language format, keyed by hashes of the given kind (RECORD_KEYS or
+    LINE_KEYS).
+    """
+    if not keys in (RECORD_KEYS, LINE_KEYS):
+        raise ValueError('Keys not allowed ({0})'.format(keys))
+
+    description = json.dumps([
+        exporter.article.fields,
+        exporter.journal.fields,
+        exporter.citation.fields,
+        iso_format,
+        keys,
+        keys == RECORD_KEYS and orjson is not None
+    ])
+
+    return hashlib.sha1(description.encode('utf-8')).hexdigest()[:16]
+
+
+def record_pid(data):
+    """
+    Retrieve the publisher_id of the given raw record, or an empty string.
+    """
+    try:
+        return data['article']['v880'][0]['_']
+    except (KeyError, IndexError, TypeError):
+        return u''
+
+
+class ExtractionCache(object):
+
+    def __init__(self, path, max_bytes=None, max_entries=None, backend=None,
+                 timeout=30):
+        """
+        Open, or create, the cache database at the given path.
+
+        Keyword arguments:
+        max_bytes -- maximum size of the stored values, None for no limit.
+        max_entries -- maximum number of entries, None for no limit.
+        backend -- JSON backend name (see xylose.streams.BACKENDS).
+        timeout -- seconds to wait for the database lock held by other
+        processes.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.backend = get_backend(backend)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode = WAL')
+        self._connection.execute('PRAGMA synchronous = NORMAL')
+        self._connection.execute('PRAGMA recursive_triggers = ON')
+        self._connection.executescript(_SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        # Databases created before the FieldError markers were stored.
+        columns = [row[1] for row in self._connection.execute('PRAGMA table_info(entries)')]
+
+        if not 'markers' in columns:
+            self._connection.execute('ALTER TABLE entries ADD COLUMN markers BLOB')
+
+    def _transaction(self, mode='IMMEDIATE'):
+        return _Transaction(self._connection, mode)
+
+    def get_many(self, digests, namespace=u'', decode=True):
+        """
+        This method retrieves a dict of record hash to a tuple of (record,
+        number of field errors) for the cached given hashes.
+
+        Keyword arguments:
+        decode -- False to retrieve the records as encoded JSON bytes.
+        """
+        digests = list(digests)
+        found = {}
+        connection = self._connection
+        loads = self.backend.loads
+
+        # The entries are read in a deferred transaction, not blocking the
+        # writers of other processes, and the use time is updated apart.
+        rows = []
+        with self._transaction('DEFERRED'):
+            for chunk in _chunks(digests):
+                rows.extend(connection.execute(
+                    'SELECT digest, value, errors, markers FROM entries '
+                    'WHERE namespace = ? AND digest IN (%s)' % _placeholders(chunk),
+                    [namespace] + chunk
+                ))
+
+        for digest, value, errors, markers in rows:
+            value = bytes(value)
+
+            if decode:
+                if errors and markers is None:
+                    # Errors not stored, or stored before the markers were.
+                    continue
+                value = loads(value)
+                if markers is not None:
+                    _restore(value, pickle.loads(bytes(markers)))
+
+            found[digest] = (value, errors)
+
+        if found:
+            used = time.time()
+            with self._transaction():
+                for chunk in _chunks(list(found)):
+                    connection.execute(
+                        'UPDATE entries SET used = ? '
+                        'WHERE namespace = ? AND digest IN (%s)' % _placeholders(chunk),
+                        [used, namespace] + chunk
+                    )
+
+        self.hits += len(found)
+        self.misses += len(digests) - len(found)
+
+        return found
+
+    def put_many(self, items, namespace=u''):
+        """
+        This method stores the given (publisher_id, record hash, record,
+        number of field errors) items, evicting entries when the limits are
+        exceeded. Records with FieldError values that can not be pickled are
+        not stored.
+        """
+        dumps = self.backend.dumps
+        used = time.time()
+        rows = []
+        for pid, digest, record, errors in items:
+            markers = _markers(record)
+            if markers or errors:
+                markers = _dump_markers(markers)
+                if markers is None:
+                    continue
+                markers = sqlite3.Binary(markers)
+            else:
+                markers = None
+
+            value = dumps(record)
+            rows.append((digest, namespace, pid, sqlite3.Binary(value), errors, len(value), used, markers))
+
+        if not rows:
+            return
+
+        with self._transaction():
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO entries '
+                '(digest, namespace, pid, value, errors, size, used, markers) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            self._evict()
+
+    def get(self, digest, namespace=u'', decode=True):
+        """
+        This method retrieves the (record, number of field errors) cached for
+        the given record hash, or None.
+        """
+        return self.get_many([digest], namespace, decode).get(digest)
+
+    def put(self, pid, digest, record, errors=0, namespace=u''):
+        self.put_many([(pid, digest, record, errors)], namespace)
+
+    def invalidate(self, pid):
+        """
+        This method removes the entries of the given publisher_id, retrieving
+        the number of removed entries.
+        """
+        with self._transaction():
+            return self._connection.execute('DELETE FROM entries WHERE pid = ?', (pid,)).rowcount
+
+    def _totals(self):
+        return self._connection.execute('SELECT entries, bytes FROM totals').fetchone()
+
+    def _evict(self):
+        # Must be called inside a transaction. Entries are evicted down to 90%
+        # of the limits, so the following puts do not evict again right away.
+        entries, size = self._totals()
+
+        excess_entries = 0
+        if self.max_entries is not None and entries > self.max_entries:
+            excess_entries = entries - int(self.max_entries * 0.9)
+
+        excess_bytes = 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            excess_bytes = size - int(self.max_bytes * 0.9)
+
+        if not excess_entries and not excess_bytes:
+            return
+
+        rowids = []
+        freed = 0
+        cursor = self._connection.execute('SELECT rowid, size FROM entries ORDER BY used')
+        for rowid, row_size in cursor:
+            if len(rowids) >= excess_entries and freed >= excess_bytes:
+                break
+            rowids.append((rowid,))
+            freed += row_size
+        cursor.close()
+
+        self._connection.executemany('DELETE FROM entries WHERE rowid = ?', rowids)
+        self.evictions += len(rowids)
+
+    def clear(self):
+        with self._transaction():
+            self._connection.execute('DELETE FROM entries')
+
+    def __len__(self):
+        return self._totals()[0]
+
+    def stats(self):
+        """
+        This method retrieves a dict with the number of entries, stored bytes
+        and the hit, miss and eviction counters of the cache.
+        """
+        entries, size = self._totals()
+
+        return {
+            'entries': entries,
+            'bytes': size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class _Transaction(object):
+
+    def __init__(self, connection, mode='IMMEDIATE'):
+        self.connection = connection
+        self.mode = mode
+
+    def __enter__(self):
+        self.connection.execute('BEGIN %s' % self.mode)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.connection.execute('COMMIT' if exc_type is None else 'ROLLBACK')
+
+
+class CachedExporter(object):
+
+    def __init__(self, cache, exporter=None, batch_size=500):
+        """
+        Create an exporter reusing the records cached in the given
+        ExtractionCache. Records not cached are exported with the given
+        exporter (a default xylose.extraction.Exporter when None) and stored.
+        """
+        self.cache = cache
+        self.exporter = exporter or Exporter()
+        self.batch_size = batch_size
+        self._namespaces = {}
+
+    def _namespace(self, article):
+        iso_format = article._iso_format
+
+        if not iso_format in self._namespaces:
+            self._namespaces[iso_format] = namespace(self.exporter, iso_format)
+
+        return self._namespaces[iso_format]
+
+    def export(self, article):
+        """
+        Export the given article into a dict.
+        """
+        return list(self.export_many([article]))[0]
+
+    def _export_batch(self, articles):
+        groups = {}
+        for article in articles:
+            digest = record_hash(article.data)
+            groups.setdefault(self._namespace(article), []).append((article, digest))
+
+        exported = {}
+        for name, entries in groups.items():
+            cached = self.cache.get_many([digest for article, digest in entries], name)
+
+            missing = []
+            for article, digest in entries:
+                if digest in cached:
+                    record, errors = cached[digest]
+                    if errors:
+                        self._count(record)
+                    exported[id(article)] = record
+                    continue
+
+                before = sum(self.exporter.counters.values())
+                record = self.exporter.export(article)
+                errors = sum(self.exporter.counters.values()) - before
+                exported[id(article)] = record
+                missing.append((record_pid(article.data), digest, record, errors))
+
+            self.cache.put_many(missing, name)
+
+        return [exported[id(article)] for article in articles]
+
+    def _count(self, record):
+        # Count the errors of cached records as the exporter counts the
+        # errors of the records it exports.
+        extractors = {'journal': self.exporter.journal, 'citations': self.exporter.citation}
+
+        for path, error in _markers(record):
+            if len(path) > 1:
+                extractors[path[0]].counters[error.field] += 1
+            elif path[0] in extractors:
+                # The journal or the citations could not be loaded.
+                self.exporter.section_counters[path[0]] += 1
+            else:
+                self.exporter.article.counters[error.field] += 1
+
+    def export_many(self, articles):
+        """
+        Export each given article, yielding dicts. Articles are read and
+        looked up in the cache in batches of batch_size.
+        """
+        batch = []
+        for article in articles:
+            batch.append(article)
+
+            if len(batch) >= self.batch_size:
+                for record in self._export_batch(batch):
+                    yield record
+                batch = []
+
+        for record in self._export_batch(batch):
+            yield record
+
+    @property
+    def counters(self):
+        return self.exporter.counters
+
+    def reset(self):
+        self.exporter.reset()
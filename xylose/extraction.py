@@ -0,0 +1,280 @@
+# encoding: utf-8
+"""
+Bulk extraction of Article, Journal and Citation fields.
+
+Accessors raising exceptions on malformed records (ex: Article.publication_date
+without v65) do not interrupt the extraction, the raised exception is kept in
+a FieldError value in place of the field value and counted by field.
+"""
+from operator import attrgetter, methodcaller
+import types
+
+VALUE = 'value'
+RAISE = 'raise'
+
+ARTICLE_FIELDS = [
+    'publisher_id', 'collection_acronym', 'document_type', 'doi',
+    'original_language', 'languages', 'original_title', 'translated_titles',
+    'original_abstract', 'translated_abstracts', 'keywords', 'authors',
+    'corporative_authors', 'affiliations', 'normalized_affiliations',
+    'publication_date', 'processing_date', 'receive_date', 'acceptance_date',
+    'review_date', 'ahead_publication_date', 'volume', 'issue',
+    'supplement_volume', 'supplement_issue', 'start_page', 'end_page',
+    'file_code', 'contract', 'project_name', 'project_sponsor',
+    'thesis_degree', 'thesis_organization', 'scielo_domain', 'html_url',
+    'pdf_url', 'issue_url'
+]
+
+JOURNAL_FIELDS = [
+    'scielo_issn', 'print_issn', 'electronic_issn', 'title',
+    'abbreviated_title', 'acronym', 'publisher_name', 'publisher_loc',
+    'subject_areas', 'wos_subject_areas', 'wos_citation_indexes',
+    'collection_acronym', 'scielo_domain', 'url'
+]
+
+CITATION_FIELDS = [
+    'index_number', 'publication_type', 'source', 'title', 'article_title',
+    'chapter_title', 'thesis_title', 'conference_title', 'link_title',
+    'authors', 'monographic_authors', 'date', 'volume', 'issue', 'start_page',
+    'end_page', 'pages', 'issn', 'isbn', 'doi', 'link', 'publisher',
+    'publisher_address', 'edition', 'serie', 'institutions'
+]
+
+
+class FieldError(object):
+    """
+    Value retrieved in place of a field when its accessor raises an exception.
+    FieldError instances are false in boolean context.
+    """
+    __slots__ = ('field', 'error')
+
+    def __init__(self, field, error):
+        self.field = field
+        self.error = error
+
+    def __bool__(self):
+        return False
+
+    __nonzero__ = __bool__
+
+    def __eq__(self, other):
+        return (isinstance(other, FieldError) and
+                self.field == other.field and
+                type(self.error) == type(other.error) and
+                self.error.args == other.error.args)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'FieldError(%r, %r)' % (self.field, self.error)
+
+
+def is_error(value):
+    return isinstance(value, FieldError)
+
+
+def _getter(cls, name):
+    """
+    Retrieve a function reading the given field from instances of cls. Methods
+    are called without arguments, properties and attributes are read.
+    """
+    member = getattr(cls, name, None)
+
+    if isinstance(member, (types.FunctionType, types.MethodType)):
+        return methodcaller(name)
+
+    return attrgetter(name)
+
+
+class Extractor(object):
+
+    def __init__(self, fields, errors=VALUE):
+        """
+        Create an extractor for the given field names.
+
+        Keyword arguments:
+        errors -- VALUE to retrieve FieldError values for fields raising
+        exceptions or RAISE to propagate the exceptions.
+        """
+        if not errors in (VALUE, RAISE):
+            raise ValueError('Errors mode not allowed ({0})'.format(errors))
+
+        self.fields = list(fields)
+        self.errors = errors
+        self.counters = dict((field, 0) for field in self.fields)
+        self._getters = {}
+
+    def _compiled(self, document):
+        cls = type(document)
+
+        if not cls in self._getters:
+            self._getters[cls] = [
+                (field, _getter(cls, field)) for field in self.fields
+            ]
+
+        return self._getters[cls]
+
+    def _values(self, document):
+        getters = self._compiled(document)
+
+        if self.errors == RAISE:
+            for field, getter in getters:
+                yield field, getter(document)
+            return
+
+        counters = self.counters
+        for field, getter in getters:
+            try:
+                value = getter(document)
+            except Exception as exc:
+                counters[field] += 1
+                value = FieldError(field, exc)
+
+            yield field, value
+
+    def extract(self, document):
+        """
+        Extract the fields of the given document into a dict.
+        """
+        return dict(self._values(document))
+
+    def extract_many(self, documents):
+        """
+        Extract the fields of each given document, yielding dicts.
+        """
+        for document in documents:
+            yield self.extract(document)
+
+    def extract_columns(self, documents):
+        """
+        Extract the fields of the given documents into a dict of lists, one
+        list per field, in the order of the documents.
+        """
+        columns = dict((field, []) for field in self.fields)
+        counters = self.counters
+        raising = self.errors == RAISE
+        plans = {}
+
+        for document in documents:
+            cls = type(document)
+            plan = plans.get(cls)
+            if plan is None:
+                plan = plans[cls] = [
+                    (field, getter, columns[field].append)
+                    for field, getter in self._compiled(document)
+                ]
+
+            if raising:
+                for field, getter, append in plan:
+                    append(getter(document))
+                continue
+
+            for field, getter, append in plan:
+                try:
+                    append(getter(document))
+                except Exception as exc:
+                    counters[field] += 1
+                    append(FieldError(field, exc))
+
+        return columns
+
+    @property
+    def error_count(self):
+        return sum(self.counters.values())
+
+    def reset(self):
+        for field in self.counters:
+            self.counters[field] = 0
+
+
+def null_values(values):
+    """
+    Retrieve a list with the given values, None in place of FieldError values.
+    """
+    return [None if isinstance(value, FieldError) else value for value in values]
+
+
+class Exporter(object):
+
+    def __init__(self, article_fields=None, journal_fields=None,
+                 citation_fields=None, errors=VALUE):
+        """
+        Create an exporter of whole records: the article fields with the
+        journal fields in 'journal' and the citations fields in 'citations'.
+        Journal or citations are not exported when its fields are an empty list.
+        When loading the journal or the citations raises an exception, a
+        FieldError is exported in place of them, counted in 'journal' or
+        'citations' (or the exception is propagated in the RAISE mode).
+        """
+        def fields(given, default):
+            return default if given is None else given
+
+        self.errors = errors
+        self.article = Extractor(fields(article_fields, ARTICLE_FIELDS), errors)
+        self.journal = Extractor(fields(journal_fields, JOURNAL_FIELDS), errors)
+        self.citation = Extractor(fields(citation_fields, CITATION_FIELDS), errors)
+        self.section_counters = {'journal': 0, 'citations': 0}
+
+    def _section(self, name, load):
+        if self.errors == RAISE:
+            return load()
+
+        try:
+            return load()
+        except Exception as exc:
+            self.section_counters[name] += 1
+            return FieldError(name, exc)
+
+    def _journal(self, article):
+        journal = article.journal
+
+        return self.journal.extract(journal) if journal else None
+
+    def _citations(self, article):
+        return [self.citation.extract(citation) for citation in article.citations or []]
+
+    def export(self, article):
+        """
+        Export the given article into a dict.
+        """
+        record = self.article.extract(article)
+
+        if self.journal.fields:
+            record['journal'] = self._section('journal', lambda: self._journal(article))
+
+        if self.citation.fields:
+            record['citations'] = self._section('citations', lambda: self._citations(article))
+
+        return record
+
+    def export_many(self, articles):
+        """
+        Export each given article, yielding dicts.
+        """
+        for article in articles:
+            yield self.export(article)
+
+    @property
+    def counters(self):
+        """
+        Error counters by field, journal and citation fields are prefixed with
+        'journal.' and 'citations.'. Errors loading the journal or the
+        citations are counted in 'journal' and 'citations'.
+        """
+        counters = dict(self.article.counters)
+        counters.update(self.section_counters)
+        for prefix, extractor in (('journal', self.journal), ('citations', self.citation)):
+            for field, count in extractor.counters.items():
+                counters['%s.%s' % (prefix, field)] = count
+
+        return counters
+
+    def reset(self):
+        for extractor in (self.article, self.journal, self.citation):
+            extractor.reset()
+
+        for name in self.section_counters:
+            self.section_counters[name] = 0
@@ -0,0 +1,420 @@
+# encoding: utf-8
+"""
+Filters evaluated on raw ISIS2JSON records.
+
+Filter expressions are built with Field and the comparison operators, and
+combined with & (and), | (or) and ~ (not):
+
+    expression = (
+        (Field('document_type') == 'research-article') &
+        (Field('publication_year') >= 2010) &
+        Field('collection_acronym').isin(['scl', 'arg'])
+    )
+
+compile_filter turns an expression into a Filter, whose predicates read the raw
+tags of the records (see FIELDS) without creating Article objects. When the
+expression requires given values (equality or isin over collection_acronym,
+document_type, document_type_code, publisher_id, issn or doi), the raw JSON
+lines not containing any of the values are dropped even before being parsed.
+
+Comparisons over missing fields, or fields raising exceptions on malformed
+records, are false.
+"""
+import json
+import operator
+
+from . import choices
+from . import schema
+from .flat import is_flat
+from .streams import get_backend
+
+
+def _article_field(name):
+    raw = schema.article[name]
+    flat = schema.flat_article[name]
+
+    def getter(data):
+        section = data['article']
+        return (flat if is_flat(section) else raw)(section)
+
+    return getter
+
+
+def _journal_field(name):
+    raw = schema.journal[name]
+    flat = schema.flat_journal[name]
+
+    def getter(data):
+        section = data.get('title')
+        if section:
+            return (flat if is_flat(section) else raw)(section)
+
+    return getter
+
+
+def _collection_acronym(data):
+    # Same rules of Article.collection_acronym.
+    if 'collection' in data:
+        return data['collection']
+
+    for section in ('article', 'title'):
+        value = data.get(section, {}).get('v992')
+        if isinstance(value, list):
+            return value[0]['_']
+        if value:
+            return value
+
+
+_article_doi = _article_field('doi')
+
+
+def _doi(data):
+    # Same rules of Article.doi.
+    if 'doi' in data:
+        return data['doi']
+
+    return _article_doi(data)
+
+
+_document_type_code = _article_field('document_type_code')
+
+
+def _document_type(data):
+    return choices.article_types.get(_document_type_code(data), choices.article_types['nd'])
+
+
+_publication_date = _article_field('publication_date')
+
+
+def _publication_year(data):
+    return int(_publication_date(data)[0:4])
+
+
+def _document_type_tokens(values):
+    # The default type matches records without v71 or with unknown codes,
+    # they can not be checked before parsing.
+    if choices.article_types['nd'] in values:
+        return None
+
+    return [code for code, name in choices.article_types.items() if name in values]
+
+
+def _same_tokens(values):
+    return list(values)
+
+
+# name: (getter reading the raw record, function retrieving the raw values
+# that must be in the records for the given values or None)
+FIELDS = dict(
+    (name, (_article_field(name), None)) for name in schema.ARTICLE
+)
+FIELDS.update({
+    'publisher_id': (_article_field('publisher_id'), _same_tokens),
+    'document_type_code': (_article_field('document_type_code'), _same_tokens),
+    'doi': (_doi, _same_tokens),
+    'collection_acronym': (_collection_acronym, _same_tokens),
+    'document_type': (_document_type, _document_type_tokens),
+    'publication_year': (_publication_year, None),
+    'issn': (_journal_field('scielo_issn'), _same_tokens)
+})
+
+
+def _encoded(value):
+    """
+    Retrieve a list with the JSON strings of the given value as they may be in
+    the raw lines, or None when the value may be escaped differently by the
+    JSON encoders. Slashes are escaped by some encoders (ex: ujson), both
+    forms are retrieved.
+    """
+    try:
+        value.encode('ascii')
+    except (AttributeError, UnicodeError):
+        return None
+
+    if set(value) & set(u'"\\') or any(ord(char) < 32 for char in value):
+        return None
+
+    encoded = json.dumps(value).encode('ascii')
+
+    if b'/' in encoded:
+        return [encoded, encoded.replace(b'/', b'\\/')]
+
+    return [encoded]
+
+
+class Expression(object):
+
+    def __and__(self, other):
+        return And(self, other)
+
+    def __or__(self, other):
+        return Or(self, other)
+
+    def __invert__(self):
+        return Not(self)
+
+    def predicate(self):
+        """
+        This method retrieves a function receiving a raw record and
+        retrieving True when the record matches the expression.
+        """
+        raise NotImplementedError()
+
+    def required(self):
+        """
+        This method retrieves a list of clauses, tuples of encoded JSON
+        strings, where at least one string of each clause must be in the raw
+        lines matching the expression.
+        """
+        return []
+
+
+class Comparison(Expression):
+
+    def __init__(self, name, operator_name, function, value):
+        self.name = name
+        self.operator_name = operator_name
+        self.function = function
+        self.value = value
+
+    def predicate(self):
+        getter = FIELDS[self.name][0]
+        function = self.function
+        value = self.value
+
+        def predicate(data):
+            try:
+                current = getter(data)
+            except Exception:
+                return False
+
+            if current is None:
+                return False
+
+            try:
+                return bool(function(current, value))
+            except TypeError:
+                return False
+
+        return predicate
+
+    def _values(self):
+        if self.operator_name == 'eq':
+            return [self.value]
+
+        if self.operator_name == 'in':
+            return list(self.value)
+
+    def required(self):
+        tokens = FIELDS[self.name][1]
+        values = self._values()
+
+        if tokens is None or values is None:
+            return []
+
+        raw_values = tokens(values)
+        if raw_values is None:
+            return []
+
+        encoded = set()
+        for value in raw_values:
+            tokens = _encoded(value)
+            if tokens is None:
+                return []
+            encoded.update(tokens)
+
+        return [tuple(sorted(encoded))]
+
+    def __repr__(self):
+        return 'Comparison(%r, %r, %r)' % (self.name, self.operator_name, self.value)
+
+
+class Exists(Expression):
+
+    def __init__(self, name):
+        self.name = name
+
+    def predicate(self):
+        getter = FIELDS[self.name][0]
+
+        def predicate(data):
+            try:
+                return getter(data) is not None
+            except Exception:
+                return False
+
+        return predicate
+
+
+class And(Expression):
+
+    def __init__(self, *expressions):
+        self.expressions = expressions
+
+    def predicate(self):
+        predicates = [expression.predicate() for expression in self.expressions]
+
+        def predicate(data):
+            for item in predicates:
+                if not item(data):
+                    return False
+            return True
+
+        return predicate
+
+    def required(self):
+        clauses = []
+        for expression in self.expressions:
+            clauses.extend(expression.required())
+
+        return clauses
+
+
+class Or(Expression):
+
+    def __init__(self, *expressions):
+        self.expressions = expressions
+
+    def predicate(self):
+        predicates = [expression.predicate() for expression in self.expressions]
+
+        def predicate(data):
+            for item in predicates:
+                if item(data):
+                    return True
+            return False
+
+        return predicate
+
+    def required(self):
+        # Only a single clause of each alternative can be joined.
+        joined = set()
+        for expression in self.expressions:
+            clauses = expression.required()
+            if len(clauses) != 1:
+                return []
+            joined.update(clauses[0])
+
+        return [tuple(sorted(joined))]
+
+
+class Not(Expression):
+
+    def __init__(self, expression):
+        self.expression = expression
+
+    def predicate(self):
+        negated = self.expression.predicate()
+
+        def predicate(data):
+            return not negated(data)
+
+        return predicate
+
+
+def _in(current, values):
+    return current in values
+
+
+class Field(object):
+
+    def __init__(self, name):
+        """
+        Create a field of filter expressions, name is one of FIELDS.
+        """
+        if not name in FIELDS:
+            raise ValueError('Field not allowed ({0})'.format(name))
+
+        self.name = name
+
+    def _comparison(self, operator_name, function, value):
+        return Comparison(self.name, operator_name, function, value)
+
+    def __eq__(self, value):
+        return self._comparison('eq', operator.eq, value)
+
+    def __ne__(self, value):
+        return self._comparison('ne', operator.ne, value)
+
+    def __lt__(self, value):
+        return self._comparison('lt', operator.lt, value)
+
+    def __le__(self, value):
+        return self._comparison('le', operator.le, value)
+
+    def __gt__(self, value):
+        return self._comparison('gt', operator.gt, value)
+
+    def __ge__(self, value):
+        return self._comparison('ge', operator.ge, value)
+
+    __hash__ = None
+
+    def isin(self, values):
+        return self._comparison('in', _in, frozenset(values))
+
+    def exists(self):
+        return Exists(self.name)
+
+
+class Filter(object):
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.match = expression.predicate()
+        self.required = expression.required()
+        self.parsed = 0
+        self.skipped = 0
+
+    def __call__(self, data):
+        return self.match(data)
+
+    def may_match(self, line):
+        """
+        This method retrieves False when the given raw JSON line (bytes) can
+        not match the filter, without parsing it.
+        """
+        for clause in self.required:
+            for token in clause:
+                if token in line:
+                    break
+            else:
+                return False
+
+        return True
+
+    def records(self, records):
+        """
+        Yield the given raw records matching the filter.
+        """
+        match = self.match
+        for data in records:
+            if match(data):
+                yield data
+
+    def lines(self, lines, backend=None):
+        """
+        Yield the records of the given raw JSON lines (bytes) matching the
+        filter. Lines not containing the required values are not parsed,
+        counted in skipped.
+        """
+        loads = get_backend(backend).loads
+        match = self.match
+        may_match = self.may_match
+
+        for line in lines:
+            if not may_match(line):
+                self.skipped += 1
+                continue
+
+            self.parsed += 1
+            data = loads(line)
+            if match(data):
+                yield data
+
+
+def compile_filter(expression):
+    """
+    Compile the given expression into a Filter.
+    """
+    return Filter(expression)
@@ -0,0 +1,249 @@
+# encoding: utf-8
+"""
+Pre-flattened records.
+
+flatten converts a raw ISIS2JSON article record once into a compact FlatRecord.
+Its article and title sections and its citations become FlatSections, where
+the occurrences of each tag are stored as:
+
+- the value itself, for occurrences with only the main value ('_');
+- Subfields, a tuple of (subfield positions, value, value...), for
+  occurrences with other subfields, the positions (subfield: index of the
+  value) are shared by every occurrence with the same subfields;
+- Occurrences, a tuple of the above, for repeated (or empty) tags;
+- Verbatim, wrapping values not in the ISIS2JSON shape, kept as parsed.
+
+Most tags have a single occurrence with a single value, so the lists and dicts
+of the raw shape are dropped for most of the record.
+
+FlatSections are read-only mappings that still expose the raw shape: reading a
+tag rebuilds its list of occurrences once (kept by the section), so every
+legacy access to the data keeps working. FlatArticle, FlatJournal and the flat
+citation classes (see xylose.scielodocument) read the compact values with the
+flat extractors compiled from the schema (see xylose.schema).
+
+Flattening is a memory option, not a speed one: flattened records hold about
+0.45 of the memory of the raw records (0.6 after an export has rebuilt the
+tags read through the raw shape), while the accessors are slightly slower and
+an export of fresh records about 1.4 times slower than over raw records. See
+benchmarks/flat.py.
+"""
+try:
+    from collections.abc import Mapping
+except ImportError:  # python 2.7
+    from collections import Mapping
+
+
+class Subfields(tuple):
+    """
+    Subfields of an occurrence, as a tuple of the shared positions of the
+    subfields followed by the values.
+    """
+    __slots__ = ()
+
+    def get(self, subfield, default=None):
+        position = self[0].get(subfield)
+
+        if position is None:
+            return default
+
+        return self[position]
+
+    def raw(self):
+        return dict(zip(self[0].names, self[1:]))
+
+
+class Occurrences(tuple):
+    """
+    Occurrences of a repeated tag.
+    """
+    __slots__ = ()
+
+
+class Verbatim(tuple):
+    """
+    Value of a tag not in the ISIS2JSON shape (a list of dicts), as parsed.
+    """
+    __slots__ = ()
+
+
+class _Positions(dict):
+    """
+    Positions of the subfields (subfield: index of the value) shared by the
+    Subfields with the same subfields, names are the subfields in the order
+    of the values.
+    """
+    __slots__ = ('names',)
+
+    def __init__(self, names):
+        dict.__init__(self, ((name, index + 1) for index, name in enumerate(names)))
+        self.names = names
+
+
+# subfield names: positions shared by the Subfields with these names
+_positions = {}
+
+
+def _compact_occurrence(occurrence):
+    if len(occurrence) == 1 and '_' in occurrence:
+        value = occurrence['_']
+        if not isinstance(value, tuple):
+            return value
+
+    names = tuple(occurrence)
+    positions = _positions.get(names)
+    if positions is None:
+        positions = _positions[names] = _Positions(names)
+
+    return Subfields((positions,) + tuple(occurrence[name] for name in names))
+
+
+def _compact(occurrences):
+    if not isinstance(occurrences, list):
+        return Verbatim((occurrences,))
+
+    for occurrence in occurrences:
+        if not isinstance(occurrence, dict):
+            return Verbatim((occurrences,))
+
+    if len(occurrences) == 1:
+        return _compact_occurrence(occurrences[0])
+
+    return Occurrences(_compact_occurrence(occurrence) for occurrence in occurrences)
+
+
+def _raw_occurrence(value):
+    if type(value) is Subfields:
+        return value.raw()
+
+    return {'_': value}
+
+
+def raw_value(value):
+    """
+    Rebuild the raw occurrences (list of dicts) of the given compact value.
+    """
+    cls = type(value)
+
+    if cls is Occurrences:
+        return [_raw_occurrence(occurrence) for occurrence in value]
+
+    if cls is Verbatim:
+        return value[0]
+
+    return [_raw_occurrence(value)]
+
+
+class FlatSection(Mapping):
+    """
+    Flattened section read as the raw section (tag: list of occurrences).
+    The compact values are kept in tags (tag: compact value), the occurrences
+    rebuilt for the raw reads are kept per tag.
+    """
+    __slots__ = ('tags', '_raw')
+
+    def __init__(self, tags):
+        self.tags = tags
+        self._raw = {}
+
+    def __getitem__(self, tag):
+        raw = self._raw
+
+        if tag in raw:
+            return raw[tag]
+
+        value = raw[tag] = raw_value(self.tags[tag])
+
+        return value
+
+    def get(self, tag, default=None):
+        if tag in self.tags:
+            return self[tag]
+
+        return default
+
+    def __contains__(self, tag):
+        return tag in self.tags
+
+    def __iter__(self):
+        return iter(self.tags)
+
+    def __len__(self):
+        return len(self.tags)
+
+    @property
+    def raw(self):
+        """
+        A new dict with the section in the raw ISIS2JSON shape.
+        """
+        return dict((tag, raw_value(value)) for tag, value in self.tags.items())
+
+    def __repr__(self):
+        return 'FlatSection(%r)' % self.tags
+
+    def __reduce__(self):
+        return (FlatSection, (self.tags,))
+
+
+class FlatRecord(dict):
+    """
+    Article record with flattened article, title and citations sections. The
+    citations are a tuple of FlatSections.
+    """
+    __slots__ = ()
+
+    @property
+    def raw(self):
+        """
+        A new dict with the record in the raw ISIS2JSON shape.
+        """
+        raw = dict(self)
+        for section in ('article', 'title'):
+            if isinstance(raw.get(section), FlatSection):
+                raw[section] = raw[section].raw
+
+        if isinstance(raw.get('citations'), tuple):
+            raw['citations'] = [
+                citation.raw if isinstance(citation, FlatSection) else citation
+                for citation in raw['citations']
+            ]
+
+        return raw
+
+    def __reduce__(self):
+        return (FlatRecord, (dict(self),))
+
+
+def flatten_section(section):
+    """
+    Convert a raw section (ex: data['article'] or a citation) into a
+    FlatSection. Sections already flattened are retrieved as they are.
+    """
+    if isinstance(section, FlatSection) or not isinstance(section, dict):
+        return section
+
+    return FlatSection(dict((tag, _compact(occurrences)) for tag, occurrences in section.items()))
+
+
+def flatten(record):
+    """
+    Convert a raw article record into a FlatRecord. Records already flattened
+    are retrieved as they are.
+    """
+    if isinstance(record, FlatRecord):
+        return record
+
+    flat = FlatRecord(record)
+
+    for section in ('article', 'title'):
+        if section in flat:
+            flat[section] = flatten_section(flat[section])
+
+    if isinstance(flat.get('citations'), list):
+        flat['citations'] = tuple(flatten_section(citation) for citation in flat['citations'])
+
+    return flat
+
+
+def is_flat(section):
+    return isinstance(section, FlatSection)
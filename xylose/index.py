@@ -0,0 +1,176 @@
+# encoding: utf-8
+"""
+Inverted index of article keywords and titles.
+
+Terms are normalized (see normalize) and mapped, per field and language, to
+posting lists of article numbers. The article numbers are positions in the
+list of indexed article ids (publisher ids by default).
+
+Keywords are indexed as whole terms, titles are indexed word by word.
+"""
+from array import array
+import gzip
+import json
+import re
+import unicodedata
+
+from . import tools
+
+KEYWORDS = 'keywords'
+TITLES = 'titles'
+
+_WORDS = re.compile(r'\w+', re.UNICODE)
+_SPACES = re.compile(r'\s+', re.UNICODE)
+
+
+def normalize(term):
+    """
+    Normalize a term for indexing: lower case, without accents and with
+    single spaces.
+    """
+    decomposed = unicodedata.normalize('NFKD', term.lower())
+    stripped = u''.join(c for c in decomposed if not unicodedata.combining(c))
+
+    return _SPACES.sub(u' ', stripped).strip()
+
+
+def _publisher_id(article):
+    return article.publisher_id
+
+
+class InvertedIndex(object):
+
+    def __init__(self, iso_format=None, key=_publisher_id):
+        """
+        Create an empty index.
+
+        Keyword arguments:
+        iso_format -- the language iso format used for the index languages.
+        key -- function retrieving the id of an article.
+        """
+        self.iso_format = iso_format
+        self.key = key
+        self.ids = []
+        self._postings = {KEYWORDS: {}, TITLES: {}}
+
+    @classmethod
+    def build(cls, articles, iso_format=None, key=_publisher_id):
+        """
+        Create an index from a stream of articles.
+        """
+        index = cls(iso_format=iso_format, key=key)
+
+        for article in articles:
+            index.add(article)
+
+        return index
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _post(self, field, language, term, number):
+        terms = self._postings[field].setdefault(language, {})
+        postings = terms.get(term)
+
+        if postings is None:
+            terms[term] = array('I', [number])
+        elif postings[-1] != number:
+            postings.append(number)
+
+    def add(self, article):
+        """
+        Index the keywords and titles (original and translated) of the given
+        article.
+        """
+        number = len(self.ids)
+        self.ids.append(self.key(article))
+
+        for language, keywords in (article.keywords(iso_format=self.iso_format) or {}).items():
+            for keyword in keywords:
+                term = normalize(keyword)
+                if term:
+                    self._post(KEYWORDS, language, term, number)
+
+        for title in article.data['article'].get('v12', []):
+            if not 'l' in title or not '_' in title:
+                continue
+
+            language = tools.get_language(title['l'], self.iso_format)
+            for word in _WORDS.findall(normalize(tools.html_decode(title['_']))):
+                self._post(TITLES, language, word, number)
+
+    def languages(self, field=KEYWORDS):
+        return sorted(self._postings[field].keys())
+
+    def _numbers(self, term, language, field):
+        if not field in self._postings:
+            raise ValueError('Field not allowed ({0})'.format(field))
+
+        term = normalize(term)
+        by_language = self._postings[field]
+
+        if language is not None:
+            return list(by_language.get(language, {}).get(term, []))
+
+        numbers = set()
+        for terms in by_language.values():
+            numbers.update(terms.get(term, []))
+
+        return sorted(numbers)
+
+    def lookup(self, term, language=None, field=KEYWORDS):
+        """
+        Retrieve the ids of the articles having the given term in the given
+        language (any language when it is None), in indexing order.
+        Title lookups must be made with single words.
+        """
+        return [self.ids[number] for number in self._numbers(term, language, field)]
+
+    def lookup_all(self, terms, language=None, field=KEYWORDS):
+        """
+        Retrieve the ids of the articles having all the given terms.
+        """
+        numbers = None
+        for term in terms:
+            found = set(self._numbers(term, language, field))
+            numbers = found if numbers is None else numbers & found
+
+        return [self.ids[number] for number in sorted(numbers or [])]
+
+    def save(self, path):
+        """
+        Save the index as a gzip compressed JSON file.
+        """
+        content = {
+            'iso_format': self.iso_format,
+            'ids': self.ids,
+            'postings': dict(
+                (field, dict(
+                    (language, dict((term, list(postings)) for term, postings in terms.items()))
+                    for language, terms in by_language.items()
+                ))
+                for field, by_language in self._postings.items()
+            )
+        }
+
+        with gzip.open(path, 'wb') as output:
+            output.write(json.dumps(content, separators=(',', ':')).encode('utf-8'))
+
+    @classmethod
+    def load(cls, path, key=_publisher_id):
+        """
+        Load an index saved by the save method.
+        """
+        with gzip.open(path, 'rb') as source:
+            content = json.loads(source.read().decode('utf-8'))
+
+        index = cls(iso_format=content['iso_format'], key=key)
+        index.ids = content['ids']
+
+        for field, by_language in content['postings'].items():
+            index._postings[field] = dict(
+                (language, dict((term, array('I', postings)) for term, postings in terms.items()))
+                for language, terms in by_language.items()
+            )
+
+        return index
@@ -0,0 +1,156 @@
+# encoding: utf-8
+"""
+Interning of repeated strings of raw records.
+
+After JSON parsing every tag, subfield key, language code, collection acronym
+or journal title is a separate string object. Interning the records makes
+every equal string share a single object kept in a bounded table, reducing
+the memory of resident corpora.
+
+Only strings known to repeat across records are interned: the dict keys
+(tags and subfields), the strings of the journal section ('title', repeated
+in every article of a journal), the values of the low cardinality tags of
+articles and citations (INTERNED_TAGS), the language subfields ('l') and the
+top level fields in INTERNED_FIELDS. Unique strings, as article titles or
+author names, are kept as parsed.
+"""
+from . import choices
+
+try:  # Keep compatibility with python 2.7
+    string_types = basestring
+except NameError:
+    string_types = str
+
+# Article and citation tags with low cardinality values: languages, document
+# and publication types, collection, ISSNs, journal titles and countries.
+INTERNED_TAGS = frozenset([
+    'v35', 'v40', 'v71', 'v100', 'v150', 'v400', 'v421', 'v435', 'v690',
+    'v701', 'v706', 'v708', 'v720', 'v740', 'v935', 'v992'
+])
+
+INTERNED_SUBFIELDS = frozenset(['l'])
+
+INTERNED_FIELDS = frozenset([
+    'collection', 'applicable', 'publication_year', 'sent_doaj', 'sent_wos',
+    'validated_scielo', 'validated_wos', 'code_title'
+])
+
+
+def _choices_strings():
+    strings = set(choices.article_types.keys())
+    strings.update(choices.article_types.values())
+    strings.update(choices.collections.keys())
+    strings.update(choices.ISO639_1_to_2.keys())
+    strings.update(choices.ISO639_1_to_2.values())
+    strings.update(choices.ISO_3166.keys())
+    strings.update(choices.ISO_3166.values())
+
+    return strings
+
+
+class InternTable(object):
+
+    def __init__(self, max_size=1000000, max_length=128, seed_choices=True):
+        """
+        Create an intern table.
+
+        Keyword arguments:
+        max_size -- maximum number of strings kept, new strings are not
+        interned once the table is full. Only repeated strings are interned
+        by record, so the table stays small for large corpora.
+        max_length -- longer strings are not interned.
+        seed_choices -- start the table with the xylose.choices strings.
+        """
+        self.max_size = max_size
+        self.max_length = max_length
+        self.table = {}
+
+        if seed_choices:
+            for string in _choices_strings():
+                self.intern(string)
+
+    def __len__(self):
+        return len(self.table)
+
+    def intern(self, string):
+        """
+        Retrieve the interned version of the given string.
+        """
+        interned = self.table.get(string)
+
+        if interned is not None:
+            return interned
+
+        if len(string) <= self.max_length and len(self.table) < self.max_size:
+            self.table[string] = string
+
+        return string
+
+    def _value(self, value):
+        # Intern every string of the given value.
+        if isinstance(value, string_types):
+            return self.intern(value)
+
+        if isinstance(value, list):
+            for position, item in enumerate(value):
+                value[position] = self._value(item)
+            return value
+
+        if isinstance(value, dict):
+            intern = self.intern
+            return dict((intern(key), self._value(item)) for key, item in value.items())
+
+        return value
+
+    def _section(self, section, every_value=False):
+        # Intern the tags and subfields of a raw section (tag: occurrences)
+        # and the values of the repeated tags.
+        if not isinstance(section, dict):
+            return section
+
+        intern = self.intern
+        interned = {}
+        for tag, occurrences in section.items():
+            tag = intern(tag)
+            if every_value or tag in INTERNED_TAGS:
+                interned[tag] = self._value(occurrences)
+                continue
+
+            if isinstance(occurrences, list):
+                for position, occurrence in enumerate(occurrences):
+                    if isinstance(occurrence, dict):
+                        occurrences[position] = dict(
+                            (intern(key), intern(item) if key in INTERNED_SUBFIELDS and
+                             isinstance(item, string_types) else item)
+                            for key, item in occurrence.items()
+                        )
+            interned[tag] = occurrences
+
+        return interned
+
+    def record(self, value):
+        """
+        Intern the repeated strings of the given raw article record (see the
+        module documentation), retrieving the interned record. Lists are
+        changed in place.
+        """
+        if not isinstance(value, dict):
+            return value
+
+        intern = self.intern
+        record = {}
+        for key, item in value.items():
+            key = intern(key)
+            if key == 'title':
+                item = self._section(item, every_value=True)
+            elif key == 'article':
+                item = self._section(item)
+            elif key == 'citations' and isinstance(item, list):
+                for position, citation in enumerate(item):
+                    item[position] = self._section(citation)
+            elif key in INTERNED_FIELDS:
+                item = self._value(item)
+
+            record[key] = item
+
+        return record
@@ -0,0 +1,111 @@
+# encoding: utf-8
+"""
+Corpus wide ISSN resolution.
+
+Maps any ISSN of a journal (print, electronic and the SciELO ISSN) to a
+canonical journal id (the SciELO ISSN by default).
+"""
+import json
+import re
+
+_ISSN = re.compile(r'^([0-9]{4})-?([0-9]{3}[0-9X])$')
+
+
+def normalize(issn):
+    """
+    Normalize an ISSN to the NNNN-NNNC form, retrieving None for values that
+    are not ISSNs.
+    """
+    if not issn:
+        return None
+
+    match = _ISSN.match(issn.strip().upper().replace(' ', ''))
+
+    if match:
+        return u'%s-%s' % match.groups()
+
+
+def _scielo_issn(journal):
+    return journal.scielo_issn
+
+
+class ISSNResolver(object):
+
+    def __init__(self, key=_scielo_issn):
+        """
+        Create an empty resolver.
+
+        Keyword arguments:
+        key -- function retrieving the canonical id of a journal.
+        """
+        self.key = key
+        self.table = {}
+        self.conflicts = []
+
+    @classmethod
+    def build(cls, journals, key=_scielo_issn):
+        """
+        Create a resolver from a stream of journals.
+        """
+        resolver = cls(key=key)
+
+        for journal in journals:
+            resolver.add(journal)
+
+        return resolver
+
+    def __len__(self):
+        return len(self.table)
+
+    def __contains__(self, issn):
+        return normalize(issn) in self.table
+
+    def add(self, journal):
+        """
+        Register the ISSNs of the given journal. An ISSN already registered to
+        another journal is kept and the conflict is recorded as a tuple of
+        (issn, registered id, journal id).
+        """
+        journal_id = self.key(journal)
+
+        if journal_id is None:
+            return
+
+        issns = set(normalize(issn) for issn in
+                    (journal.scielo_issn, journal.print_issn, journal.electronic_issn))
+        issns.discard(None)
+
+        for issn in sorted(issns):
+            registered = self.table.setdefault(issn, journal_id)
+
+            if registered != journal_id:
+                self.conflicts.append((issn, registered, journal_id))
+
+    def resolve(self, issn):
+        """
+        Retrieve the canonical id of the journal with the given ISSN, if it
+        exists.
+        """
+        return self.table.get(normalize(issn))
+
+    def resolve_citation(self, citation):
+        """
+        Retrieve the canonical id of the journal cited by the given citation,
+        if it exists.
+        """
+        return self.resolve(citation.issn)
+
+    def save(self, path):
+        with open(path, 'w') as output:
+            json.dump({'table': self.table, 'conflicts': self.conflicts}, output)
+
+    @classmethod
+    def load(cls, path, key=_scielo_issn):
+        with open(path) as source:
+            content = json.load(source)
+
+        resolver = cls(key=key)
+        resolver.table = content['table']
+        resolver.conflicts = [tuple(conflict) for conflict in content['conflicts']]
+
+        return resolver
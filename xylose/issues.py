@@ -0,0 +1,228 @@
+# encoding: utf-8
+"""
+Issues built from streams of articles.
+
+The issue of an article is identified by the first 18 characters of its
+publisher_id ('S' + ISSN + year + issue order, ex: S2179-975X20110003), the
+same identifier used by Article.issue_url. group_issues groups the articles
+of a dump by issue in a hash table, in a single pass, without sorting the
+whole dump: only the articles of each issue are ordered by start page.
+"""
+from collections import OrderedDict
+import re
+
+from .scielodocument import URL_TEMPLATES
+
+_NUMBER = re.compile(r'\d+')
+
+
+def issue_pid(article):
+    """
+    Retrieve the issue identifier of the given article.
+    """
+    return article.publisher_id[0:18]
+
+
+def page_key(article):
+    """
+    Retrieve the sort key of the given article in the table of contents. The
+    first number of the start page is used (ex: 'e123' is 123), articles
+    without numeric start page come last, ties are ordered by publisher_id.
+    """
+    try:
+        page = _NUMBER.search(article.start_page or u'')
+    except Exception:
+        page = None
+
+    if page is None:
+        return (1, 0, article.publisher_id)
+
+    return (0, int(page.group()), article.publisher_id)
+
+
+class Issue(object):
+
+    def __init__(self, pid, collection_acronym=None):
+        """
+        Create an empty issue with the given identifier (see issue_pid).
+        """
+        self.pid = pid
+        self.collection_acronym = collection_acronym
+        self._articles = OrderedDict()
+        self._sorted = None
+
+    def add(self, article):
+        """
+        This method adds the given article to the issue. An article with the
+        same publisher_id of an article already added replaces it.
+        """
+        self._articles[article.publisher_id] = article
+        self._sorted = None
+
+    def __len__(self):
+        return len(self._articles)
+
+    def __contains__(self, publisher_id):
+        return publisher_id in self._articles
+
+    def __iter__(self):
+        return iter(self.articles)
+
+    @property
+    def articles(self):
+        """
+        This method retrieves the articles of the issue ordered by start page
+        (see page_key).
+        """
+        if self._sorted is None:
+            self._sorted = sorted(self._articles.values(), key=page_key)
+
+        return self._sorted
+
+    def _first(self, name):
+        for article in self._articles.values():
+            try:
+                value = getattr(article, name)
+            except Exception:
+                continue
+
+            if value:
+                return value
+
+    @property
+    def journal(self):
+        """
+        This method retrieves the journal of the issue, from the first article
+        having it.
+        """
+        return self._first('journal')
+
+    @property
+    def publication_date(self):
+        return self._first('publication_date')
+
+    @property
+    def volume(self):
+        return self._first('volume')
+
+    @property
+    def issue(self):
+        """
+        This method retrieves the issue number.
+        """
+        return self._first('issue')
+
+    @property
+    def supplement_volume(self):
+        return self._first('supplement_volume')
+
+    @property
+    def supplement_issue(self):
+        return self._first('supplement_issue')
+
+    def url(self, language='en'):
+        """
+        This method retrieves the table of contents url of the issue, if the
+        domain of the collection exists.
+        """
+        domain = self._first('scielo_domain')
+
+        if domain:
+            return URL_TEMPLATES['issue'].format(domain, self.pid, language)
+
+    def table_of_contents(self):
+        """
+        This method retrieves a list of dicts with the publisher_id, start
+        page, end page and original title of the articles, in the order of
+        the issue.
+        """
+        toc = []
+        for article in self.articles:
+            try:
+                title = article.original_title()
+            except Exception:
+                title = None
+
+            toc.append({
+                'publisher_id': article.publisher_id,
+                'start_page': article.start_page,
+                'end_page': article.end_page,
+                'title': title
+            })
+
+        return toc
+
+    def __repr__(self):
+        return 'Issue(%r, %d articles)' % (self.pid, len(self))
+
+
+class IssueGrouper(object):
+    """
+    Groups articles by collection and issue in a hash table.
+    """
+
+    def __init__(self):
+        self._issues = OrderedDict()
+
+    def add(self, article):
+        """
+        This method adds the given article to its issue, retrieving the issue.
+        """
+        collection = article.collection_acronym
+        key = (collection, issue_pid(article))
+
+        issue = self._issues.get(key)
+        if issue is None:
+            issue = self._issues[key] = Issue(key[1], collection)
+
+        issue.add(article)
+
+        return issue
+
+    def add_many(self, articles):
+        for article in articles:
+            self.add(article)
+
+    def __len__(self):
+        return len(self._issues)
+
+    def get(self, pid, collection_acronym=None):
+        return self._issues.get((collection_acronym, pid))
+
+    def issues(self):
+        """
+        This method retrieves the issues in the order they were first seen.
+        """
+        return list(self._issues.values())
+
+
+def group_issues(articles, ordered=False):
+    """
+    Group the given articles by issue, yielding Issues.
+
+    Keyword arguments:
+    ordered -- True when the articles of each issue are contiguous in the
+    given stream (ex: dumps exported issue by issue). Each issue is yielded as
+    soon as the next one starts, keeping a single issue in memory. Otherwise
+    the issues are yielded after the whole stream is read.
+    """
+    if not ordered:
+        grouper = IssueGrouper()
+        grouper.add_many(articles)
+        for issue in grouper.issues():
+            yield issue
+        return
+
+    current = None
+    for article in articles:
+        key = (article.collection_acronym, issue_pid(article))
+
+        if current is None or (current.collection_acronym, current.pid) != key:
+            if current is not None:
+                yield current
+            current = Issue(key[1], key[0])
+
+        current.add(article)
+
+    if current is not None:
+        yield current
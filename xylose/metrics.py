@@ -0,0 +1,286 @@
+# encoding: utf-8
+"""
+Throughput metrics and stage timers for the reading and extraction pipeline.
+
+Metrics tracks processed records and bytes, errors by kind and the latency of
+named stages (ex: read, parse, construct, extract) in histograms with
+logarithmic buckets. Snapshots are dicts that can be dumped as JSON or pushed
+to a callback periodically.
+
+Metrics can be updated from several threads (ex: a thread reading the input
+while the main thread writes the output).
+
+NULL_METRICS has the same interface doing nothing, it is used when the metrics
+are disabled. StageRecorder keeps the stage latencies of worker processes, to
+be sent to the Metrics of the main process.
+"""
+from bisect import bisect_left
+import json
+import threading
+import time
+
+try:
+    clock = time.perf_counter
+except AttributeError:  # python 2.7
+    clock = time.time
+
+# Upper bounds, in seconds, of the latency buckets: 1us, 2us, 4us ... ~33s.
+BUCKETS = tuple(1e-6 * 2 ** exponent for exponent in range(26))
+
+
+class Histogram(object):
+
+    __slots__ = ('counts', 'count', 'total', 'minimum', 'maximum')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def observe(self, seconds):
+        bucket = bisect_left(BUCKETS, seconds)
+
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total += seconds
+
+        if self.minimum is None or seconds < self.minimum:
+            self.minimum = seconds
+        if self.maximum is None or seconds > self.maximum:
+            self.maximum = seconds
+
+    def quantile(self, fraction):
+        """
+        Retrieve the upper bound of the bucket holding the given quantile.
+        """
+        if self.count == 0:
+            return None
+
+        target = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return BUCKETS[bucket] if bucket < len(BUCKETS) else self.maximum
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.minimum,
+            'max': self.maximum,
+            'p50': self.quantile(0.5),
+            'p90': self.quantile(0.9),
+            'p99': self.quantile(0.99),
+            'buckets': dict(
+                ('%g' % BUCKETS[bucket] if bucket < len(BUCKETS) else 'inf', count)
+                for bucket, count in enumerate(self.counts) if count
+            )
+        }
+
+
+class _Timer(object):
+
+    __slots__ = ('histogram', 'lock', 'started')
+
+    def __init__(self, histogram, lock):
+        self.histogram = histogram
+        self.lock = lock
+
+    def __enter__(self):
+        self.started = clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = clock() - self.started
+        with self.lock:
+            self.histogram.observe(elapsed)
+
+
+class Metrics(object):
+
+    enabled = True
+
+    def __init__(self, callback=None, interval=10.0):
+        """
+        Create the metrics of a pipeline run.
+
+        Keyword arguments:
+        callback -- function receiving a snapshot every interval seconds,
+        checked when records are counted.
+        interval -- seconds between callback calls.
+        """
+        self.callback = callback
+        self.interval = interval
+        self.records = 0
+        self.bytes = 0
+        self.errors = {}
+        self.stages = {}
+        self.started = clock()
+        self._last_push = self.started
+        self._lock = threading.Lock()
+
+    def _histogram(self, name):
+        histogram = self.stages.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.stages.setdefault(name, Histogram())
+
+        return histogram
+
+    def stage(self, name):
+        """
+        Retrieve a context manager timing the given stage.
+        """
+        return _Timer(self._histogram(name), self._lock)
+
+    def observe(self, name, seconds):
+        """
+        Register the latency of the given stage.
+        """
+        histogram = self._histogram(name)
+
+        with self._lock:
+            histogram.observe(seconds)
+
+    def record(self, size=0, count=1):
+        """
+        Count processed records and their size in bytes.
+        """
+        with self._lock:
+            self.records += count
+            self.bytes += size
+
+            push = False
+            if self.callback is not None:
+                now = clock()
+                if now - self._last_push >= self.interval:
+                    self._last_push = now
+                    push = True
+
+        if push:
+            self.callback(self.snapshot())
+
+    def error(self, kind, count=1):
+        with self._lock:
+            self.errors[kind] = self.errors.get(kind, 0) + count
+
+    def snapshot(self):
+        with self._lock:
+            elapsed = max(clock() - self.started, 1e-9)
+
+            return {
+                'elapsed': elapsed,
+                'records': self.records,
+                'bytes': self.bytes,
+                'records_per_second': self.records / elapsed,
+                'bytes_per_second': self.bytes / elapsed,
+                'errors': dict(self.errors),
+                'stages': dict((name, histogram.to_dict()) for name, histogram in self.stages.items())
+            }
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), sort_keys=True)
+
+    def dump(self, path):
+        with open(path, 'w') as output:
+            output.write(self.to_json())
+
+    def close(self):
+        """
+        Push the final snapshot to the callback, if it exists.
+        """
+        if self.callback is not None:
+            self.callback(self.snapshot())
+
+
+class _NullTimer(object):
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+_NULL_TIMER = _NullTimer()
+
+
+class NullMetrics(object):
+    """
+    Disabled metrics, every method does nothing.
+    """
+    enabled = False
+
+    def stage(self, name):
+        return _NULL_TIMER
+
+    def observe(self, name, seconds):
+        pass
+
+    def record(self, size=0, count=1):
+        pass
+
+    def error(self, kind, count=1):
+        pass
+
+    def snapshot(self):
+        return {}
+
+    def to_json(self):
+        return '{}'
+
+    def dump(self, path):
+        pass
+
+    def close(self):
+        pass
+
+NULL_METRICS = NullMetrics()
+
+
+class _RecordedTimer(object):
+
+    __slots__ = ('recorder', 'name', 'started')
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.started = clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.recorder.observe(self.name, clock() - self.started)
+
+
+class StageRecorder(NullMetrics):
+    """
+    Metrics of worker processes: the stage latencies are kept as a list of
+    (stage, seconds), retrieved with drain and registered in the Metrics of
+    the main process with observe. Every other method does nothing.
+    """
+    enabled = True
+
+    def __init__(self):
+        self.timings = []
+
+    def stage(self, name):
+        return _RecordedTimer(self, name)
+
+    def observe(self, name, seconds):
+        self.timings.append((name, seconds))
+
+    def drain(self):
+        """
+        Retrieve the latencies recorded since the last call.
+        """
+        timings = self.timings
+        self.timings = []
+
+        return timings
@@ -0,0 +1,289 @@
+# encoding: utf-8
+"""
+Declarative description of the ISIS2JSON fields handled by xylose.
+
+Each field is described by its tag, subfield, cardinality and an optional
+transform. The descriptions are compiled at import time into extractor
+functions with the signature extractor(record, iso_format=None), where record
+is the ISIS2JSON record that holds the tag (ex: data['article'], data['title']
+or a citation).
+
+Single fields retrieve the subfield of the first occurrence of the tag, multiple
+fields retrieve a list with the subfield of every occurrence. Fields not
+available in the record retrieve None, unless they are required, in that case
+a KeyError is raised as the legacy accessors do.
+"""
+from collections import namedtuple
+
+from . import tools
+from .flat import Occurrences, Subfields, Verbatim, raw_value
+
+SINGLE = 'single'
+MULTIPLE = 'multiple'
+
+Field = namedtuple('Field', ['tag', 'subfield', 'cardinality', 'transform', 'required'])
+
+
+def field(tag, subfield='_', cardinality=SINGLE, transform=None, required=False):
+    """
+    Create a field description.
+
+    Keyword arguments:
+    subfield -- the subfield to be retrieved, '_' is the main field value.
+    cardinality -- SINGLE or MULTIPLE
+    transform -- a name from TRANSFORMS or a callable receiving the value.
+    required -- raise KeyError when the tag is not available.
+    """
+    if not cardinality in (SINGLE, MULTIPLE):
+        raise ValueError('Cardinality not allowed ({0})'.format(cardinality))
+
+    if transform is not None and not callable(transform) and not transform in TRANSFORMS:
+        raise ValueError('Transform not allowed ({0})'.format(transform))
+
+    return Field(tag, subfield, cardinality, transform, required)
+
+
+
+# Transforms receiving the value and the iso_format.
+TRANSFORMS = {
+    'html': lambda value, iso_format: tools.html_decode(value),
+    'date': lambda value, iso_format: tools.get_publication_date(value),
+    'language': lambda value, iso_format: tools.get_language(value, iso_format),
+    'lower': lambda value, iso_format: value.lower(),
+    'int': lambda value, iso_format: int(value)
+}
+
+
+JOURNAL = {
+    'scielo_issn': field('v400'),
+    'abbreviated_title': field('v150'),
+    'publisher_name': field('v480'),
+    'publisher_loc': field('v490'),
+    'title': field('v100'),
+    'acronym': field('v68', transform='lower'),
+    'subject_areas': field('v441', cardinality=MULTIPLE),
+    'wos_subject_areas': field('v854', cardinality=MULTIPLE)
+}
+
+ARTICLE = {
+    'original_language': field('v40', transform='language', required=True),
+    'publication_date': field('v65', transform='date', required=True),
+    'processing_date': field('v91', transform='date', required=True),
+    'receive_date': field('v112', transform='date'),
+    'acceptance_date': field('v114', transform='date'),
+    'review_date': field('v116', transform='date'),
+    'ahead_publication_date': field('v223', transform='date'),
+    'contract': field('v60'),
+    'project_name': field('v59'),
+    'volume': field('v31'),
+    'issue': field('v32'),
+    'supplement_volume': field('v131'),
+    'supplement_issue': field('v132'),
+    'start_page': field('v14', subfield='f'),
+    'end_page': field('v14', subfield='l'),
+    'doi': field('v237'),
+    'publisher_id': field('v880', required=True),
+    'document_type_code': field('v71'),
+    'thesis_degree': field('v51')
+}
+
+CITATION = {
+    'index_number': field('v701', transform='int'),
+    'link': field('v37'),
+    'doi': field('v237'),
+    'publisher': field('v62'),
+    'journal_title': field('v30'),
+    'book_title': field('v18'),
+    'chapter_title': field('v12', transform='html'),
+    'article_title': field('v12', transform='html'),
+    'thesis_title': field('v18', transform='html'),
+    'conference_title': field('v53', transform='html'),
+    'link_title': field('v12'),
+    'conference_sponsor': field('v52'),
+    'edition': field('v63'),
+    'issn': field('v35'),
+    'isbn': field('v69'),
+    'volume': field('v31'),
+    'issue': field('v32'),
+    'issue_part': field('v34', transform='html'),
+    'serie': field('v25', transform='html')
+}
+
+
+def compile_field(description, flat=False):
+    """
+    Compile a field description into an extractor function. Flat extractors
+    read flattened sections (see xylose.flat.FlatSection).
+    """
+    tag = description.tag
+    subfield = description.subfield
+    transform = description.transform
+
+    if transform is not None and not callable(transform):
+        transform = TRANSFORMS[transform]
+    elif transform is not None:
+        custom = transform
+        transform = lambda value, iso_format: custom(value)
+
+    if description.cardinality == MULTIPLE:
+        if transform is None:
+            def extractor(record, iso_format=None):
+                if tag in record:
+                    return [item[subfield] for item in record[tag] if subfield in item]
+        else:
+            def extractor(record, iso_format=None):
+                if tag in record:
+                    return [transform(item[subfield], iso_format)
+                            for item in record[tag] if subfield in item]
+    elif description.required:
+        if transform is None:
+            def extractor(record, iso_format=None):
+                return record[tag][0][subfield]
+        else:
+            def extractor(record, iso_format=None):
+                return transform(record[tag][0][subfield], iso_format)
+    else:
+        if transform is None:
+            def extractor(record, iso_format=None):
+                if tag in record:
+                    return record[tag][0].get(subfield, None)
+        else:
+            def extractor(record, iso_format=None):
+                if tag in record:
+                    value = record[tag][0].get(subfield, None)
+                    if value is not None:
+                        return transform(value, iso_format)
+
+    if description.required and description.cardinality == MULTIPLE:
+        optional = extractor
+
+        def extractor(record, iso_format=None):
+            if not tag in record:
+                raise KeyError(tag)
+            return optional(record, iso_format)
+
+    if flat:
+        return _compile_flat_field(description, transform, extractor)
+
+    return extractor
+
+
+_MISSING = object()
+
+
+def _compile_flat_field(description, transform, raw_extractor):
+    """
+    Compile a field description into an extractor of flattened sections.
+    Repeated tags and values not in the ISIS2JSON shape (Verbatim) of single
+    fields are read with the raw extractor, so both extractors agree on every
+    record.
+    """
+    tag = description.tag
+    subfield = description.subfield
+    main = subfield == '_'
+
+    def verbatim(value, iso_format):
+        return raw_extractor({tag: value[0]}, iso_format)
+
+    if description.cardinality == MULTIPLE:
+        def values(value):
+            found = []
+            for occurrence in (value if type(value) is Occurrences else (value,)):
+                if type(occurrence) is Subfields:
+                    item = occurrence.get(subfield, _MISSING)
+                    if item is not _MISSING:
+                        found.append(item)
+                elif main:
+                    found.append(occurrence)
+
+            return found
+
+        def extractor(record, iso_format=None):
+            value = record.tags.get(tag, _MISSING)
+
+            if value is _MISSING:
+                if description.required:
+                    raise KeyError(tag)
+                return None
+
+            if type(value) is Verbatim:
+                return verbatim(value, iso_format)
+
+            if transform is None:
+                return values(value)
+
+            return [transform(item, iso_format) for item in values(value)]
+
+        return extractor
+
+    def repeated(value, iso_format):
+        # Occurrences and Verbatim values are read by the raw extractor, from
+        # the first raw occurrence (empty occurrences raise IndexError, as the
+        # raw shape).
+        if type(value) is Occurrences:
+            value = value[0]
+
+        return raw_extractor({tag: raw_value(value)}, iso_format)
+
+    if description.required:
+        def extractor(record, iso_format=None):
+            value = record.tags[tag]
+            cls = type(value)
+
+            if cls is Subfields:
+                position = value[0].get(subfield)
+                if position is None:
+                    raise KeyError(subfield)
+                value = value[position]
+            elif cls is Occurrences or cls is Verbatim:
+                return repeated(value, iso_format)
+            elif not main:
+                raise KeyError(subfield)
+
+            if transform is None:
+                return value
+
+            return transform(value, iso_format)
+    else:
+        def extractor(record, iso_format=None):
+            value = record.tags.get(tag)
+
+            if value is None:
+                return None
+
+            cls = type(value)
+
+            if cls is Subfields:
+                position = value[0].get(subfield)
+                if position is None:
+                    return None
+                value = value[position]
+            elif cls is Occurrences or cls is Verbatim:
+                return repeated(value, iso_format)
+            elif not main:
+                return None
+
+            if value is None or transform is None:
+                return value
+
+            return transform(value, iso_format)
+
+    return extractor
+
+
+def compile_schema(descriptions, flat=False):
+    """
+    Compile a dict of field descriptions into a dict of extractor functions
+    with the same keys.
+    """
+    return dict((name, compile_field(description, flat=flat))
+                for name, description in descriptions.items())
+
+
+journal = compile_schema(JOURNAL)
+article = compile_schema(ARTICLE)
+citation = compile_schema(CITATION)
+
+flat_journal = compile_schema(JOURNAL, flat=True)
+flat_article = compile_schema(ARTICLE, flat=True)
+flat_citation = compile_schema(CITATION, flat=True)
@@ -1,40 +1,35 @@
 # encoding: utf-8
-import sys
 from functools import wraps
 import warnings
 
-try:  # Keep compatibility with python 2.7
-    from html import unescape
-except ImportError:
-    from HTMLParser import HTMLParser
-
 from . import choices
 from . import tools
+from . import schema
+from .tools import html_decode
 
 allowed_formats = ['iso 639-2', 'iso 639-1', None]
 
-# --------------
-# Py2 compat
-# --------------
-PY2 = sys.version_info[0] == 2
-
-if PY2:
-    html_parser = HTMLParser().unescape
-else:
-    html_parser = unescape
-# --------------
-
+URL_TEMPLATES = {
+    'pdf': u'http://{0}/scielo.php?script=sci_pdf&pid={1}&lng={2}&tlng={2}',
+    'html': u'http://{0}/scielo.php?script=sci_arttext&pid={1}&lng={2}&tlng={2}',
+    'issue': u'http://{0}/scielo.php?script=sci_issuetoc&pid={1}&lng={2}',
+    'journal': u'http://{0}/scielo.php?script=sci_serial&pid={1}&lng={2}'
+}
 
-def html_decode(string):
 
-    try:
-        return html_parser(string)
-    except:
-        return string
+def articles_urls(articles, languages=None):
+    """
+    Retrieves the urls (see Article.urls) of each given article, yielding
+    tuples of (publisher_id, urls).
+    """
+    for article in articles:
+        yield (article.publisher_id, article.urls(languages=languages))
 
 
 class Journal(object):
 
+    _extractors = schema.journal
+
     def __init__(self, data, iso_format=None):
         """
         Create an Journal object given a isis2json type 3 SciELO document.
@@ -129,10 +124,7 @@ class Journal(object):
         This method retrieves the original language of the given article.
         This method deals with the legacy fields (v400).
         """
-        if not 'v400' in self.data:
-            return None
-
-        return self.data['v400'][0]['_']
+        return self._extractors['scielo_issn'](self.data)
 
     def url(self, language='en'):
         """
@@ -155,8 +147,7 @@ class Journal(object):
         This method deals with the legacy fields (441).
         """
 
-        if 'v441' in self.data:
-            return [area['_'] for area in self.data['v441']]
+        return self._extractors['subject_areas'](self.data)
 
     @property
     def wos_subject_areas(self):
@@ -166,8 +157,7 @@ class Journal(object):
         This method deals with the legacy fields (854).
         """
 
-        if 'v854' in self.data:
-            return [area['_'] for area in self.data['v854']]
+        return self._extractors['wos_subject_areas'](self.data)
 
     @property
     def abbreviated_title(self):
@@ -175,8 +165,7 @@ class Journal(object):
         This method retrieves the journal abbreviated title of the given article, if it exists.
         This method deals with the legacy fields (150).
         """
-        if 'v150' in self.data:
-            return self.data['v150'][0]['_']
+        return self._extractors['abbreviated_title'](self.data)
 
     @property
     def wos_citation_indexes(self):
@@ -207,8 +196,7 @@ class Journal(object):
         This method deals with the legacy fields (480).
         """
 
-        if 'v480' in self.data:
-            return self.data['v480'][0]['_']
+        return self._extractors['publisher_name'](self.data)
 
     @property
     def publisher_loc(self):
@@ -218,8 +206,7 @@ class Journal(object):
         This method deals with the legacy fields (490).
         """
 
-        if 'v490' in self.data:
-            return self.data['v490'][0]['_']
+        return self._extractors['publisher_loc'](self.data)
 
     @property
     def title(self):
@@ -229,8 +216,7 @@ class Journal(object):
         This method deals with the legacy fields (100).
         """
 
-        if 'v100' in self.data:
-            return self.data['v100'][0]['_']
+        return self._extractors['title'](self.data)
 
     @property
     def acronym(self):
@@ -240,12 +226,14 @@ class Journal(object):
         This method deals with the legacy fields (68).
         """
 
-        if 'v68' in self.data:
-            return self.data['v68'][0]['_'].lower()
+        return self._extractors['acronym'](self.data)
 
 
 class Article(object):
 
+    _extractors = schema.article
+    _journal_class = Journal
+
     def __init__(self, data, iso_format=None):
         """
         Create an Aricle object given a isis2json type 3 SciELO document.
@@ -265,12 +253,14 @@ class Article(object):
         self.electronic_issn = None
         self._journal = None
         self._citations = None
+        self._scielo_domain = None
+        self._scielo_domain_loaded = False
 
     @property
     def journal(self):
 
         if 'title' in self.data:
-            self._journal = self._journal or Journal(self.data['title'], iso_format=self._iso_format)
+            self._journal = self._journal or self._journal_class(self.data['title'], iso_format=self._iso_format)
 
         return self._journal
 
@@ -320,7 +310,7 @@ class Article(object):
 
         fmt = self._iso_format if not iso_format else iso_format
 
-        return tools.get_language(self.data['article']['v40'][0]['_'], fmt)
+        return self._extractors['original_language'](self.data['article'], fmt)
 
     @property
     def collection_name(self):
@@ -454,7 +444,7 @@ class Article(object):
         This method deals with the legacy fields (65).
         """
 
-        return tools.get_publication_date(self.data['article']['v65'][0]['_'])
+        return self._extractors['publication_date'](self.data['article'])
 
     @property
     def processing_date(self):
@@ -463,7 +453,7 @@ class Article(object):
         This method deals with the legacy fields (91).
         """
 
-        return tools.get_publication_date(self.data['article']['v91'][0]['_'])
+        return self._extractors['processing_date'](self.data['article'])
 
     @property
     def receive_date(self):
@@ -471,9 +461,7 @@ class Article(object):
         This method retrieves the receive date of the given article, if it exist.
         This method deals with the legacy fields (112).
         """
-        if 'v112' in self.data['article']:
-            return tools.get_publication_date(self.data['article']['v112'][0]['_'])
-        return None
+        return self._extractors['receive_date'](self.data['article'])
 
     @property
     def acceptance_date(self):
@@ -481,9 +469,7 @@ class Article(object):
         This method retrieves the acceptance date of the given article, if it exist.
         This method deals with the legacy fields (114).
         """
-        if 'v114' in self.data['article']:
-            return tools.get_publication_date(self.data['article']['v114'][0]['_'])
-        return None
+        return self._extractors['acceptance_date'](self.data['article'])
 
     @property
     def review_date(self):
@@ -491,9 +477,7 @@ class Article(object):
         This method retrieves the review date of the given article, if it exist.
         This method deals with the legacy fields (116).
         """
-        if 'v116' in self.data['article']:
-            return tools.get_publication_date(self.data['article']['v116'][0]['_'])
-        return None
+        return self._extractors['review_date'](self.data['article'])
 
     @property
     def ahead_publication_date(self):
@@ -501,9 +485,7 @@ class Article(object):
         This method retrieves the ahead of print date of the given article, if it exist.
         This method deals with the legacy fields (223).
         """
-        if 'v223' in self.data['article']:
-            return tools.get_publication_date(self.data['article']['v223'][0]['_'])
-        return None
+        return self._extractors['ahead_publication_date'](self.data['article'])
 
     @property
     def contract(self):
@@ -511,8 +493,7 @@ class Article(object):
         This method retrieves the contract of the given article, if it exists.
         This method deals with the legacy fields (60).
         """
-        if 'v60' in self.data['article']:
-            return self.data['article']['v60'][0]['_']
+        return self._extractors['contract'](self.data['article'])
 
     @property
     def project_name(self):
@@ -520,8 +501,7 @@ class Article(object):
         This method retrieves the project name of the given article, if it exists.
         This method deals with the legacy fields (59).
         """
-        if 'v59' in self.data['article']:
-            return self.data['article']['v59'][0]['_']
+        return self._extractors['project_name'](self.data['article'])
 
     @property
     def project_sponsor(self):
@@ -551,8 +531,7 @@ class Article(object):
         This method retrieves the issue volume of the given article, if it exists.
         This method deals with the legacy fields (31).
         """
-        if 'v31' in self.data['article']:
-            return self.data['article']['v31'][0]['_']
+        return self._extractors['volume'](self.data['article'])
 
     @property
     def issue(self):
@@ -560,8 +539,7 @@ class Article(object):
         This method retrieves the issue number of the given article, if it exists.
         This method deals with the legacy fields (32).
         """
-        if 'v32' in self.data['article']:
-            return self.data['article']['v32'][0]['_']
+        return self._extractors['issue'](self.data['article'])
 
     @property
     def supplement_volume(self):
@@ -569,8 +547,7 @@ class Article(object):
         This method retrieves the supplement of volume of the given article, if it exists.
         This method deals with the legacy fields (131).
         """
-        if 'v131' in self.data['article']:
-            return self.data['article']['v131'][0]['_']
+        return self._extractors['supplement_volume'](self.data['article'])
 
     @property
     def supplement_issue(self):
@@ -578,8 +555,7 @@ class Article(object):
         This method retrieves the supplement number of the given article, if it exists.
         This method deals with the legacy fields (132).
         """
-        if 'v132' in self.data['article']:
-            return self.data['article']['v132'][0]['_']
+        return self._extractors['supplement_issue'](self.data['article'])
 
     @property
     def start_page(self):
@@ -587,9 +563,7 @@ class Article(object):
         This method retrieves the star page of the given article, if it exists.
         This method deals with the legacy fields (14).
         """
-        if 'v14' in self.data['article']:
-            if 'f' in self.data['article']['v14'][0]:
-                return self.data['article']['v14'][0]['f']
+        return self._extractors['start_page'](self.data['article'])
 
     @property
     def end_page(self):
@@ -597,9 +571,7 @@ class Article(object):
         This method retrieves the end page of the given article, if it exists.
         This method deals with the legacy fields (14).
         """
-        if 'v14' in self.data['article']:
-            if 'l' in self.data['article']['v14'][0]:
-                return self.data['article']['v14'][0]['l']
+        return self._extractors['end_page'](self.data['article'])
 
     @property
     def doi(self):
@@ -609,8 +581,7 @@ class Article(object):
         if 'doi' in self.data:
             return self.data['doi']
 
-        if 'v237' in self.data['article']:
-            return self.data['article']['v237'][0]['_']
+        return self._extractors['doi'](self.data['article'])
 
     @property
     def publisher_id(self):
@@ -618,7 +589,7 @@ class Article(object):
         This method retrieves the publisher id of the given article, if it exists.
         This method deals with the legacy fields (880).
         """
-        return self.data['article']['v880'][0]['_']
+        return self._extractors['publisher_id'](self.data['article'])
 
     @property
     def journal_abbreviated_title(self):
@@ -637,14 +608,9 @@ class Article(object):
         This method retrieves the document type of the given article, if it exists.
         This method deals with the legacy fields (71).
         """
-        if 'v71' in self.data['article']:
-            article_type_code = self.data['article']['v71'][0]['_']
-            if article_type_code in choices.article_types:
-                return choices.article_types[article_type_code]
-            else:
-                return choices.article_types['nd']
+        article_type_code = self._extractors['document_type_code'](self.data['article'])
 
-        return choices.article_types['nd']
+        return choices.article_types.get(article_type_code, choices.article_types['nd'])
 
     def original_title(self, iso_format=None):
         """
@@ -865,12 +831,22 @@ class Article(object):
         """
         This method retrieves the collection domains of the given article, if it exists.
         This method deals with the legacy fields (69, 690).
+        The domain is resolved once and kept for the lifetime of the object.
         """
 
-        if self.collection_acronym:
+        if not self._scielo_domain_loaded:
+            self._scielo_domain = self._load_scielo_domain()
+            self._scielo_domain_loaded = True
+
+        return self._scielo_domain
+
+    def _load_scielo_domain(self):
+        collection_acronym = self.collection_acronym
+
+        if collection_acronym:
             return choices.collections.get(
-                self.collection_acronym,
-                [u'Undefined: %s' % self.collection_acronym, None]
+                collection_acronym,
+                [u'Undefined: %s' % collection_acronym, None]
             )[1] or None
 
         if 'v690' in self.data['title']:
@@ -878,41 +854,84 @@ class Article(object):
         elif 'v69' in self.data['article']:
             return self.data['article']['v69'][0]['_'].replace('http://', '')
 
+    def _url(self, kind, domain, language):
+        pid = self.publisher_id
+
+        if kind == 'issue':
+            pid = pid[0:18]
+
+        return URL_TEMPLATES[kind].format(domain, pid, language)
+
     def pdf_url(self, language='en'):
         """
         This method retrieves the pdf url of the given article.
         """
         if self.scielo_domain:
-            return "http://{0}/scielo.php?script=sci_pdf&pid={1}&lng={2}&tlng={3}".format(
-                self.scielo_domain,
-                self.publisher_id,
-                language,
-                language
-            )
+            return self._url('pdf', self.scielo_domain, language)
 
     def html_url(self, language='en'):
         """
         This method retrieves the html url of the given article.
         """
         if self.scielo_domain:
-            return "http://{0}/scielo.php?script=sci_arttext&pid={1}&lng={2}&tlng={3}".format(
-                self.scielo_domain,
-                self.publisher_id,
-                language,
-                language
-            )
+            return self._url('html', self.scielo_domain, language)
 
     def issue_url(self, language='en'):
         """
         This method retrieves the issue url of the given article.
         """
         if self.scielo_domain:
-            return "http://{0}/scielo.php?script=sci_issuetoc&pid={1}&lng={2}".format(
-                self.scielo_domain,
-                self.publisher_id[0:18],
-                language
+            return self._url('issue', self.scielo_domain, language)
+
+    def urls(self, languages=None):
+        """
+        This method retrieves the pdf, html, issue and journal urls of the given
+        article for each one of the given languages, if the domain exists.
+        When no languages are given, the fulltext languages of the article are
+        used (see languages method). The journal urls are built with the article
+        domain, and left out when the record has no journal.
+        Ex: {'pdf': {'en': 'http://...'}, 'html': {...}, 'issue': {...}, 'journal': {...}}
+        """
+        domain = self.scielo_domain
+
+        if not domain:
+            return None
+
+        if languages is None:
+            languages = self._fulltext_languages() or ['en']
+
+        pid = self.publisher_id
+        pids = {
+            'pdf': pid,
+            'html': pid,
+            'issue': pid[0:18]
+        }
+
+        if self.journal:
+            pids['journal'] = self.journal.scielo_issn
+
+        urls = {}
+        for kind, template in URL_TEMPLATES.items():
+            if not kind in pids:
+                continue
+
+            urls[kind] = dict(
+                (language, template.format(domain, pids[kind], language))
+                for language in languages
             )
 
+        return urls
+
+    def _fulltext_languages(self):
+        languages = []
+
+        for tag, subfield in (('v740', '_'), ('v601', '_'), ('v720', 'l')):
+            for item in self.data['article'].get(tag, []):
+                if subfield in item and not item[subfield] in languages:
+                    languages.append(item[subfield])
+
+        return languages
+
     def journal_url(self, language='en'):
         """
         This method retrieves the journal url of the given article.
@@ -955,8 +974,7 @@ class Article(object):
         This method retrieves the thesis degree of the given document, If it exists.
         This method deals with the legacy fields (51).
         """
-        if 'v51' in self.data['article']:
-            return self.data['article']['v51'][0]['_']
+        return self._extractors['thesis_degree'](self.data['article'])
 
     @property
     def thesis_organization(self):
@@ -983,18 +1001,58 @@ class Article(object):
     def citations(self):
         """
         This method retrieves a list with all the citation objects of the given article.
+        The citations are created once and kept for the lifetime of the object.
         """
+        if self._citations is None:
+            self._citations = self._load_citations()
+
+        return self._citations
+
+    def _load_citations(self):
         citations = []
         if 'citations' in self.data:
             for citation in self.data['citations']:
-                citations.append(Citation(citation))
+                citations.append(self._create_citation(citation))
 
         if len(citations) > 0:
             return citations
 
+    def _create_citation(self, data):
+        return create_citation(data)
+
+
+def citation_publication_type(data):
+    """
+    Retrieves the publication type of the given raw citation.
+    """
+    if 'v18' in data:
+        if 'v45' in data:
+            return u'thesis'
+        else:
+            return u'book'
+    elif 'v12' in data and 'v30' in data:
+        return u'article'
+    elif 'v53' in data:
+        return u'conference'
+    elif 'v37' in data:
+        return u'link'
+    else:
+        return u'undefined'
+
+
+def create_citation(data):
+    """
+    Create a Citation object specialized in the publication type of the given
+    raw citation (see ArticleCitation, BookCitation, ThesisCitation,
+    ConferenceCitation, LinkCitation and UndefinedCitation).
+    """
+    return CITATION_CLASSES[citation_publication_type(data)](data)
+
 
 class Citation(object):
 
+    _extractors = schema.citation
+
     def __init__(self, data):
         self.data = data
         self.publication_type = self._publication_type()
@@ -1004,19 +1062,39 @@ class Citation(object):
         This method retrieves the publication type of the citation.
         """
 
-        if 'v18' in self.data:
-            if 'v45' in self.data:
-                return u'thesis'
-            else:
-                return u'book'
-        elif 'v12' in self.data and 'v30' in self.data:
-            return u'article'
-        elif 'v53' in self.data:
-            return u'conference'
-        elif 'v37' in self.data:
-            return u'link'
-        else:
-            return u'undefined'
+        return citation_publication_type(self.data)
+
+    def _authors(self, tag):
+        authors = []
+        if tag in self.data:
+            for author in self.data[tag]:
+                authordict = {}
+                if 's' in author:
+                    authordict['surname'] = author['s']
+                if 'n' in author:
+                    authordict['given_names'] = author['n']
+                if 's' in author or 'n' in author:
+                    authors.append(authordict)
+
+        if len(authors) > 0:
+            return authors
+
+    def _first_values(self, tag):
+        """
+        Legacy behavior of the multivalued institution, sponsor and editor
+        accessors: the first occurrence is repeated for each occurrence.
+        """
+        if tag in self.data:
+            values = [self.data[tag][0]['_'] for item in self.data[tag]]
+            if len(values) > 0:
+                return values
+
+    def _date(self, tag=None):
+        if tag is not None and tag in self.data:
+            return tools.get_publication_date(self.data[tag][0]['_'])
+
+        if 'v65' in self.data:
+            return tools.get_publication_date(self.data['v65'][0]['_'])
 
     @property
     def start_page(self):
@@ -1081,8 +1159,7 @@ class Citation(object):
         This method retrieves the index number of the citation. The
         index number represents the original number given in the article.
         """
-        if 'v701' in self.data:
-            return int(self.data['v701'][0]['_'])
+        return self._extractors['index_number'](self.data)
 
     @property
     def source(self):
@@ -1091,27 +1168,27 @@ class Citation(object):
         Journal: Journal of Microbiology
         Book: Alice's Adventures in Wonderland
         """
-        if self.publication_type == u'article' and 'v30' in self.data:
-            return self.data['v30'][0]['_']
+        if self.publication_type == u'article':
+            return self._extractors['journal_title'](self.data)
 
-        if self.publication_type == u'book' and 'v18' in self.data:
-            return self.data['v18'][0]['_']
+        if self.publication_type == u'book':
+            return self._extractors['book_title'](self.data)
 
     @property
     def chapter_title(self):
         """
         If it is a book citation, this method retrieves a chapter title, if it exists.
         """
-        if self.publication_type == u'book' and 'v12' in self.data:
-            return html_decode(self.data['v12'][0]['_'])
+        if self.publication_type == u'book':
+            return self._extractors['chapter_title'](self.data)
 
     @property
     def article_title(self):
         """
         If it is an article citation, this method retrieves the article title, if it exists.
         """
-        if self.publication_type == u'article' and 'v12' in self.data:
-            return html_decode(self.data['v12'][0]['_'])
+        if self.publication_type == u'article':
+            return self._extractors['article_title'](self.data)
 
     @property
     def thesis_title(self):
@@ -1119,8 +1196,8 @@ class Citation(object):
         If it is a thesis citation, this method retrieves the thesis title, if it exists.
         """
 
-        if self.publication_type == u'thesis' and 'v18' in self.data:
-            return html_decode(self.data['v18'][0]['_'])
+        if self.publication_type == u'thesis':
+            return self._extractors['thesis_title'](self.data)
 
     @property
     def conference_title(self):
@@ -1128,8 +1205,8 @@ class Citation(object):
         If it is a conference citation, this method retrieves the conference title, if it exists.
         """
 
-        if self.publication_type == u'conference' and 'v53' in self.data:
-            return html_decode(self.data['v53'][0]['_'])
+        if self.publication_type == u'conference':
+            return self._extractors['conference_title'](self.data)
 
     @property
     def link_title(self):
@@ -1137,8 +1214,8 @@ class Citation(object):
         If it is a link citation, this method retrieves the link title, if it exists.
         """
 
-        if self.publication_type == u'link' and 'v12' in self.data:
-            return self.data['v12'][0]['_']
+        if self.publication_type == u'link':
+            return self._extractors['link_title'](self.data)
 
     def title(self):
         """
@@ -1147,8 +1224,9 @@ class Citation(object):
         type_titles = ['article_title', 'thesis_title', 'conference_title', 'link_title']
 
         for title in type_titles:
-            if getattr(self, title):
-                return getattr(self, title)
+            value = getattr(self, title)
+            if value:
+                return value
 
     @property
     def conference_sponsor(self):
@@ -1157,8 +1235,8 @@ class Citation(object):
         The conference sponsor is presented like it is in the citation.
         """
 
-        if self.publication_type == u'conference' and 'v52' in self.data:
-            return self.data['v52'][0]['_']
+        if self.publication_type == u'conference':
+            return self._extractors['conference_sponsor'](self.data)
 
     @property
     def link(self):
@@ -1166,8 +1244,7 @@ class Citation(object):
         This method retrieves a link, if it is exists.
         """
 
-        if 'v37' in self.data:
-            return self.data['v37'][0]['_']
+        return self._extractors['link'](self.data)
 
     @property
     def date(self):
@@ -1175,14 +1252,13 @@ class Citation(object):
         This method retrieves the citation date, if it is exists.
         """
 
-        if self.publication_type == u'link' and 'v110' in self.data:
-            return tools.get_publication_date(self.data['v110'][0]['_'])
+        if self.publication_type == u'link':
+            return self._date('v110')
 
-        if self.publication_type == u'thesis' and 'v45' in self.data:
-            return tools.get_publication_date(self.data['v45'][0]['_'])
+        if self.publication_type == u'thesis':
+            return self._date('v45')
 
-        if 'v65' in self.data:
-            return tools.get_publication_date(self.data['v65'][0]['_'])
+        return self._date()
 
     @property
     def edition(self):
@@ -1192,8 +1268,7 @@ class Citation(object):
         """
 
         if self.publication_type in [u'conference', u'book']:
-            if 'v63' in self.data:
-                return self.data['v63'][0]['_']
+            return self._extractors['edition'](self.data)
 
     @property
     def first_page(self):
@@ -1231,14 +1306,8 @@ class Citation(object):
         This method retrieves the institutions in the given citation. The
         citation must be an article or book citation, if it exists.
         """
-        institutions = []
-        if self.publication_type in [u'article', u'book'] and 'v11' in self.data:
-            if 'v11' in self.data:
-                for institution in self.data['v11']:
-                    institutions.append(self.data['v11'][0]['_'])
-
-        if len(institutions) > 0:
-            return institutions
+        if self.publication_type in [u'article', u'book']:
+            return self._first_values('v11')
 
     @property
     def monographic_institution(self):
@@ -1246,27 +1315,15 @@ class Citation(object):
         This method retrieves the institutions in the given citation. The
         citation must be a book citation, if it exists.
         """
-        institutions = []
-        if self.publication_type == u'book' and 'v17' in self.data:
-            if 'v17' in self.data:
-                for institution in self.data['v17']:
-                    institutions.append(self.data['v17'][0]['_'])
-
-        if len(institutions) > 0:
-            return institutions
+        if self.publication_type == u'book':
+            return self._first_values('v17')
 
     @property
     def sponsor(self):
         """
         This method retrieves the sponsors in the given citation, if it exists.
         """
-        sponsors = []
-        if 'v58' in self.data:
-            for sponsor in self.data['v58']:
-                sponsors.append(self.data['v58'][0]['_'])
-
-        if len(sponsors) > 0:
-            return sponsors
+        return self._first_values('v58')
 
     @property
     def editor(self):
@@ -1274,13 +1331,7 @@ class Citation(object):
         This method retrieves the editors in the given citation, if it exists.
         """
 
-        editors = []
-        if 'v29' in self.data:
-            for editor in self.data['v29']:
-                editors.append(self.data['v29'][0]['_'])
-
-        if len(editors) > 0:
-            return editors
+        return self._first_values('v29')
 
     @property
     def thesis_institution(self):
@@ -1289,13 +1340,7 @@ class Citation(object):
         it exists.
         """
 
-        institutions = []
-        if 'v50' in self.data:
-            for institution in self.data['v50']:
-                institutions.append(self.data['v50'][0]['_'])
-
-        if len(institutions) > 0:
-            return institutions
+        return self._first_values('v50')
 
     @property
     def issn(self):
@@ -1304,8 +1349,8 @@ class Citation(object):
         must be an article citation.
         """
 
-        if self.publication_type == u'article' and 'v35' in self.data:
-            return self.data['v35'][0]['_']
+        if self.publication_type == u'article':
+            return self._extractors['issn'](self.data)
 
     @property
     def isbn(self):
@@ -1314,8 +1359,8 @@ class Citation(object):
         be a book citation.
         """
 
-        if self.publication_type == u'book' and 'v69' in self.data:
-            return self.data['v69'][0]['_']
+        if self.publication_type == u'book':
+            return self._extractors['isbn'](self.data)
 
     @property
     def volume(self):
@@ -1325,8 +1370,7 @@ class Citation(object):
         """
 
         if self.publication_type in [u'article', u'book']:
-            if 'v31' in self.data:
-                return self.data['v31'][0]['_']
+            return self._extractors['volume'](self.data)
 
     @property
     def issue(self):
@@ -1335,8 +1379,8 @@ class Citation(object):
         citation must be an article citation.
         """
 
-        if self.publication_type in u'article' and 'v32' in self.data:
-            return self.data['v32'][0]['_']
+        if self.publication_type in u'article':
+            return self._extractors['issue'](self.data)
 
     @property
     def issue_title(self):
@@ -1345,7 +1389,11 @@ class Citation(object):
         be an article citation.
         """
 
-        if self.publication_type in u'article' and 'v33' in self.data:
+        if self.publication_type in u'article':
+            return self._issue_title()
+
+    def _issue_title(self):
+        if 'v33' in self.data:
             return html_decode(html_decode(self.data['v33'][0]['_']))
 
     @property
@@ -1355,8 +1403,8 @@ class Citation(object):
         be an article citation.
         """
 
-        if self.publication_type in u'article' and 'v34' in self.data:
-            return html_decode(self.data['v34'][0]['_'])
+        if self.publication_type in u'article':
+            return self._extractors['issue_part'](self.data)
 
     @property
     def doi(self):
@@ -1364,8 +1412,7 @@ class Citation(object):
         This method retrieves the citation DOI number, if it exists.
         """
 
-        if 'v237' in self.data:
-            return self.data['v237'][0]['_']
+        return self._extractors['doi'](self.data)
 
     @property
     def authors(self):
@@ -1374,19 +1421,8 @@ class Citation(object):
         may correspond to an article, book analytic, link or thesis.
         """
         docs = [u'article', u'book', u'link', u'thesis']
-        authors = []
-        if self.publication_type in docs and 'v10' in self.data:
-            for author in self.data['v10']:
-                authordict = {}
-                if 's' in author:
-                    authordict['surname'] = author['s']
-                if 'n' in author:
-                    authordict['given_names'] = author['n']
-                if 's' in author or 'n' in author:
-                    authors.append(authordict)
-
-        if len(authors) > 0:
-            return authors
+        if self.publication_type in docs:
+            return self._authors('v10')
 
     @property
     def monographic_authors(self):
@@ -1395,19 +1431,8 @@ class Citation(object):
         correspond to a book monography citation.
         """
         docs = [u'book', u'thesis']
-        authors = []
-        if self.publication_type in docs and 'v16' in self.data:
-            for author in self.data['v16']:
-                authordict = {}
-                if 's' in author:
-                    authordict['surname'] = author['s']
-                if 'n' in author:
-                    authordict['given_names'] = author['n']
-                if 's' in author or 'n' in author:
-                    authors.append(authordict)
-
-        if len(authors) > 0:
-            return authors
+        if self.publication_type in docs:
+            return self._authors('v16')
 
     @property
     def serie(self):
@@ -1416,16 +1441,15 @@ class Citation(object):
         conference citation.
         """
         docs = [u'conference', u'book', u'article']
-        if self.publication_type in docs and 'v25' in self.data:
-            return html_decode(self.data['v25'][0]['_'])
+        if self.publication_type in docs:
+            return self._extractors['serie'](self.data)
 
     @property
     def publisher(self):
         """
         This method retrieves the publisher name, if it exists.
         """
-        if 'v62' in self.data:
-            return self.data['v62'][0]['_']
+        return self._extractors['publisher'](self.data)
 
     @property
     def publisher_address(self):
@@ -1443,3 +1467,208 @@ class Citation(object):
 
         if len(address) > 0:
             return"; ".join(address)
+
+
+# ----------------------------------------------------------------------------
+# Citation classes specialized by publication type. The accessors that depend
+# on the publication type are resolved when the class is defined, instead of
+# checking the type at each access.
+# ----------------------------------------------------------------------------
+
+_not_applicable = property(lambda self: None)
+
+
+class _Field(property):
+    """
+    Accessor reading a schema field of the citation, the extractor is bound
+    when the class is defined. The field name is kept to bind the accessor to
+    other extractors (see xylose.flat).
+    """
+
+    def __init__(self, name, extractors=schema.citation):
+        extractor = extractors[name]
+        property.__init__(self, lambda self: extractor(self.data))
+        self.name = name
+
+
+def _date(tag=None):
+    return property(lambda self: self._date(tag))
+
+
+def _first_values(tag):
+    return property(lambda self: self._first_values(tag))
+
+
+def _authors(tag):
+    return property(lambda self: self._authors(tag))
+
+
+class _TypedCitation(Citation):
+    publication_type = u'undefined'
+
+    def __init__(self, data):
+        self.data = data
+
+    source = _not_applicable
+    chapter_title = _not_applicable
+    article_title = _not_applicable
+    thesis_title = _not_applicable
+    conference_title = _not_applicable
+    link_title = _not_applicable
+    conference_sponsor = _not_applicable
+    date = _date()
+    edition = _not_applicable
+    analytic_institution = _not_applicable
+    monographic_institution = _not_applicable
+    issn = _not_applicable
+    isbn = _not_applicable
+    volume = _not_applicable
+    issue = _not_applicable
+    issue_title = _not_applicable
+    issue_part = _not_applicable
+    authors = _not_applicable
+    monographic_authors = _not_applicable
+    serie = _not_applicable
+
+    def title(self):
+        return None
+
+
+class ArticleCitation(_TypedCitation):
+    publication_type = u'article'
+
+    source = _Field('journal_title')
+    article_title = _Field('article_title')
+    analytic_institution = _first_values('v11')
+    issn = _Field('issn')
+    volume = _Field('volume')
+    issue = _Field('issue')
+    issue_title = property(Citation._issue_title)
+    issue_part = _Field('issue_part')
+    authors = _authors('v10')
+    serie = _Field('serie')
+
+    def title(self):
+        return self.article_title or None
+
+
+class BookCitation(_TypedCitation):
+    publication_type = u'book'
+
+    source = _Field('book_title')
+    chapter_title = _Field('chapter_title')
+    edition = _Field('edition')
+    analytic_institution = _first_values('v11')
+    monographic_institution = _first_values('v17')
+    isbn = _Field('isbn')
+    volume = _Field('volume')
+    authors = _authors('v10')
+    monographic_authors = _authors('v16')
+    serie = _Field('serie')
+
+
+class ThesisCitation(_TypedCitation):
+    publication_type = u'thesis'
+
+    thesis_title = _Field('thesis_title')
+    date = _date('v45')
+    authors = _authors('v10')
+    monographic_authors = _authors('v16')
+
+    def title(self):
+        return self.thesis_title or None
+
+
+class ConferenceCitation(_TypedCitation):
+    publication_type = u'conference'
+
+    conference_title = _Field('conference_title')
+    conference_sponsor = _Field('conference_sponsor')
+    edition = _Field('edition')
+    serie = _Field('serie')
+
+    def title(self):
+        return self.conference_title or None
+
+
+class LinkCitation(_TypedCitation):
+    publication_type = u'link'
+
+    link_title = _Field('link_title')
+    date = _date('v110')
+    authors = _authors('v10')
+
+    def title(self):
+        return self.link_title or None
+
+
+class UndefinedCitation(_TypedCitation):
+    publication_type = u'undefined'
+
+
+CITATION_CLASSES = {
+    u'article': ArticleCitation,
+    u'book': BookCitation,
+    u'thesis': ThesisCitation,
+    u'conference': ConferenceCitation,
+    u'link': LinkCitation,
+    u'undefined': UndefinedCitation
+}
+
+
+# ----------------------------------------------------------------------------
+# Journals, articles and citations of flattened records (see xylose.flat). The
+# schema accessors read the compact values with the flat extractors, every
+# other accessor reads the raw shape exposed by the flattened sections. They
+# trade speed for memory: use them to hold many records, not to export faster.
+# ----------------------------------------------------------------------------
+
+class FlatJournal(Journal):
+    """
+    Journal of a flattened title section.
+    """
+    _extractors = schema.flat_journal
+
+
+class FlatArticle(Article):
+    """
+    Article of a flattened record (see xylose.flat.flatten).
+    """
+    _extractors = schema.flat_article
+    _journal_class = FlatJournal
+
+    def _create_citation(self, data):
+        return create_flat_citation(data)
+
+
+def _flat_citation_class(cls):
+    """
+    Create a subclass of the given citation class reading flattened citations,
+    with the schema accessors bound to the flat extractors.
+    """
+    attributes = {}
+    for base in reversed(cls.__mro__):
+        for name, value in vars(base).items():
+            if isinstance(value, _Field):
+                attributes[name] = _Field(value.name, schema.flat_citation)
+            else:
+                attributes.pop(name, None)
+
+    attributes['_extractors'] = schema.flat_citation
+    attributes['__doc__'] = '%s of a flattened citation.' % cls.__name__
+
+    return type('Flat' + cls.__name__, (cls,), attributes)
+
+
+FLAT_CITATION_CLASSES = dict(
+    (publication_type, _flat_citation_class(cls))
+    for publication_type, cls in CITATION_CLASSES.items()
+)
+
+
+def create_flat_citation(data):
+    """
+    Create a Citation object, specialized in the publication type, of the
+    given flattened citation (see xylose.flat.flatten_section).
+    """
+    return FLAT_CITATION_CLASSES[citation_publication_type(data)](data)
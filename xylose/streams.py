@@ -0,0 +1,216 @@
+# encoding: utf-8
+"""
+Streaming JSON lines reading and writing.
+
+The JSON backend is the fastest one installed: orjson, ujson or the standard
+library json module. Files ending with .gz or .bz2 are compressed or
+decompressed with gzip or bzip2.
+"""
+from collections import namedtuple
+import bz2
+import gzip
+import json
+import sys
+
+from .extraction import Exporter, FieldError
+from .interning import InternTable
+
+Backend = namedtuple('Backend', ['name', 'dumps', 'loads'])
+
+BACKENDS = ('orjson', 'ujson', 'json')
+
+try:  # Keep compatibility with python 2.7
+    string_types = basestring
+except NameError:
+    string_types = str
+
+
+def _default(value):
+    # FieldError values (see xylose.extraction) are written as nulls.
+    if isinstance(value, FieldError):
+        return None
+
+    raise TypeError('Object of type %s is not JSON serializable' % type(value).__name__)
+
+
+def _orjson():
+    import orjson
+
+    def dumps(value):
+        return orjson.dumps(value, default=_default)
+
+    return Backend('orjson', dumps, orjson.loads)
+
+
+def _ujson():
+    import ujson
+
+    def dumps(value):
+        return ujson.dumps(value, ensure_ascii=False, default=_default).encode('utf-8')
+
+    return Backend('ujson', dumps, ujson.loads)
+
+
+def _json():
+
+    def dumps(value):
+        return json.dumps(
+            value, ensure_ascii=False, separators=(',', ':'), default=_default
+        ).encode('utf-8')
+
+    def loads(value):
+        if isinstance(value, bytes):
+            value = value.decode('utf-8')
+        return json.loads(value)
+
+    return Backend('json', dumps, loads)
+
+_LOADERS = {'orjson': _orjson, 'ujson': _ujson, 'json': _json}
+
+
+def get_backend(name=None):
+    """
+    Retrieve the JSON backend with the given name, or the fastest installed
+    one when name is None.
+    """
+    if name is not None:
+        if not name in _LOADERS:
+            raise ValueError('JSON backend not allowed ({0})'.format(name))
+        return _LOADERS[name]()
+
+    for candidate in BACKENDS:
+        try:
+            return _LOADERS[candidate]()
+        except ImportError:
+            continue
+
+
+def open_stream(target, mode):
+    """
+    Retrieve a tuple of (binary file object, owned) for the given path, file
+    object or '-' (standard input or output). Paths ending with .gz or .bz2
+    are compressed.
+    """
+    if target == '-':
+        stream = sys.stdin if 'r' in mode else sys.stdout
+        return getattr(stream, 'buffer', stream), False
+
+    if not isinstance(target, string_types):
+        return target, False
+
+    if target.endswith('.gz'):
+        return gzip.open(target, mode), True
+
+    if target.endswith('.bz2'):
+        return bz2.BZ2File(target, mode), True
+
+    return open(target, mode), True
+
+
+class JSONLinesWriter(object):
+
+    def __init__(self, target, backend=None, buffer_size=1 << 20):
+        """
+        Create a writer for the given path, binary file object or '-'.
+
+        Keyword arguments:
+        backend -- JSON backend name (see BACKENDS), the fastest when None.
+        buffer_size -- bytes kept in memory before each write.
+        """
+        self.backend = get_backend(backend)
+        self.buffer_size = buffer_size
+        self.count = 0
+        self.bytes_written = 0
+        self._file, self._owned = open_stream(target, 'wb')
+        self._buffer = []
+        self._buffered = 0
+
+    def write(self, record):
+        self.write_encoded(self.backend.dumps(record))
+
+    def write_encoded(self, record):
+        """
+        Write a record already encoded as JSON bytes.
+        """
+        line = record + b'\n'
+        self._buffer.append(line)
+        self._buffered += len(line)
+        self.count += 1
+
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        if self._buffer:
+            self._file.write(b''.join(self._buffer))
+            self.bytes_written += self._buffered
+            self._buffer = []
+            self._buffered = 0
+
+    def close(self):
+        self.flush()
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_jsonlines(source, backend=None, intern=None, where=None):
+    """
+    Yield the records of the given JSON lines path, binary file object or '-'.
+    Blank lines are skipped.
+
+    Keyword arguments:
+    intern -- True or a xylose.interning.InternTable to intern the repeated
+    strings of the records.
+    where -- a xylose.filters.Filter, only the matching records are yielded
+    and the lines that can not match are not parsed.
+    """
+    loads = get_backend(backend).loads
+
+    if intern is True:
+        intern = InternTable()
+    elif intern is False:
+        intern = None
+
+    stream, owned = open_stream(source, 'rb')
+
+    try:
+        for line in stream:
+            if not line.strip():
+                continue
+
+            if where is not None and not where.may_match(line):
+                continue
+
+            record = loads(line)
+            if where is not None and not where.match(record):
+                continue
+
+            yield record if intern is None else intern.record(record)
+    finally:
+        if owned:
+            stream.close()
+
+
+def write_articles(articles, target, exporter=None, backend=None, buffer_size=1 << 20):
+    """
+    Write the normalized articles (see xylose.extraction.Exporter) to the
+    given target as JSON lines, retrieving the number of written records.
+    """
+    exporter = exporter or Exporter()
+
+    with JSONLinesWriter(target, backend=backend, buffer_size=buffer_size) as writer:
+        writer.write_many(exporter.export_many(articles))
+
+    return writer.count
@@ -0,0 +1,199 @@
+# encoding: utf-8
+"""
+Arrow record batches and pandas DataFrames built from streams of articles.
+
+Articles (ARTICLE_COLUMNS) and their citations (CITATION_COLUMNS) are converted
+column by column in fixed size chunks, with a stable schema: every chunk has
+the same columns and types, missing values and accessors raising exceptions
+are stored as nulls.
+
+pyarrow and pandas are optional dependencies, each is required only by the
+functions producing its objects.
+"""
+from itertools import islice
+
+from .extraction import Extractor, null_values
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+
+def _count_citations(data):
+    return len(data.get('citations') or [])
+
+
+# (column, field, arrow type name). The fields are names of the extraction
+# field lists, journal fields of articles are prefixed with 'journal.'. The
+# citations are counted on the raw record (data), without creating Citation
+# objects.
+ARTICLE_COLUMNS = [
+    ('publisher_id', 'publisher_id', 'string'),
+    ('collection', 'collection_acronym', 'string'),
+    ('issn', 'journal.scielo_issn', 'string'),
+    ('journal_title', 'journal.title', 'string'),
+    ('document_type', 'document_type', 'string'),
+    ('doi', 'doi', 'string'),
+    ('original_language', 'original_language', 'string'),
+    ('original_title', 'original_title', 'string'),
+    ('publication_date', 'publication_date', 'string'),
+    ('processing_date', 'processing_date', 'string'),
+    ('volume', 'volume', 'string'),
+    ('issue', 'issue', 'string'),
+    ('supplement_volume', 'supplement_volume', 'string'),
+    ('supplement_issue', 'supplement_issue', 'string'),
+    ('start_page', 'start_page', 'string'),
+    ('end_page', 'end_page', 'string'),
+    ('citations', 'data', 'int32')
+]
+
+CITATION_COLUMNS = [
+    ('index_number', 'index_number', 'int32'),
+    ('publication_type', 'publication_type', 'string'),
+    ('source', 'source', 'string'),
+    ('title', 'title', 'string'),
+    ('date', 'date', 'string'),
+    ('volume', 'volume', 'string'),
+    ('issue', 'issue', 'string'),
+    ('start_page', 'start_page', 'string'),
+    ('end_page', 'end_page', 'string'),
+    ('issn', 'issn', 'string'),
+    ('isbn', 'isbn', 'string'),
+    ('doi', 'doi', 'string'),
+    ('link', 'link', 'string'),
+    ('publisher', 'publisher', 'string')
+]
+
+# column: function converting the extracted field value
+_CONVERTERS = {
+    'citations': _count_citations
+}
+
+
+def _require(module, name):
+    if module is None:
+        raise ImportError('%s is required for this function' % name)
+
+
+def schema(columns):
+    """
+    Retrieve the Arrow schema of the given columns.
+    """
+    _require(pyarrow, 'pyarrow')
+
+    return pyarrow.schema([
+        (name, getattr(pyarrow, type_name)()) for name, getter, type_name in columns
+    ])
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _columns(documents, columns):
+    """
+    Retrieve a list with the values of each column for the given documents.
+    """
+    extractor = Extractor([field for name, field, type_name in columns])
+    extracted = extractor.extract_columns(documents)
+
+    values = []
+    for name, field, type_name in columns:
+        column = extracted[field]
+        if extractor.counters[field]:
+            column = null_values(column)
+        if name in _CONVERTERS:
+            column = [_CONVERTERS[name](value) for value in column]
+        values.append(column)
+
+    return values
+
+
+def _citations(articles):
+    """
+    Yield the citations of the given articles, keeping the publisher id of the
+    citing article.
+    """
+    for article in articles:
+        try:
+            publisher_id = article.publisher_id
+        except KeyError:
+            publisher_id = None
+
+        for citation in article.citations or []:
+            yield publisher_id, citation
+
+
+def column_chunks(articles, chunk_size=10000, citations=False):
+    """
+    Yield tuples of (column names, column values) for each chunk of the given
+    articles, or of their citations when citations is True. Citations chunks
+    have the publisher id of the citing article in the first column.
+    """
+    if not citations:
+        names = [name for name, getter, type_name in ARTICLE_COLUMNS]
+        for chunk in _chunks(articles, chunk_size):
+            yield names, _columns(chunk, ARTICLE_COLUMNS)
+        return
+
+    names = ['article_publisher_id'] + [name for name, getter, type_name in CITATION_COLUMNS]
+    for chunk in _chunks(_citations(articles), chunk_size):
+        yield names, [[item[0] for item in chunk]] + _columns(
+            [item[1] for item in chunk], CITATION_COLUMNS)
+
+
+def _schema(citations):
+    if not citations:
+        return schema(ARTICLE_COLUMNS)
+
+    return schema([('article_publisher_id', None, 'string')] + CITATION_COLUMNS)
+
+
+def record_batches(articles, chunk_size=10000, citations=False):
+    """
+    Yield Arrow record batches with the given articles (or their citations),
+    chunk_size rows each, the last one may be smaller.
+    """
+    batch_schema = _schema(citations)
+
+    for names, values in column_chunks(articles, chunk_size, citations):
+        arrays = [
+            pyarrow.array(column, type=field.type)
+            for column, field in zip(values, batch_schema)
+        ]
+        yield pyarrow.RecordBatch.from_arrays(arrays, schema=batch_schema)
+
+
+def table(articles, chunk_size=10000, citations=False):
+    """
+    Retrieve an Arrow table with the given articles (or their citations).
+    """
+    return pyarrow.Table.from_batches(
+        record_batches(articles, chunk_size, citations), schema=_schema(citations))
+
+
+def data_frames(articles, chunk_size=10000, citations=False):
+    """
+    Yield pandas DataFrames with the given articles (or their citations),
+    chunk_size rows each. Arrow is used for the conversion when installed.
+    """
+    _require(pandas, 'pandas')
+
+    if pyarrow is not None:
+        for batch in record_batches(articles, chunk_size, citations):
+            yield batch.to_pandas()
+        return
+
+    for names, values in column_chunks(articles, chunk_size, citations):
+        yield pandas.DataFrame(dict(zip(names, values)), columns=names)
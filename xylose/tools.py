@@ -1,5 +1,41 @@
+import sys
+
 from . import choices
 
+# --------------
+# Py2 compat
+# --------------
+PY2 = sys.version_info[0] == 2
+# --------------
+
+html_parser = None
+
+
+def _load_html_parser():
+    """
+    Load the html unescape function on first use, the html module (and its
+    entities table) is costly to import.
+    """
+    global html_parser
+
+    if PY2:
+        from HTMLParser import HTMLParser
+        html_parser = HTMLParser().unescape
+    else:
+        from html import unescape
+        html_parser = unescape
+
+    return html_parser
+
+
+def html_decode(string):
+
+    try:
+        return (html_parser or _load_html_parser())(string)
+    except:
+        return string
+
+
 def get_language(language, iso_format):
     if iso_format == u'iso 639-1':
         if language in choices.ISO639_1:
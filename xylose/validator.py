@@ -0,0 +1,146 @@
+# encoding: utf-8
+"""
+Fast validation of raw ISIS2JSON records.
+
+The checks are derived from the field descriptions in xylose.schema, so a
+record accepted here does not make the Article, Journal or Citation accessors
+raise KeyError for the described fields. Records are validated as plain dicts,
+no xylose object is created.
+
+Errors are reported as compact strings: '<section>.<tag>:<code>', ex:
+'article.v880:missing'. The section of a citation includes its position in
+the citations list, ex: 'citations.3.v30:not-list'.
+"""
+from multiprocessing import Pool
+
+from . import schema
+
+MISSING = 'missing'
+NOT_LIST = 'not-list'
+EMPTY = 'empty'
+MISSING_SUBFIELD = 'missing-subfield'
+NOT_DICT = 'not-dict'
+
+
+def _plan(descriptions):
+    """
+    Group the field descriptions by tag, producing tuples of
+    (tag, required subfields, required).
+    """
+    tags = {}
+    for description in descriptions.values():
+        subfields, required = tags.get(description.tag, (set(), False))
+        if description.required:
+            subfields = subfields | set([description.subfield])
+        tags[description.tag] = (subfields, required or description.required)
+
+    return sorted((tag, tuple(sorted(subfields)), required)
+                  for tag, (subfields, required) in tags.items())
+
+PLANS = {
+    'article': _plan(schema.ARTICLE),
+    'title': _plan(schema.JOURNAL),
+    'citations': _plan(schema.CITATION)
+}
+
+
+def _validate_section(section, record, plan, errors):
+    for tag, subfields, required in plan:
+        if not tag in record:
+            if required:
+                errors.append('%s.%s:%s' % (section, tag, MISSING))
+            continue
+
+        occurrences = record[tag]
+
+        if not isinstance(occurrences, list):
+            errors.append('%s.%s:%s' % (section, tag, NOT_LIST))
+            continue
+
+        if len(occurrences) == 0:
+            errors.append('%s.%s:%s' % (section, tag, EMPTY))
+            continue
+
+        if not isinstance(occurrences[0], dict):
+            errors.append('%s.%s:%s' % (section, tag, NOT_DICT))
+            continue
+
+        for subfield in subfields:
+            if not subfield in occurrences[0]:
+                errors.append('%s.%s:%s' % (section, tag, MISSING_SUBFIELD))
+
+
+def validate(data):
+    """
+    Validate a raw article record (the document with the article, title and
+    citations sections), retrieving a list of errors. An empty list means a
+    valid record.
+    """
+    errors = []
+
+    if not isinstance(data, dict):
+        return [':%s' % NOT_DICT]
+
+    for section in ('article', 'title'):
+        if not section in data:
+            errors.append('%s:%s' % (section, MISSING))
+        elif not isinstance(data[section], dict):
+            errors.append('%s:%s' % (section, NOT_DICT))
+        else:
+            _validate_section(section, data[section], PLANS[section], errors)
+
+    if 'citations' in data:
+        if not isinstance(data['citations'], list):
+            errors.append('citations:%s' % NOT_LIST)
+        else:
+            for position, citation in enumerate(data['citations']):
+                if not isinstance(citation, dict):
+                    errors.append('citations.%d:%s' % (position, NOT_DICT))
+                else:
+                    _validate_section('citations.%d' % position, citation, PLANS['citations'], errors)
+
+    return errors
+
+
+def _publisher_id(data):
+    try:
+        return data['article']['v880'][0]['_']
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def _report(item):
+    position, data = item
+    errors = validate(data)
+
+    return (position, _publisher_id(data), errors)
+
+
+def validate_records(records, processes=None, chunksize=500, only_invalid=True):
+    """
+    Validate a stream of raw article records, yielding tuples of
+    (position, publisher_id, errors) in the same order of the records.
+
+    Keyword arguments:
+    processes -- number of worker processes, the records are validated in the
+    current process when it is None or 1.
+    chunksize -- number of records sent to each worker at once.
+    only_invalid -- yield only the records with errors.
+    """
+    items = enumerate(records)
+
+    if processes is None or processes <= 1:
+        reports = (_report(item) for item in items)
+        for report in reports:
+            if report[2] or not only_invalid:
+                yield report
+        return
+
+    pool = Pool(processes)
+    try:
+        for report in pool.imap(_report, items, chunksize):
+            if report[2] or not only_invalid:
+                yield report
+    finally:
+        pool.close()
+        pool.join()